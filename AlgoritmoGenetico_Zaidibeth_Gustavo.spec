@@ -43,3 +43,45 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+
+
+# Versión de consola sin interfaz gráfica (cli.py): se excluyen las bibliotecas de gráficas e
+# interfaz, que cli.py sólo importa con --plot, para un ejecutable más liviano y de arranque rápido.
+# pyarrow se incluye: cli.py lo importa (de forma diferida) para --trace.
+cli_excludes = ['matplotlib', 'mpl_toolkits', 'plotly', 'pandas', 'streamlit', 'tkinter', 'PIL']
+
+cli_a = Analysis(
+    ['cli.py'],
+    pathex=[],
+    binaries=binaries,
+    datas=datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=cli_excludes,
+    noarchive=False,
+    optimize=0,
+)
+cli_pyz = PYZ(cli_a.pure)
+
+cli_exe = EXE(
+    cli_pyz,
+    cli_a.scripts,
+    cli_a.binaries,
+    cli_a.datas,
+    [],
+    name='AlgoritmoGenetico_CLI',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
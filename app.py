@@ -1,13 +1,11 @@
 import streamlit as st
-import numpy as np
-import random
 import pandas as pd
-from deap import tools, algorithms
 
 import config.config as config
-import modules.ga as ga
+import modules.context as context
 import modules.graphics as graphics
-import modules.functions as functions
+import modules.jobs as jobs
+import modules.profiling as profiling
 
 
 st.set_page_config(page_title="Optimización Genética", layout="wide")
@@ -17,38 +15,24 @@ st.markdown("Ejecución y Visualización de Algoritmos Genéticos")
 if 'selected_problem_index' not in st.session_state:
     st.session_state.selected_problem_index = 1
 
+# El problema elegido vive en la sesión de cada usuario, no en el módulo config compartido.
+if 'problem_id' not in st.session_state:
+    st.session_state.problem_id = config.PROBLEM_ID
+
 
 def update_problem():
     problem_name = st.session_state.problem_selector
     if "Schwefel" in problem_name:
-        config.PROBLEM_ID = 1
+        st.session_state.problem_id = 1
     else:
-        config.PROBLEM_ID = 2
-
-
-@st.cache_data(show_spinner=False)
-def run_genetic_algorithm(prob_id, pop_size, gens, cx_prob, mut_prob):
-
-    config.PROBLEM_ID = prob_id
-    config.PROBLEMS[prob_id]["population_size"] = pop_size
-    config.PROBLEMS[prob_id]["generations"] = gens
+        st.session_state.problem_id = 2
 
-    random.seed(42)
-    toolbox = ga.setup_ga()
-    pop = toolbox.population(n=pop_size)
-    hof = tools.HallOfFame(1)
 
-    stats = tools.Statistics(lambda ind: ind.fitness.values)
-    stats.register("max", np.max)
-
-    pop, logbook = algorithms.eaSimple(
-        pop, toolbox,
-        cxpb=cx_prob, mutpb=mut_prob,
-        ngen=gens, stats=stats, halloffame=hof, verbose=False
-    )
-
-    best_ind = hof[0]
-    return logbook, best_ind
+@st.cache_resource
+def get_executor():
+    # Un único ejecutor por servidor: las corridas viven en procesos aparte y sus resultados
+    # quedan en la caché en disco, así que sobreviven a recargas de la página y reinicios.
+    return jobs.JobExecutor()
 
 
 st.sidebar.header("🛠️ Configuración")
@@ -67,7 +51,8 @@ if "Schwefel" in problem_name:
 else:
     selected_id = 2
 
-current_params = config.get_problem_config(config.PROBLEM_ID)
+problem_id = st.session_state.problem_id
+current_params = config.get_problem_config(problem_id)
 
 st.sidebar.subheader("Parámetros AG")
 pop_size = st.sidebar.number_input(
@@ -76,7 +61,7 @@ pop_size = st.sidebar.number_input(
     5000, 
     current_params["population_size"], 
     10, 
-    key=f"p_{config.PROBLEM_ID}"
+    key=f"p_{problem_id}"
 )
 
 generations = st.sidebar.number_input(
@@ -85,7 +70,7 @@ generations = st.sidebar.number_input(
     1000, 
     current_params["generations"], 
     10, 
-    key=f"g_{config.PROBLEM_ID}"
+    key=f"g_{problem_id}"
 )
 
 crossover_prob = st.sidebar.slider(
@@ -93,7 +78,7 @@ crossover_prob = st.sidebar.slider(
     0.0, 
     1.0, 
     config.CROSSOVER_PROB, 
-    key=f"c_{config.PROBLEM_ID}"
+    key=f"c_{problem_id}"
 )
 
 mutation_prob = st.sidebar.slider(
@@ -103,27 +88,58 @@ mutation_prob = st.sidebar.slider(
     config.MUTATION_PROB, 
     format="%.3f", 
     step=0.001,
-    key=f"m_{config.PROBLEM_ID}"
+    key=f"m_{problem_id}"
 )
 
+instrument = st.sidebar.checkbox("⏱️ Medir tiempo por fase", value=False)
+
 if st.button("🚀 Ejecutar Algoritmo Genético", type="primary"):
+    # Configuración propia de la corrida (con su propio generador aleatorio): varias sesiones
+    # pueden ejecutar a la vez sin pisarse. Peticiones idénticas comparten trabajo y caché.
+    run = context.from_config(
+        problem_id, seed=42, population_size=pop_size, generations=generations,
+        cxpb=crossover_prob, mutpb=mutation_prob
+    )
+    try:
+        st.session_state.job_key = get_executor().submit(run, instrument=instrument)
+    except RuntimeError as e:
+        st.warning(str(e))
+
+job_key = st.session_state.get("job_key")
+if job_key:
     with st.spinner("Ejecutando algoritmo genético..."):
         try:
-            logbook, best_ind = run_genetic_algorithm(
-                config.PROBLEM_ID, pop_size, generations, crossover_prob, mutation_prob
-            )
-
-            real_val = current_params["offset_roulette"] - best_ind.fitness.values[0]
-            decoded_vars = functions.decode_chromosome(
-                best_ind,
-                current_params["var_range"][0],
-                current_params["var_range"][1],
-                current_params["n_vars"]
-            )
+            progress_bar = st.progress(0.0)
+            progress_text = st.empty()
+
+            def show_progress(status):
+                if status.state == "queued" or status.best_value is None:
+                    progress_text.caption("En cola...")
+                    return
+                progress_bar.progress(status.gen / max(status.ngen, 1))
+                progress_text.caption(
+                    f"Generación {status.gen}/{status.ngen} · Mejor: {status.best_value:.5f}"
+                )
+
+            status = get_executor().wait(job_key, on_progress=show_progress)
+            progress_bar.empty()
+            progress_text.empty()
+
+            if status.state == "failed":
+                raise RuntimeError(status.error)
+            if status.state != "done":
+                raise RuntimeError("El resultado ya no está disponible; vuelva a ejecutar")
+
+            result = status.result
+            params = result["params"]
+            logbook = jobs.restore_logbook(result)
+            real_val = result["best_value"]
+            decoded_vars = result["best_vars"]
+            result_problem = result["problem_id"]
 
             found_gen = 0
 
-            target_fitness = best_ind.fitness.values[0]
+            target_fitness = result["best_fitness"]
 
             for record in logbook:
                 if record['max'] >= target_fitness:
@@ -135,32 +151,43 @@ if st.button("🚀 Ejecutar Algoritmo Genético", type="primary"):
             c1, c2, c3, c4 = st.columns(4)
 
             c1.metric("Mínimo encontrado", f"{real_val:.5f}")
-            c2.metric("Generaciones", f"{generations}")
+            c2.metric("Generaciones", f"{logbook[-1]['gen']} / {params['generations']}")
             c3.metric("Encontrado en Gen.", f"{found_gen}")
-            c4.metric("Población", f"{pop_size}")
+            c4.metric("Población", f"{params['population_size']}")
+
+            st.caption(f"Criterio de parada: {logbook[-1].get('stop_reason', 'generations')}")
 
             st.subheader("📉 Convergencia")
-            fig_conv = graphics.plot_convergence(logbook)
+            fig_conv = graphics.plot_convergence(logbook, params=params)
             st.pyplot(fig_conv)
 
-            if config.PROBLEM_ID == 2:
+            if result_problem == 2:
                 st.subheader("🏔️ Visualización 3D")
-                fig_3d = graphics.plot_3d_surface(decoded_vars)
+                fig_3d = graphics.plot_3d_surface(decoded_vars, problem_id=result_problem)
                 st.plotly_chart(fig_3d, use_container_width=True)
-            elif config.PROBLEM_ID == 1:
+            elif result_problem == 1:
                 st.subheader("🏔️ Topología Referencial (2D)")
                 fig_3d = graphics.plot_schwefel_surface_2d()
                 st.plotly_chart(fig_3d, use_container_width=True)
 
+            if profiling.PHASES[0] in logbook.header:
+                st.subheader("⏱️ Tiempo por Fase (s)")
+                df_phases = pd.DataFrame(logbook).set_index("gen")[profiling.PHASES]
+                st.area_chart(df_phases)
+
             st.subheader("🧬 Variables (Genotipo)")
             st.code(str(decoded_vars), language="python")
 
+            if len(result["archive"]) > 1:
+                st.subheader("🏅 Archivo de Élite")
+                st.dataframe(pd.DataFrame(result["archive"]))
+
             df_log = pd.DataFrame(logbook)
-            df_log['valor_real'] = current_params["offset_roulette"] - df_log['max']
+            df_log['valor_real'] = params["offset_roulette"] - df_log['max']
             st.download_button(
                 "Descargar CSV",
                 df_log.to_csv(index=False).encode('utf-8'),
-                f'resultados_{current_params["name"]}.csv',
+                f'resultados_{params["name"]}.csv',
                 "text/csv"
             )
 
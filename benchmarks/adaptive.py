@@ -0,0 +1,66 @@
+"""
+Tasas adaptativas (modules/adaptive.py) frente a las tasas fijas de config: evaluaciones necesarias
+para llegar al objetivo.
+
+Cada corrida se detiene al alcanzar optimum + gap * |optimum| o al agotar --budget evaluaciones.
+Se informa la tasa de éxito, la mediana de evaluaciones de las corridas exitosas (y de todas,
+contando --budget para las fallidas), la mediana del mejor valor y las tasas medias finales.
+
+Uso (desde la raíz del proyecto):
+  python -m benchmarks.adaptive --problems 1 2 --seeds 10 --budget 50000
+  python -m benchmarks.adaptive --problems 2 --encoding real
+"""
+import argparse
+import statistics
+
+import config.config as config
+import modules.adaptive as adaptive
+import modules.functions as functions
+import benchmarks.common as common
+
+# La ruleta sobre offset_roulette ejerce poca presión de selección: con tasas fijas, Schwefel queda
+# entre -4000 y -5500 tras 60000 evaluaciones, así que un objetivo más estricto que la mitad del óptimo
+# sólo mediría fracasos. Camel llega mucho más cerca.
+GAPS = {1: 0.5, 2: 0.01}
+MODES = [("fijas", None), ("feedback", "feedback"), ("self", "self")]
+
+def run_once(problem_id, mode, seed, args):
+  gap = GAPS.get(problem_id, 0.01) if args.gap is None else args.gap
+  adaptation = dict(config.PROBLEMS[problem_id]["adaptation"], mode=mode)
+  overrides = {"encoding": args.encoding} if args.encoding else {}
+  result = common.run_to_target(problem_id, seed, args.population, args.budget, gap, adaptation=adaptation, **overrides)
+  run = result["run"]
+  # Con tasas fijas no hay columnas en el logbook; en real el indpb efectivo es el de "real_coded" o 1/n_vars.
+  fixed = {"cxpb": run.cxpb, "mutpb": run.mutpb, "indpb": run.indpb}
+  if functions.is_real_coded(run.params):
+    fixed["indpb"] = run.params["real_coded"]["indpb"] or 1.0 / run.params["n_vars"]
+  last = result["logbook"][-1]
+  result["rates"] = [last.get(name, fixed[name]) for name in adaptive.RATES]
+  return result
+
+def main():
+  parser = argparse.ArgumentParser(description="Evaluaciones hasta el objetivo: tasas adaptativas vs fijas")
+  parser.add_argument("--problems", type=int, nargs="+", default=list(config.PROBLEMS))
+  parser.add_argument("--seeds", type=int, default=10)
+  parser.add_argument("--population", type=int, default=100)
+  parser.add_argument("--budget", type=int, default=50000, help="Máximo de evaluaciones por corrida")
+  parser.add_argument("--gap", type=float, default=None,
+                      help=f"Objetivo: optimum + gap * |optimum| (por defecto {GAPS} según el problema)")
+  parser.add_argument("--encoding", choices=["binary", "real"], default=None, help="Por defecto, la del problema")
+  args = parser.parse_args()
+
+  print(f"{'problema':<20} {'tasas':<9} {'éxito':>6} {'evals (éxitos)':>15} {'evals (todas)':>14} "
+        f"{'mejor (mediana)':>16} {'cxpb':>6} {'mutpb':>6} {'indpb':>7}")
+  for problem_id in args.problems:
+    name = config.PROBLEMS[problem_id]["name"]
+    for label, mode in MODES:
+      runs = [run_once(problem_id, mode, seed, args) for seed in range(args.seeds)]
+      successes = [r["evaluations"] for r in runs if r["success"]]
+      median_evals = f"{statistics.median(successes):.0f}" if successes else "-"
+      median_all = statistics.median(r["evaluations"] if r["success"] else args.budget for r in runs)
+      cxpb, mutpb, indpb = (statistics.mean(r["rates"][j] for r in runs) for j in range(3))
+      print(f"{name:<20} {label:<9} {len(successes) / len(runs):>6.0%} {median_evals:>15} {median_all:>14.0f} "
+            f"{statistics.median(r['best'] for r in runs):>16.5f} {cxpb:>6.3f} {mutpb:>6.3f} {indpb:>7.4f}")
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
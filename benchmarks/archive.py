@@ -0,0 +1,80 @@
+"""
+Archivo de élite (modules/archive.py) frente a tools.HallOfFame.
+
+Graba las poblaciones de una corrida real y mide, para cada tamaño, el tiempo medio de update por
+generación de ambos. También cuenta los pares de miembros casi duplicados (a distancia de Hamming
+menor que --min-distance) que quedan en el HallOfFame y en un archivo con esa distancia mínima.
+
+Uso (desde la raíz del proyecto):
+  python -m benchmarks.archive --problem 1 --population 2000 --generations 30 --sizes 1 100 500
+"""
+import argparse
+import time
+import numpy as np
+from deap import tools
+
+import config.config as config
+import modules.context as context
+import modules.ga as ga
+import modules.archive as archive
+import modules.evolution as evolution
+
+class _Recorder:
+  """Hall of fame falso que sólo guarda una copia de cada población evaluada."""
+  maxsize = 0
+
+  def __init__(self, toolbox):
+    self.toolbox = toolbox
+    self.populations = []
+
+  def update(self, population):
+    self.populations.append([self.toolbox.clone(ind) for ind in population])
+
+def record_populations(args):
+  run = context.from_config(args.problem, seed=0, population_size=args.population, generations=args.generations,
+                            eval_mode="batch")
+  toolbox = ga.setup_ga(run=run)
+  recorder = _Recorder(toolbox)
+  evolution.run(toolbox.population(n=args.population), toolbox, cxpb=run.cxpb, mutpb=run.mutpb,
+                ngen=args.generations, halloffame=recorder, stop=False, run=run)
+  return run.params, recorder.populations
+
+def time_updates(hof, populations):
+  start = time.perf_counter()
+  for population in populations:
+    hof.update(population)
+  return (time.perf_counter() - start) / len(populations) * 1e3
+
+def near_duplicates(members, min_distance):
+  genomes = np.array(members, dtype=np.uint8)
+  if len(genomes) < 2:
+    return 0
+  distances = np.count_nonzero(genomes[:, None, :] != genomes[None, :, :], axis=2)
+  return int((np.triu(distances < min_distance, k=1)).sum())
+
+def main():
+  parser = argparse.ArgumentParser(description="Costo de update y duplicados: EliteArchive vs HallOfFame")
+  parser.add_argument("--problem", type=int, default=config.PROBLEM_ID, choices=sorted(config.PROBLEMS))
+  parser.add_argument("--population", type=int, default=2000)
+  parser.add_argument("--generations", type=int, default=30)
+  parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 500])
+  parser.add_argument("--min-distance", type=int, default=3, help="Distancia de Hamming mínima del archivo")
+  args = parser.parse_args()
+
+  params, populations = record_populations(args)
+  print(f"[INFO] {params['name']}: {len(populations)} poblaciones de {args.population} individuos")
+  print(f"{'tamaño':>7} {'HallOfFame (ms)':>16} {'archivo (ms)':>13} {'speedup':>8} "
+        f"{'casi dup. HoF':>14} {'casi dup. archivo':>18}")
+  for size in args.sizes:
+    hof = tools.HallOfFame(size)
+    elite = archive.EliteArchive(size, params)
+    spaced = archive.EliteArchive(size, params, min_distance=args.min_distance)
+    hof_ms = time_updates(hof, populations)
+    archive_ms = time_updates(elite, populations)
+    time_updates(spaced, populations)
+    assert [ind.fitness.values for ind in hof] == [ind.fitness.values for ind in elite]
+    print(f"{size:>7} {hof_ms:>16.3f} {archive_ms:>13.3f} {hof_ms / archive_ms:>7.1f}x "
+          f"{near_duplicates(list(hof), args.min_distance):>14} {near_duplicates(list(spaced), args.min_distance):>18}")
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
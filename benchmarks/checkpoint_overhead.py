@@ -0,0 +1,94 @@
+"""
+Costo de los checkpoints (modules/checkpoint.py) sobre el ciclo evolutivo.
+
+Corre la misma corrida (misma semilla) sin checkpoints y con un Checkpointer cada --every
+generaciones (10, el intervalo por defecto de main.py), tras una corrida de calentamiento y
+alternando el orden en cada repetición. Informa la mediana del tiempo por generación, el
+sobrecosto medido de punta a punta, los guardados hechos (el Checkpointer posterga los que
+superarían --max-overhead), el tiempo medio de cada guardado, el costo por generación (tiempo
+total de guardado / generaciones / ms por generación sin checkpoints; menos ruidoso que la
+diferencia de tiempos totales) y el tamaño del .npz.
+
+Uso (desde la raíz del proyecto):
+  python -m benchmarks.checkpoint_overhead --problems 1 2 --generations 50 --repeats 3
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import config.config as config
+import modules.context as context
+import modules.ga as ga
+import modules.metrics as metrics
+import modules.archive as archive
+import modules.evolution as evolution
+import modules.checkpoint as checkpoint
+
+class _TimedCheckpointer(checkpoint.Checkpointer):
+  """Checkpointer que acumula el tiempo gastado en save()."""
+
+  def __init__(self, *args, **kwargs):
+    super().__init__(*args, **kwargs)
+    self.saves = 0
+    self.seconds = 0.0
+
+  def save(self, **state):
+    start = time.perf_counter()
+    super().save(**state)
+    self.seconds += time.perf_counter() - start
+    self.saves += 1
+
+def run_once(problem_id, args, checkpointer):
+  run = context.from_config(problem_id, seed=0, generations=args.generations, eval_mode=args.eval_mode,
+                            **({"population_size": args.population} if args.population else {}))
+  toolbox = ga.setup_ga(run=run)
+  population = toolbox.population(n=run.params["population_size"])
+  start = time.perf_counter()
+  evolution.run(population, toolbox, cxpb=run.cxpb, mutpb=run.mutpb, ngen=args.generations,
+                stats=metrics.FitnessStatistics(), halloffame=archive.from_config(run.params), stop=False,
+                checkpointer=checkpointer, run=run)
+  return (time.perf_counter() - start) / (args.generations + 1) * 1e3
+
+def main():
+  parser = argparse.ArgumentParser(description="Sobrecosto de los checkpoints periódicos")
+  parser.add_argument("--problems", type=int, nargs="+", default=list(config.PROBLEMS))
+  parser.add_argument("--population", type=int, default=None, help="Por defecto, la del problema en config.PROBLEMS")
+  parser.add_argument("--generations", type=int, default=50)
+  parser.add_argument("--every", type=int, default=10, help="Generaciones entre checkpoints")
+  parser.add_argument("--max-overhead", type=float, default=0.005,
+                      help="Límite de Checkpointer sobre el costo de los guardados (0 lo desactiva)")
+  parser.add_argument("--repeats", type=int, default=3)
+  parser.add_argument("--eval-mode", choices=["individual", "batch"], default="batch")
+  args = parser.parse_args()
+
+  print(f"{'problema':<20} {'checkpoints':<12} {'ms/gen':>8} {'sobrecosto':>11} {'guardados':>10} "
+        f"{'ms/guardado':>12} {'costo/gen':>10} {'archivo (MB)':>13}")
+  with tempfile.TemporaryDirectory() as tmp:
+    for problem_id in args.problems:
+      name = config.PROBLEMS[problem_id]["name"]
+      path = os.path.join(tmp, f"{problem_id}.npz")
+      run_once(problem_id, args, None)  # calentamiento
+      plain, saved, saves, save_ms = [], [], [], []
+      for repeat in range(args.repeats):
+        for with_checkpoints in ((False, True) if repeat % 2 == 0 else (True, False)):
+          if with_checkpoints:
+            checkpointer = _TimedCheckpointer(path, every_generations=args.every, max_overhead=args.max_overhead)
+            saved.append(run_once(problem_id, args, checkpointer))
+            saves.append(checkpointer.saves)
+            save_ms.append(checkpointer.seconds * 1e3)
+          else:
+            plain.append(run_once(problem_id, args, None))
+
+      base = statistics.median(plain)
+      median = statistics.median(saved)
+      total_ms = statistics.median(save_ms)
+      n_saves = statistics.median(saves)
+      print(f"{name:<20} {'no':<12} {base:>8.1f} {0:>+11.1%} {'-':>10} {'-':>12} {'-':>10} {'-':>13}")
+      print(f"{name:<20} {f'cada {args.every}':<12} {median:>8.1f} {(median / base - 1):>+11.1%} {n_saves:>10.0f} "
+            f"{total_ms / n_saves:>12.1f} {total_ms / (args.generations + 1) / base:>10.2%} "
+            f"{os.path.getsize(path) / 1e6:>13.2f}")
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""
+Arnés compartido de los benchmarks de evaluaciones hasta el objetivo (real_coded, memetic, adaptive).
+"""
+from deap import tools
+
+import config.config as config
+import modules.context as context
+import modules.ga as ga
+import modules.evolution as evolution
+
+def run_to_target(problem_id, seed, population, budget, gap, **overrides):
+  """
+  Corre el AG hasta alcanzar optimum + gap * |optimum| o agotar `budget` evaluaciones (las de la
+  búsqueda local también cuentan). `overrides` se pasa a context.from_config (campos de RunConfig
+  o claves de config.PROBLEMS). Devuelve success, evaluations, best (valor de la función), el
+  logbook y la RunConfig de la corrida.
+  """
+  base = config.PROBLEMS[problem_id]
+  stopping = dict(base["stopping"], target=base["optimum"] + gap * abs(base["optimum"]), max_evaluations=budget)
+  run = context.from_config(
+    problem_id, seed=seed, stopping=stopping, eval_mode="batch", population_size=population,
+    generations=budget // population + 1, **overrides
+  )
+  toolbox = ga.setup_ga(run=run)
+  hof = tools.HallOfFame(1)
+  _, logbook = evolution.run(
+    toolbox.population(n=population), toolbox, cxpb=run.cxpb, mutpb=run.mutpb, ngen=run.params["generations"],
+    halloffame=hof, run=run
+  )
+  return {
+    "success": logbook.stop_reason == "target",
+    "evaluations": sum(logbook.select("nevals")),
+    "best": run.params["offset_roulette"] - hof[0].fitness.values[0],
+    "logbook": logbook,
+    "run": run,
+  }
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Prueba de estrés de corridas concurrentes: cada corrida recibe su propio context.RunConfig.
+
+Ejecuta primero todas las corridas en serie como referencia y luego las mismas corridas a la vez
+en hilos (mientras otro hilo modifica el módulo config sin parar) y en procesos. Cada resultado
+concurrente debe ser idéntico al de su referencia; cualquier diferencia indica estado compartido.
+
+Uso (desde la raíz del proyecto):
+  python -m benchmarks.concurrency_stress --runs 48 --threads 16
+"""
+import argparse
+import itertools
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from deap import tools
+
+import config.config as config
+import modules.context as context
+import modules.ga as ga
+import modules.metrics as metrics
+import modules.evolution as evolution
+
+def build_runs(n_runs, generations, modes):
+  grid = itertools.cycle(itertools.product(sorted(config.PROBLEMS), [40, 80], [0.6, 0.9], [0.01, 0.05], modes))
+  runs = []
+  for seed, (problem_id, pop_size, cxpb, mutpb, mode) in zip(range(n_runs), grid):
+    runs.append(context.from_config(
+      problem_id, seed=seed, population_size=pop_size, generations=generations,
+      cxpb=cxpb, mutpb=mutpb, indpb=mutpb, eval_mode=mode, cache_size=256 if seed % 3 == 0 else 0
+    ))
+  return runs
+
+def execute(run):
+  """Corre un AG completo sólo con la configuración recibida; devuelve una firma comparable del resultado."""
+  toolbox = ga.setup_ga(run=run)
+  population = toolbox.population(n=run.params["population_size"])
+  hof = tools.HallOfFame(1)
+  stats = metrics.FitnessStatistics(seed=run.seed)
+  population, logbook = evolution.run(
+    population, toolbox, cxpb=run.cxpb, mutpb=run.mutpb,
+    ngen=run.params["generations"], stats=stats, halloffame=hof, run=run
+  )
+  return list(hof[0]), logbook.select("max"), logbook.select("avg"), logbook.stop_reason
+
+def _vandal(stop_event):
+  # Escribe valores absurdos en config sin parar: una corrida que lea config global los notaría.
+  rng = random.Random(0)
+  while not stop_event.is_set():
+    config.PROBLEM_ID = rng.choice(list(config.PROBLEMS))
+    config.CROSSOVER_PROB = rng.random()
+    config.MUTATION_PROB = rng.random()
+    config.EVALUATION_MODE = rng.choice(["individual", "batch"])
+    time.sleep(0.0005)
+
+def run_threads(runs, workers):
+  saved = (config.PROBLEM_ID, config.CROSSOVER_PROB, config.MUTATION_PROB, config.EVALUATION_MODE)
+  stop_event = threading.Event()
+  vandal = threading.Thread(target=_vandal, args=(stop_event,), daemon=True)
+  vandal.start()
+  try:
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+      return list(executor.map(execute, runs))
+  finally:
+    stop_event.set()
+    vandal.join()
+    config.PROBLEM_ID, config.CROSSOVER_PROB, config.MUTATION_PROB, config.EVALUATION_MODE = saved
+
+def run_processes(runs, workers):
+  with ProcessPoolExecutor(max_workers=workers) as executor:
+    return list(executor.map(execute, runs))
+
+def check(name, runs, reference, results, elapsed):
+  mismatches = [i for i, (expected, got) in enumerate(zip(reference, results)) if expected != got]
+  print(f"[INFO] {name:<9} {len(runs)} corridas en {elapsed:.2f} s | diferencias: {len(mismatches)}")
+  for i in mismatches:
+    print(f"[ERROR]   corrida {i}: problema={runs[i].problem_id} semilla={runs[i].seed} modo={runs[i].eval_mode}")
+  return not mismatches
+
+def main():
+  parser = argparse.ArgumentParser(description="Corridas concurrentes sin estado compartido")
+  parser.add_argument("--runs", type=int, default=48)
+  parser.add_argument("--generations", type=int, default=15)
+  parser.add_argument("--threads", type=int, default=16)
+  parser.add_argument("--processes", type=int, default=4, help="0 omite la prueba con procesos")
+  parser.add_argument("--modes", nargs="+", default=["individual", "batch"], choices=["individual", "batch", "parallel"])
+  args = parser.parse_args()
+
+  runs = build_runs(args.runs, args.generations, args.modes)
+
+  start = time.perf_counter()
+  reference = [execute(run) for run in runs]
+  print(f"[INFO] {'serie':<9} {len(runs)} corridas en {time.perf_counter() - start:.2f} s (referencia)")
+
+  start = time.perf_counter()
+  ok = check("hilos", runs, reference, run_threads(runs, args.threads), time.perf_counter() - start)
+
+  if args.processes:
+    start = time.perf_counter()
+    ok = check("procesos", runs, reference, run_processes(runs, args.processes), time.perf_counter() - start) and ok
+
+  print(f"[INFO] Resultado: {'OK' if ok else 'FALLÓ'}")
+  return 0 if ok else 1
+
+if __name__ == "__main__":
+  sys.exit(main())
\ No newline at end of file
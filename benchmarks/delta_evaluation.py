@@ -0,0 +1,67 @@
+"""
+Evaluación incremental frente a evaluación completa en Schwefel a medida que crece n_vars.
+
+Uso (desde la raíz del proyecto):
+  python -m benchmarks.delta_evaluation --n-vars 30 100 300 1000
+"""
+import argparse
+import random
+import time
+from deap import algorithms
+
+import config.config as config
+import modules.ga as ga
+import modules.functions as functions
+
+def offspring(toolbox, population, cxpb, mutpb):
+  return algorithms.varAnd(toolbox.select(population, len(population)), toolbox, cxpb, mutpb)
+
+def main():
+  parser = argparse.ArgumentParser(description="Evaluaciones por segundo: incremental vs completa")
+  parser.add_argument("--n-vars", type=int, nargs="+", default=[30, 100, 300, 1000])
+  parser.add_argument("--population", type=int, default=200)
+  parser.add_argument("--generations", type=int, default=5)
+  parser.add_argument("--cxpb", type=float, default=config.CROSSOVER_PROB)
+  parser.add_argument("--mutpb", type=float, default=1.0, help="Prob. de mutar un individuo (indpb = MUTATION_PROB)")
+  parser.add_argument("--seed", type=int, default=42)
+  args = parser.parse_args()
+
+  config.PROBLEM_ID = 1
+  base_params = dict(config.PROBLEMS[1])
+
+  print(f"{'n_vars':>7} {'completa (ev/s)':>16} {'incremental (ev/s)':>19} {'aceleración':>12}")
+  for n_vars in args.n_vars:
+    config.PROBLEMS[1] = dict(base_params, n_vars=n_vars)
+    random.seed(args.seed)
+
+    toolbox = ga.setup_ga(eval_mode="individual", cache_size=0, incremental=True)
+    population = toolbox.population(n=args.population)
+    for ind in population:
+      ind.fitness.values = toolbox.evaluate(ind)
+
+    full_time = delta_time = 0.0
+    nevals = 0
+    for _ in range(args.generations):
+      children = offspring(toolbox, population, args.cxpb, args.mutpb)
+      invalid = [ind for ind in children if not ind.fitness.valid]
+
+      start = time.perf_counter()
+      expected = [functions.evaluate_fitness(ind) for ind in invalid]
+      full_time += time.perf_counter() - start
+
+      start = time.perf_counter()
+      values = [toolbox.evaluate(ind) for ind in invalid]
+      delta_time += time.perf_counter() - start
+
+      assert values == expected, "La evaluación incremental no coincide con la completa"
+      for ind, fit in zip(invalid, values):
+        ind.fitness.values = fit
+      population = children
+      nevals += len(invalid)
+
+    print(f"{n_vars:>7} {nevals / full_time:>16.0f} {nevals / delta_time:>19.0f} {full_time / delta_time:>11.2f}x")
+
+  config.PROBLEMS[1] = base_params
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
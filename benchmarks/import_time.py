@@ -0,0 +1,76 @@
+"""
+Tiempo de arranque: cuánto tarda un intérprete nuevo en importar cada punto de entrada.
+
+Cada medición lanza un proceso `python -c "import <módulo>"` (o el comando indicado), así que
+incluye el arranque del intérprete; la primera fila (sólo Python) sirve de referencia. Con
+--detail se imprime el desglose de `python -X importtime` de los paquetes más costosos.
+
+Uso (desde la raíz del proyecto):
+  python -m benchmarks.import_time --repeats 10
+  python -m benchmarks.import_time --detail cli
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+TARGETS = {
+  "python": "pass",
+  "cli (--help)": None,
+  "cli": "import cli",
+  "motor": "import modules.ga, modules.evolution",
+  "main": "import main",
+  "graficas": "import modules.graphics",
+}
+
+def command(name, code):
+  if code is None:
+    return [sys.executable, "cli.py", "--help"]
+  return [sys.executable, "-c", code]
+
+def measure(cmd, repeats):
+  times = []
+  for _ in range(repeats):
+    start = time.perf_counter()
+    done = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    times.append(time.perf_counter() - start)
+    if done.returncode != 0:
+      return None, done.stderr.decode("utf-8", "replace").strip().splitlines()[-1]
+  return times, None
+
+def detail(code, limit):
+  """Paquetes de primer nivel con mayor tiempo acumulado según -X importtime."""
+  done = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True)
+  packages = {}
+  for line in done.stderr.splitlines():
+    if not line.startswith("import time:") or "|" not in line or "cumulative" in line:
+      continue
+    _, cumulative, name = line.split("|")
+    if not name.startswith(" ") or name[1] == " ":
+      continue
+    packages[name.strip()] = int(cumulative) / 1000
+  for name, ms in sorted(packages.items(), key=lambda item: -item[1])[:limit]:
+    print(f"  {name:<40} {ms:>9.1f} ms")
+
+def main():
+  parser = argparse.ArgumentParser(description="Tiempo de importación de los puntos de entrada")
+  parser.add_argument("--repeats", type=int, default=10)
+  parser.add_argument("--detail", choices=[name for name, code in TARGETS.items() if code], default=None)
+  parser.add_argument("--limit", type=int, default=15)
+  args = parser.parse_args()
+
+  print(f"{'objetivo':<14} {'mediana (ms)':>13} {'mínimo (ms)':>12}")
+  for name, code in TARGETS.items():
+    times, error = measure(command(name, code), args.repeats)
+    if times is None:
+      print(f"{name:<14} {'no disponible':>13}  ({error})")
+      continue
+    print(f"{name:<14} {statistics.median(times) * 1000:>13.1f} {min(times) * 1000:>12.1f}")
+
+  if args.detail:
+    print(f"\n[INFO] Paquetes más costosos al importar '{args.detail}':")
+    detail(TARGETS[args.detail], args.limit)
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
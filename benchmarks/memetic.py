@@ -0,0 +1,44 @@
+"""
+Búsqueda local memética: evaluaciones necesarias para llegar cerca del óptimo con y sin la etapa.
+
+Cada corrida se detiene al alcanzar optimum + gap * |optimum| o al agotar --budget evaluaciones;
+las evaluaciones de la búsqueda local cuentan en el presupuesto. Se informa la tasa de éxito, la
+mediana de evaluaciones de las corridas exitosas y la mediana del mejor valor.
+
+Uso (desde la raíz del proyecto):
+  python -m benchmarks.memetic --problems 1 2 --seeds 10 --budget 50000 --interval 10
+"""
+import argparse
+import statistics
+
+import config.config as config
+import benchmarks.common as common
+
+def run_once(problem_id, interval, seed, args):
+  local_search = dict(config.PROBLEMS[problem_id]["local_search"], interval=interval)
+  return common.run_to_target(problem_id, seed, args.population, args.budget, args.gap,
+                              encoding=args.encoding, local_search=local_search)
+
+def main():
+  parser = argparse.ArgumentParser(description="Evaluaciones hasta el objetivo con y sin búsqueda local")
+  parser.add_argument("--problems", type=int, nargs="+", default=list(config.PROBLEMS))
+  parser.add_argument("--seeds", type=int, default=10)
+  parser.add_argument("--population", type=int, default=100)
+  parser.add_argument("--budget", type=int, default=50000, help="Máximo de evaluaciones por corrida")
+  parser.add_argument("--gap", type=float, default=1e-4, help="Objetivo: optimum + gap * |optimum|")
+  parser.add_argument("--interval", type=int, default=10, help="Generaciones entre búsquedas locales")
+  parser.add_argument("--encoding", choices=["binary", "real"], default="binary")
+  args = parser.parse_args()
+
+  print(f"{'problema':<20} {'búsqueda local':<15} {'éxito':>6} {'evals (mediana)':>16} {'mejor (mediana)':>16}")
+  for problem_id in args.problems:
+    name = config.PROBLEMS[problem_id]["name"]
+    for label, interval in (("no", None), (f"cada {args.interval}", args.interval)):
+      runs = [run_once(problem_id, interval, seed, args) for seed in range(args.seeds)]
+      successes = [r["evaluations"] for r in runs if r["success"]]
+      median_evals = f"{statistics.median(successes):.0f}" if successes else "-"
+      print(f"{name:<20} {label:<15} {len(successes) / len(runs):>6.0%} {median_evals:>16} "
+            f"{statistics.median(r['best'] for r in runs):>16.5f}")
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""
+Escalabilidad de la evaluación paralela: aceleración frente al número de procesos.
+
+Uso (desde la raíz del proyecto):
+  python -m benchmarks.parallel_scaling --workers 1 2 4 8 16 32 --repeats 20
+"""
+import argparse
+import os
+import time
+import numpy as np
+
+import config.config as config
+import modules.parallel as parallel
+
+def time_evaluator(evaluator, individuals, repeats):
+  evaluator.batch(individuals)  # calentamiento: arranque del pool
+  start = time.perf_counter()
+  for _ in range(repeats):
+    evaluator.batch(individuals)
+  return (time.perf_counter() - start) / repeats
+
+def main():
+  parser = argparse.ArgumentParser(description="Aceleración de la evaluación paralela por número de procesos")
+  parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+  parser.add_argument("--population", type=int, default=None, help="Por defecto, la población de config.PROBLEMS")
+  parser.add_argument("--repeats", type=int, default=10)
+  parser.add_argument("--chunk-size", type=int, default=None)
+  parser.add_argument("--seed", type=int, default=42)
+  args = parser.parse_args()
+
+  rng = np.random.default_rng(args.seed)
+
+  for problem_id, params in config.PROBLEMS.items():
+    pop_size = args.population or params["population_size"]
+    n_bits = params["n_vars"] * params["bits_per_var"]
+    individuals = rng.integers(0, 2, size=(pop_size, n_bits), dtype=np.uint8).tolist()
+
+    print(f"\n[INFO] {params['name']} | Población: {pop_size} | Bits: {n_bits}")
+    print(f"{'procesos':>9} {'seg/gen':>10} {'aceleración':>12}")
+
+    baseline = None
+    for n_workers in sorted(set(args.workers)):
+      evaluator = parallel.ParallelEvaluator(problem_id, params, n_workers, args.chunk_size)
+      seconds = time_evaluator(evaluator, individuals, args.repeats)
+      baseline = baseline or seconds
+      print(f"{n_workers:>9} {seconds:>10.5f} {baseline / seconds:>11.2f}x")
+
+  parallel.shutdown_pool()
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
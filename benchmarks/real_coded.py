@@ -0,0 +1,62 @@
+"""
+Codificación real frente a binaria: evaluaciones necesarias para llegar cerca del óptimo conocido.
+
+Cada corrida se detiene al alcanzar optimum + gap * |optimum| o al agotar --budget evaluaciones.
+Se informa la tasa de éxito, la mediana de evaluaciones de las corridas exitosas, la mediana del
+mejor valor y el costo por evaluación (la codificación real no decodifica).
+
+Uso (desde la raíz del proyecto):
+  python -m benchmarks.real_coded --problems 1 2 --seeds 10 --budget 20000
+"""
+import argparse
+import statistics
+import time
+import numpy as np
+
+import config.config as config
+import modules.context as context
+import modules.ga as ga
+import modules.functions as functions
+import benchmarks.common as common
+
+ENCODINGS = ["binary", "real"]
+
+def run_once(problem_id, encoding, seed, args):
+  return common.run_to_target(problem_id, seed, args.population, args.budget, args.gap,
+                              encoding=encoding, cxpb=args.cxpb, mutpb=args.mutpb)
+
+def evaluation_cost(problem_id, encoding, population, repeats=20):
+  """Microsegundos por individuo de functions.evaluate_population (incluye decodificar en binario)."""
+  run = context.from_config(problem_id, seed=0, encoding=encoding)
+  toolbox = ga.setup_ga(run=run)
+  genomes = np.array(toolbox.population(n=population), dtype=functions.genome_dtype(run.params))
+  start = time.perf_counter()
+  for _ in range(repeats):
+    functions.evaluate_population(genomes, problem_id=problem_id, params=run.params)
+  return (time.perf_counter() - start) / (repeats * population) * 1e6
+
+def main():
+  parser = argparse.ArgumentParser(description="Evaluaciones hasta el objetivo: codificación real vs binaria")
+  parser.add_argument("--problems", type=int, nargs="+", default=list(config.PROBLEMS))
+  parser.add_argument("--seeds", type=int, default=10)
+  parser.add_argument("--population", type=int, default=100)
+  parser.add_argument("--budget", type=int, default=20000, help="Máximo de evaluaciones por corrida")
+  parser.add_argument("--gap", type=float, default=0.01, help="Objetivo: optimum + gap * |optimum|")
+  parser.add_argument("--cxpb", type=float, default=config.CROSSOVER_PROB)
+  parser.add_argument("--mutpb", type=float, default=1.0,
+                      help="Prob. de mutar un individuo (por gen: MUTATION_PROB en binario, 1/n_vars en real)")
+  args = parser.parse_args()
+
+  print(f"{'problema':<20} {'codificación':<12} {'éxito':>6} {'evals (mediana)':>16} {'mejor (mediana)':>16} {'µs/eval':>8}")
+  for problem_id in args.problems:
+    name = config.PROBLEMS[problem_id]["name"]
+    for encoding in ENCODINGS:
+      runs = [run_once(problem_id, encoding, seed, args) for seed in range(args.seeds)]
+      successes = [r["evaluations"] for r in runs if r["success"]]
+      median_evals = f"{statistics.median(successes):.0f}" if successes else "-"
+      cost = evaluation_cost(problem_id, encoding, args.population)
+      print(f"{name:<20} {encoding:<12} {len(successes) / len(runs):>6.0%} {median_evals:>16} "
+            f"{statistics.median(r['best'] for r in runs):>16.5f} {cost:>8.2f}")
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
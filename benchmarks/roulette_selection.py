@@ -0,0 +1,67 @@
+"""
+Tiempo de selección por ruleta frente al tamaño de población: tools.selRoulette vs ga.sel_roulette.
+También compara las frecuencias de selección observadas con las proporciones esperadas.
+
+Uso (desde la raíz del proyecto):
+  python -m benchmarks.roulette_selection --sizes 100 1000 5000 10000
+"""
+import argparse
+import random
+import time
+import numpy as np
+from deap import base, tools
+
+import modules.ga as ga
+
+class Fitness(base.Fitness):
+  weights = (1.0,)
+
+class Individual(list):
+  pass
+
+def make_population(size, rng):
+  # Cada individuo guarda sólo su índice, para contar cuántas veces fue seleccionado.
+  population = []
+  for i, value in enumerate(rng.uniform(1.0, 100.0, size)):
+    ind = Individual([i])
+    ind.fitness = Fitness((value,))
+    population.append(ind)
+  return population
+
+def time_selector(selector, population, repeats):
+  start = time.perf_counter()
+  for _ in range(repeats):
+    selector(population, len(population))
+  return (time.perf_counter() - start) / repeats
+
+def frequency_error(selector, population, spins):
+  fitness = np.array([ind.fitness.values[0] for ind in population])
+  chosen = [ind[0] for ind in selector(population, spins)]
+  observed = np.bincount(chosen, minlength=len(population)) / spins
+  return float(np.abs(observed - fitness / fitness.sum()).max())
+
+def main():
+  parser = argparse.ArgumentParser(description="Selección por ruleta: tiempo vs tamaño de población")
+  parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000, 2000, 5000, 10000])
+  parser.add_argument("--repeats", type=int, default=5)
+  parser.add_argument("--spins", type=int, default=200000, help="Giros para comparar la distribución")
+  parser.add_argument("--seed", type=int, default=42)
+  args = parser.parse_args()
+
+  random.seed(args.seed)
+  rng = np.random.default_rng(args.seed)
+
+  print(f"{'población':>10} {'selRoulette (s)':>16} {'sel_roulette (s)':>17} {'aceleración':>12}")
+  for size in args.sizes:
+    population = make_population(size, rng)
+    deap_time = time_selector(tools.selRoulette, population, args.repeats)
+    fast_time = time_selector(ga.sel_roulette, population, args.repeats)
+    print(f"{size:>10} {deap_time:>16.5f} {fast_time:>17.5f} {deap_time / fast_time:>11.1f}x")
+
+  population = make_population(50, rng)
+  print(f"\n[INFO] Error máximo de frecuencia ({args.spins} giros, 50 individuos):")
+  print(f"  selRoulette:  {frequency_error(tools.selRoulette, population, args.spins):.5f}")
+  print(f"  sel_roulette: {frequency_error(ga.sel_roulette, population, args.spins):.5f}")
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
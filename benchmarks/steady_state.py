@@ -0,0 +1,92 @@
+"""
+Modo asíncrono de estado estacionario frente al generacional con una función objetivo lenta.
+
+Arranca un modules.objective_server local (retardo log-normal) y, con el mismo presupuesto de
+evaluaciones y la misma concurrencia, corre evolution.run (cada generación espera a su evaluación
+más lenta) y steady_state.run (cada resultado se inserta apenas llega). Se informa el rendimiento
+en evaluaciones por segundo, el tiempo total y la mediana del mejor valor.
+
+Uso (desde la raíz del proyecto):
+  python -m benchmarks.steady_state --problem 2 --in-flight 1 4 16 --delay 0.005 --jitter 0.8
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from deap import tools
+
+import config.config as config
+import modules.context as context
+import modules.ga as ga
+import modules.evolution as evolution
+import modules.steady_state as steady_state
+import modules.objective_server as objective_server
+
+def run_once(mode, seed, in_flight, server, args):
+  run = context.from_config(args.problem, seed=seed, population_size=args.population,
+                            generations=args.evaluations // args.population - 1)
+  toolbox = ga.setup_ga(run=run)
+  objective = objective_server.RemoteObjective(server.host, server.port, run.params)
+  population = toolbox.population(n=args.population)
+  hof = tools.HallOfFame(1)
+
+  start = time.perf_counter()
+  if mode == "generacional":
+    mapper = steady_state.ConcurrentMap(in_flight)
+    toolbox.register("evaluate", objective)
+    toolbox.register("map", mapper)
+    population, logbook = evolution.run(
+      population, toolbox, cxpb=run.cxpb, mutpb=run.mutpb, ngen=run.params["generations"],
+      halloffame=hof, stop=False, run=run
+    )
+    elapsed = time.perf_counter() - start
+    mapper.run(objective.aclose())
+    mapper.close()
+  else:
+    async def steady():
+      try:
+        return await steady_state.evolve_async(
+          population, toolbox, cxpb=run.cxpb, mutpb=run.mutpb, max_evaluations=args.evaluations,
+          objective=objective, in_flight=in_flight, halloffame=hof, stop=False, run=run
+        )
+      finally:
+        await objective.aclose()
+    population, logbook = asyncio.run(steady())
+    elapsed = time.perf_counter() - start
+
+  evaluations = sum(logbook.select("nevals"))
+  return {
+    "evaluations": evaluations,
+    "elapsed": elapsed,
+    "throughput": evaluations / elapsed,
+    "best": run.params["offset_roulette"] - hof[0].fitness.values[0],
+  }
+
+def main():
+  parser = argparse.ArgumentParser(description="Rendimiento del modo asíncrono de estado estacionario")
+  parser.add_argument("--problem", type=int, default=config.PROBLEM_ID, choices=sorted(config.PROBLEMS))
+  parser.add_argument("--population", type=int, default=50)
+  parser.add_argument("--evaluations", type=int, default=1000, help="Presupuesto de evaluaciones por corrida")
+  parser.add_argument("--in-flight", type=int, nargs="+", default=[1, 4, 16])
+  parser.add_argument("--delay", type=float, default=config.OBJECTIVE_SERVER_DELAY)
+  parser.add_argument("--jitter", type=float, default=config.OBJECTIVE_SERVER_JITTER)
+  parser.add_argument("--seeds", type=int, default=3)
+  args = parser.parse_args()
+
+  server, stop_server = objective_server.start_in_thread(
+    problem_id=args.problem, delay=args.delay, jitter=args.jitter, seed=0
+  )
+  print(f"[INFO] {config.PROBLEMS[args.problem]['name']}: retardo medio {args.delay} s, dispersión {args.jitter}, "
+        f"{args.evaluations} evaluaciones por corrida")
+  print(f"{'en curso':>8} {'modo':<14} {'evals':>6} {'evals/s':>9} {'tiempo (s)':>11} {'mejor (mediana)':>16}")
+  try:
+    for in_flight in args.in_flight:
+      for mode in ["generacional", "estacionario"]:
+        runs = [run_once(mode, seed, in_flight, server, args) for seed in range(args.seeds)]
+        print(f"{in_flight:>8} {mode:<14} {statistics.median(r['evaluations'] for r in runs):>6.0f} {statistics.median(r['throughput'] for r in runs):>9.1f} "
+              f"{statistics.median(r['elapsed'] for r in runs):>11.2f} {statistics.median(r['best'] for r in runs):>16.5f}")
+  finally:
+    stop_server()
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
@@ -0,0 +1,192 @@
+"""
+Suite de benchmarks reproducible para las rutas críticas del AG.
+
+Mide decodificación, evaluación (por individuo y por lotes), selección, cruce, mutación y una
+generación completa para cada problema de config.PROBLEMS, variando tamaño de población,
+bits_per_var y n_vars. Los resultados se guardan en JSON y pueden compararse contra una línea base.
+
+Uso (desde la raíz del proyecto):
+  python -m benchmarks.suite run --output bench.json
+  python -m benchmarks.suite run --output actual.json --baseline base.json --threshold 0.10
+  python -m benchmarks.suite compare base.json actual.json
+"""
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import numpy as np
+import deap
+from deap import algorithms
+
+import config.config as config
+import modules.context as context
+import modules.ga as ga
+import modules.functions as functions
+
+def measure(func, repeats):
+  times = []
+  for _ in range(repeats):
+    start = time.perf_counter()
+    func()
+    times.append(time.perf_counter() - start)
+  return times
+
+def bench_case(run, pop_size, repeats):
+  """Mide cada operación para la corrida `run` (context.RunConfig); devuelve {operación: tiempos}."""
+  problem_id, params, seed = run.problem_id, run.params, run.seed
+  random.seed(seed)
+  np.random.seed(seed)
+  toolbox = ga.setup_ga(run=run)
+  population = toolbox.population(n=pop_size)
+  for ind, fit in zip(population, map(toolbox.evaluate, population)):
+    ind.fitness.values = fit
+  bits = np.array(population, dtype=np.uint8)
+  r_min, r_max = params["var_range"]
+
+  def mate_all():
+    offspring = [toolbox.clone(ind) for ind in population]
+    for child1, child2 in zip(offspring[::2], offspring[1::2]):
+      toolbox.mate(child1, child2)
+
+  def mutate_all():
+    offspring = [toolbox.clone(ind) for ind in population]
+    for mutant in offspring:
+      toolbox.mutate(mutant)
+
+  def generation():
+    offspring = algorithms.varAnd(toolbox.select(population, len(population)), toolbox, config.CROSSOVER_PROB, 1.0)
+    invalid = [ind for ind in offspring if not ind.fitness.valid]
+    for ind, fit in zip(invalid, toolbox.map(toolbox.evaluate, invalid)):
+      ind.fitness.values = fit
+
+  operations = {
+    "decode": lambda: [functions.decode_chromosome(ind, r_min, r_max, params["n_vars"]) for ind in population],
+    "decode_batch": lambda: functions.decode_population(bits, r_min, r_max, params["n_vars"]),
+    "evaluate": lambda: list(map(toolbox.evaluate, population)),
+    "evaluate_batch": lambda: functions.evaluate_population(bits, problem_id=problem_id, params=params),
+    "select": lambda: toolbox.select(population, len(population)),
+    "crossover": mate_all,
+    "mutate": mutate_all,
+    "generation": generation,
+  }
+  # Se vuelve a sembrar antes de cada operación para que no dependa del orden de la suite
+  # (toolbox.rng para los operadores propios, `random` para selRoulette y varAnd de DEAP).
+  results = {}
+  for name, func in operations.items():
+    random.seed(seed)
+    toolbox.rng.seed(seed)
+    results[name] = measure(func, repeats)
+  return results
+
+def cases(args):
+  """Una RunConfig por caso (config no se modifica) junto con el tamaño de población."""
+  for problem_id, base in config.PROBLEMS.items():
+    n_vars_list = args.n_vars if base.get("separable") and args.n_vars else [base["n_vars"]]
+    bits_list = args.bits or [base["bits_per_var"]]
+    for n_vars in n_vars_list:
+      for bits_per_var in bits_list:
+        for pop_size in args.populations:
+          run = context.from_config(
+            problem_id, seed=args.seed, eval_mode="individual", cache_size=0, incremental=False,
+            n_vars=n_vars, bits_per_var=bits_per_var
+          )
+          yield run, pop_size
+
+def run_suite(args):
+  results = []
+  for run, pop_size in cases(args):
+    params = run.params
+    timings = bench_case(run, pop_size, args.repeats)
+    for op, times in timings.items():
+      results.append({
+        "problem": params["name"],
+        "population": pop_size,
+        "n_vars": params["n_vars"],
+        "bits_per_var": params["bits_per_var"],
+        "op": op,
+        "median_s": statistics.median(times),
+        "min_s": min(times),
+        "repeats": len(times),
+      })
+      print(f"[INFO] {params['name']:<20} pop={pop_size:<6} vars={params['n_vars']:<5} "
+            f"bits={params['bits_per_var']:<3} {op:<15} {statistics.median(times):.6f} s")
+
+  return {
+    "meta": {
+      "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+      "python": sys.version.split()[0],
+      "numpy": np.__version__,
+      "deap": deap.__version__,
+      "platform": platform.platform(),
+      "seed": args.seed,
+      "repeats": args.repeats,
+    },
+    "results": results,
+  }
+
+def _key(entry):
+  return entry["problem"], entry["population"], entry["n_vars"], entry["bits_per_var"], entry["op"]
+
+def compare(baseline, current, threshold):
+  """Devuelve la lista de regresiones: casos cuya mediana empeora más que `threshold` (fracción)."""
+  base_index = {_key(e): e for e in baseline["results"]}
+  regressions = []
+  print(f"\n{'caso':<62} {'base (s)':>10} {'actual (s)':>11} {'cambio':>8}")
+  for entry in current["results"]:
+    base = base_index.get(_key(entry))
+    if base is None:
+      continue
+    ratio = entry["median_s"] / base["median_s"] if base["median_s"] else float("inf")
+    flag = ""
+    if ratio > 1 + threshold:
+      flag = "  <-- REGRESIÓN"
+      regressions.append(dict(entry, baseline_s=base["median_s"], ratio=ratio))
+    name = "{} pop={} vars={} bits={} {}".format(*_key(entry))
+    print(f"{name:<62} {base['median_s']:>10.6f} {entry['median_s']:>11.6f} {ratio - 1:>+7.1%}{flag}")
+  return regressions
+
+def main():
+  parser = argparse.ArgumentParser(description="Benchmarks de las rutas críticas del AG")
+  sub = parser.add_subparsers(dest="command", required=True)
+
+  run_parser = sub.add_parser("run", help="Ejecuta la suite y guarda los resultados en JSON")
+  run_parser.add_argument("--output", default="bench.json")
+  run_parser.add_argument("--populations", type=int, nargs="+", default=[200, 1000, 2000])
+  run_parser.add_argument("--bits", type=int, nargs="+", default=None, help="bits_per_var (por defecto, los de cada problema)")
+  run_parser.add_argument("--n-vars", type=int, nargs="+", default=None, help="n_vars para problemas separables")
+  run_parser.add_argument("--repeats", type=int, default=5)
+  run_parser.add_argument("--seed", type=int, default=42)
+  run_parser.add_argument("--baseline", default=None, help="JSON previo contra el que comparar")
+  run_parser.add_argument("--threshold", type=float, default=0.10, help="Empeoramiento tolerado (0.10 = 10%%)")
+
+  compare_parser = sub.add_parser("compare", help="Compara dos archivos de resultados")
+  compare_parser.add_argument("baseline")
+  compare_parser.add_argument("current")
+  compare_parser.add_argument("--threshold", type=float, default=0.10)
+
+  args = parser.parse_args()
+
+  if args.command == "run":
+    current = run_suite(args)
+    with open(args.output, "w", encoding="utf-8") as fh:
+      json.dump(current, fh, indent=2)
+    print(f"[INFO] Resultados guardados en '{args.output}'")
+    if not args.baseline:
+      return 0
+    with open(args.baseline, encoding="utf-8") as fh:
+      baseline = json.load(fh)
+  else:
+    with open(args.baseline, encoding="utf-8") as fh:
+      baseline = json.load(fh)
+    with open(args.current, encoding="utf-8") as fh:
+      current = json.load(fh)
+
+  regressions = compare(baseline, current, args.threshold)
+  print(f"\n[INFO] Regresiones: {len(regressions)}")
+  return 1 if regressions else 0
+
+if __name__ == "__main__":
+  sys.exit(main())
\ No newline at end of file
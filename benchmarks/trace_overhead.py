@@ -0,0 +1,74 @@
+"""
+Costo de la traza (modules/trace.py) sobre el ciclo evolutivo.
+
+Corre la misma corrida (misma semilla) sin traza, con la traza de config (TRACE_EVERY,
+TRACE_FIELDS) y con todas las generaciones trazadas, tras una corrida de calentamiento y
+alternando el orden en cada repetición.
+Informa la mediana del tiempo por generación, el sobrecosto relativo, el tamaño del archivo y
+el tiempo de releerlo mapeado en memoria (tabla + genomas desempaquetados).
+
+Uso (desde la raíz del proyecto):
+  python -m benchmarks.trace_overhead --problems 1 2 --population 2000 --generations 20 --repeats 3
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import config.config as config
+import modules.context as context
+import modules.ga as ga
+import modules.evolution as evolution
+import modules.trace as trace
+
+def run_once(problem_id, args, every, path):
+  run = context.from_config(problem_id, seed=0, population_size=args.population, generations=args.generations,
+                            eval_mode=args.eval_mode)
+  toolbox = ga.setup_ga(run=run)
+  population = toolbox.population(n=args.population)
+  tracer = trace.Tracer(path, run.params, every=every) if every is not None else None
+
+  start = time.perf_counter()
+  evolution.run(population, toolbox, cxpb=run.cxpb, mutpb=run.mutpb, ngen=args.generations,
+                stop=False, run=run, tracer=tracer)
+  if tracer is not None:
+    tracer.close()
+  return (time.perf_counter() - start) / (args.generations + 1) * 1e3, run.params
+
+def main():
+  parser = argparse.ArgumentParser(description="Sobrecosto de la traza de la corrida")
+  parser.add_argument("--problems", type=int, nargs="+", default=list(config.PROBLEMS))
+  parser.add_argument("--population", type=int, default=2000)
+  parser.add_argument("--generations", type=int, default=20)
+  parser.add_argument("--repeats", type=int, default=3)
+  parser.add_argument("--eval-mode", choices=["individual", "batch"], default="batch")
+  args = parser.parse_args()
+
+  modes = [("sin traza", None), (f"cada {config.TRACE_EVERY}", config.TRACE_EVERY), ("cada 1", 1)]
+  print(f"{'problema':<20} {'traza':<10} {'ms/gen':>8} {'sobrecosto':>11} {'archivo (MB)':>13} {'releer (ms)':>12}")
+  with tempfile.TemporaryDirectory() as tmp:
+    for problem_id in args.problems:
+      times = {label: [] for label, _ in modes}
+      run_once(problem_id, args, None, None)  # calentamiento: la primera corrida paga asignaciones de memoria
+      for repeat in range(args.repeats):
+        order = modes if repeat % 2 == 0 else modes[::-1]
+        for label, every in order:
+          elapsed, params = run_once(problem_id, args, every, os.path.join(tmp, f"{problem_id}-{every}.arrow"))
+          times[label].append(elapsed)
+
+      base = statistics.median(times[modes[0][0]])
+      for label, every in modes:
+        median = statistics.median(times[label])
+        size = replay = "-"
+        if every is not None:
+          path = os.path.join(tmp, f"{problem_id}-{every}.arrow")
+          size = f"{os.path.getsize(path) / 1e6:.1f}"
+          start = time.perf_counter()
+          table = trace.read_trace(path)
+          trace.genome_matrix(table.column("genome"), params)
+          replay = f"{(time.perf_counter() - start) * 1e3:.1f}"
+        print(f"{params['name']:<20} {label:<10} {median:>8.1f} {(median / base - 1):>+11.1%} {size:>13} {replay:>12}")
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""
+Punto de entrada sin interfaz gráfica, pensado para colas de trabajos y corridas cortas.
+
+Al arrancar sólo importa config y context: el motor (ga, evolution, metrics, archive y lo que
+éstos cargan, como stopping y checkpoint) se importa al correr, pyarrow sólo con --trace y
+matplotlib sólo con --plot.
+
+La salida es JSON estricto: los valores no finitos del logbook (p. ej. la diversidad en las
+generaciones sin muestreo) se escriben como null.
+
+Uso:
+  python cli.py --problem 2 --population 200 --generations 100 --seed 42 --output resultado.json
+  python cli.py --problem 1 --encoding real --output schwefel.json --plot convergencia.png
+"""
+import argparse
+import importlib.util
+import json
+import sys
+import time
+
+import config.config as config
+import modules.context as context
+
+def can_plot():
+  return importlib.util.find_spec("matplotlib") is not None
+
+def parse_args(argv=None):
+  parser = argparse.ArgumentParser(description="Algoritmo genético sin interfaz gráfica")
+  parser.add_argument("--problem", type=int, default=config.PROBLEM_ID, choices=sorted(config.PROBLEMS))
+  parser.add_argument("--population", type=int, default=None, help="Por defecto, la del problema en config.PROBLEMS")
+  parser.add_argument("--generations", type=int, default=None, help="Por defecto, las del problema en config.PROBLEMS")
+  parser.add_argument("--cxpb", type=float, default=config.CROSSOVER_PROB)
+  parser.add_argument("--mutpb", type=float, default=None,
+                      help=f"Por defecto, {config.MUTATION_PROB} en binario y el mutpb de \"real_coded\" en real")
+  parser.add_argument("--indpb", type=float, default=None, help="Prob. de mutación por gen (por defecto, --mutpb)")
+  parser.add_argument("--encoding", choices=["binary", "real"], default=None)
+  parser.add_argument("--eval-mode", choices=["individual", "batch", "parallel"], default=None)
+  parser.add_argument("--local-search", type=int, default=None, metavar="N",
+                      help="Búsqueda local memética cada N generaciones (por defecto, la del problema)")
+  parser.add_argument("--adaptive", choices=["off", "feedback", "self"], default=None,
+                      help="Control adaptativo de cxpb, mutpb e indpb (por defecto, el del problema); las tasas dadas son las iniciales")
+  parser.add_argument("--seed", type=int, default=42)
+  parser.add_argument("--archive-size", type=int, default=None,
+                      help="Mejores soluciones distintas que se incluyen en el resultado (por defecto, config.ARCHIVE_SIZE)")
+  parser.add_argument("--output", default=None, help="Archivo JSON con el resultado y el logbook (por defecto, stdout)")
+  # El ejecutable liviano de PyInstaller (AlgoritmoGenetico_CLI) no incluye matplotlib: ahí --plot no se ofrece.
+  parser.add_argument("--plot", default=None, help=argparse.SUPPRESS if not can_plot() else
+                      "Guarda la gráfica de convergencia en este archivo")
+  parser.add_argument("--trace", default=None, help="Archivo Arrow IPC donde guardar la traza de la corrida")
+  parser.add_argument("--verbose", action="store_true", help="Imprime el logbook en cada generación")
+  return parser.parse_args(argv)
+
+def build_run(args):
+  overrides = {"cxpb": args.cxpb}
+  for key, value in (("mutpb", args.mutpb), ("indpb", args.mutpb if args.indpb is None else args.indpb),
+                     ("population_size", args.population), ("generations", args.generations),
+                     ("encoding", args.encoding), ("eval_mode", args.eval_mode)):
+    if value is not None:
+      overrides[key] = value
+  if args.local_search is not None:
+    overrides["local_search"] = dict(config.PROBLEMS[args.problem]["local_search"], interval=args.local_search or None)
+  if args.adaptive is not None:
+    mode = None if args.adaptive == "off" else args.adaptive
+    overrides["adaptation"] = dict(config.PROBLEMS[args.problem]["adaptation"], mode=mode)
+  return context.from_config(args.problem, seed=args.seed, **overrides)
+
+def run(run_config, verbose=False, archive_size=None, trace_path=None):
+  # Importaciones del motor aquí para que `--help` responda sin cargar numpy ni DEAP.
+  import modules.ga as ga
+  import modules.functions as functions
+  import modules.metrics as metrics
+  import modules.evolution as evolution
+  import modules.archive as archive
+
+  params = run_config.params
+  toolbox = ga.setup_ga(run=run_config)
+  population = toolbox.population(n=params["population_size"])
+  hof = archive.from_config(params, archive_size)
+  stats = metrics.FitnessStatistics(seed=run_config.seed)
+
+  tracer = None
+  if trace_path:
+    import modules.trace as trace
+    tracer = trace.Tracer(trace_path, params)
+  start = time.perf_counter()
+  population, logbook = evolution.run(
+    population, toolbox, cxpb=run_config.cxpb, mutpb=run_config.mutpb, ngen=params["generations"],
+    stats=stats, halloffame=hof, verbose=verbose, run=run_config, tracer=tracer
+  )
+  if tracer is not None:
+    tracer.close()
+  elapsed = time.perf_counter() - start
+
+  best = hof[0]
+  result = {
+    "problem": params["name"],
+    "problem_id": run_config.problem_id,
+    "seed": run_config.seed,
+    "population": params["population_size"],
+    "cxpb": run_config.cxpb,
+    "mutpb": run_config.mutpb,
+    "encoding": params.get("encoding", "binary"),
+    "best_value": params["offset_roulette"] - best.fitness.values[0],
+    "best_vars": functions.decode_individual(best, params),
+    "generations": logbook[-1]["gen"],
+    "evaluations": sum(logbook.select("nevals")),
+    "stop_reason": logbook.stop_reason,
+    "elapsed_s": elapsed,
+    "archive": hof.summary(),
+    "logbook": list(logbook),
+  }
+  return result, logbook
+
+def main(argv=None):
+  args = parse_args(argv)
+  if args.plot and not can_plot():
+    # Se avisa antes de correr, no después de haber gastado la corrida.
+    print("[ERROR] --plot requiere matplotlib, que no está disponible en este ejecutable o entorno", file=sys.stderr)
+    return 2
+  run_config = build_run(args)
+  result, logbook = run(run_config, verbose=args.verbose, archive_size=args.archive_size, trace_path=args.trace)
+
+  import modules.storage as storage
+  text = json.dumps(storage.finite(result), indent=2, allow_nan=False)
+  if args.output:
+    with open(args.output, "w", encoding="utf-8") as fh:
+      fh.write(text)
+    print(f"[INFO] {result['problem']}: mejor valor {result['best_value']:.5f} "
+          f"({result['evaluations']} evaluaciones, {result['elapsed_s']:.2f} s) -> '{args.output}'")
+  else:
+    print(text)
+
+  if args.plot:
+    # matplotlib sólo se importa cuando se pide la gráfica.
+    import modules.graphics as graphics
+    graphics.plot_convergence(logbook, filename=args.plot, params=run_config.params)
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
\ No newline at end of file
@@ -3,6 +3,61 @@ PROBLEM_ID: int = 1
 MUTATION_PROB: float = 0.01
 CROSSOVER_PROB: float = 0.8
 
+# "individual": toolbox.evaluate por individuo | "batch": evaluación vectorizada de la población
+# "parallel": lotes de la población repartidos en un pool de procesos
+EVALUATION_MODE: str = "individual"
+N_WORKERS: int = None   # None = todos los núcleos
+CHUNK_SIZE: int = None  # None = automático (~4 lotes por proceso)
+POOL_CACHE_SIZE: int = 2  # pools de procesos ociosos (por problema y n.º de procesos) que se mantienen abiertos
+
+# Máximo de genomas en la caché LRU de fitness (0 = desactivada)
+FITNESS_CACHE_SIZE: int = 0
+
+# Re-evalúa sólo las variables cuyos bits cambiaron (problemas con "separable": True)
+INCREMENTAL_EVALUATION: bool = False
+
+# "bisect": ruleta con suma acumulada y búsqueda binaria | "deap": tools.selRoulette
+ROULETTE_METHOD: str = "bisect"
+
+# Archivo de élite de los puntos de entrada (modules/archive.py): cuántos individuos distintos se
+# conservan, distancia mínima entre ellos (0 = sólo descarta duplicados) y "hamming" | "decoded"
+ARCHIVE_SIZE: int = 1
+ARCHIVE_MIN_DISTANCE: float = 0
+ARCHIVE_DISTANCE: str = "hamming"
+
+# Traza de la corrida (modules/trace.py, --trace en main.py y cli.py): archivo Arrow IPC con una fila por
+# individuo de cada generación muestreada. TRACE_EVERY: cada cuántas generaciones; TRACE_FIELDS: columnas
+# opcionales ("fitness", "genome", "parents"); TRACE_QUEUE_SIZE: generaciones en espera de escritura
+TRACE_EVERY: int = 10
+TRACE_FIELDS = ["fitness", "genome", "parents"]
+TRACE_QUEUE_SIZE: int = 4
+
+# Modelo de islas (N_ISLANDS < 2 = una sola población)
+N_ISLANDS: int = 0
+MIGRATION_INTERVAL: int = 10
+MIGRANTS: int = 5
+TOPOLOGY: str = "ring"       # "ring" | "full"
+REPLACEMENT: str = "worst"   # "worst" | "random"
+
+# Trabajos en segundo plano de la app Streamlit y caché de resultados en disco
+JOB_WORKERS: int = 2
+JOB_QUEUE_SIZE: int = 8        # máximo de trabajos en espera o en ejecución
+JOB_CACHE_DIR: str = ".ga_cache"
+JOB_CACHE_MAX_MB: int = 200
+
+# Superficies 3-D de las visualizaciones: puntos por eje de cada nivel de detalle,
+# superficies que se mantienen en memoria y carpeta de los .npy persistidos
+SURFACE_RESOLUTIONS = {"coarse": 50, "fine": 100}
+SURFACE_CACHE_SIZE: int = 8
+SURFACE_CACHE_DIR: str = ".ga_cache/surfaces"
+
+# Modo asíncrono de estado estacionario (modules/steady_state.py): evaluaciones en curso a la vez
+# y retardo del servidor de prueba (modules/objective_server.py): media en segundos y dispersión
+# (desviación estándar del logaritmo; 0 = retardo constante)
+STEADY_STATE_IN_FLIGHT: int = 8
+OBJECTIVE_SERVER_DELAY: float = 0.01
+OBJECTIVE_SERVER_JITTER: float = 0.5
+
 PROBLEMS = {
   1: {
     "name": "Schwefel",
@@ -11,7 +66,24 @@ PROBLEMS = {
     "population_size": 1000,
     "generations": 200,
     "offset_roulette": 30000,
-    "bits_per_var": 16
+    "optimum": -12569.4866,
+    "bits_per_var": 16,
+    "separable": True,
+    # "binary": cromosoma de bits decodificado | "real": vector de float64 acotado por var_range
+    "encoding": "binary",
+    # mutpb: prob. de mutar un individuo en codificación real (reemplaza a MUTATION_PROB, pensada para bits)
+    "real_coded": {"crossover": "sbx", "eta_c": 15.0, "alpha": 0.5, "mutation": "polynomial", "eta_m": 20.0, "sigma": 0.1, "indpb": None, "mutpb": 0.2},
+    # Ventana (x1, x2) de la superficie 3-D; las demás variables no se grafican
+    "plot_range": [[-500, 500], [-500, 500]],
+    # Búsqueda local memética cada `interval` generaciones sobre los `top_k` mejores (None = desactivada).
+    # method "coordinate": una variable por paso | "pattern": todas las variables a la vez;
+    # step: paso inicial como fracción del rango; iterations: rondas de 2 * n_vars evaluaciones por candidato
+    "local_search": {"interval": None, "top_k": 3, "iterations": 10, "step": 0.02, "shrink": 0.5, "method": "coordinate"},
+    # Control adaptativo de cxpb, mutpb e indpb (modules/adaptive.py; mode None = tasas fijas de config).
+    # "feedback": regla de 1/5 sobre el éxito de los mutados y mutpb según la diversidad | "self": tasas por individuo
+    "adaptation": {"mode": None, "target_success": 0.2, "factor": 1.5, "min_diversity": 0.25},
+    # Criterios de parada adicionales al número de generaciones (None = desactivado)
+    "stopping": {"target": None, "stagnation": None, "max_evaluations": None, "max_seconds": None, "combine": "any"}
   },
   2: {
     "name": "Six-Hump Camel Back",
@@ -20,7 +92,15 @@ PROBLEMS = {
     "population_size": 200,
     "generations": 100,
     "offset_roulette": 10000,
-    "bits_per_var": 20
+    "optimum": -1.0316,
+    "bits_per_var": 20,
+    "separable": False,
+    "encoding": "binary",
+    "real_coded": {"crossover": "sbx", "eta_c": 15.0, "alpha": 0.5, "mutation": "polynomial", "eta_m": 20.0, "sigma": 0.1, "indpb": None, "mutpb": 0.2},
+    "plot_range": [[-2, 2], [-1, 1]],
+    "local_search": {"interval": None, "top_k": 5, "iterations": 30, "step": 0.01, "shrink": 0.5, "method": "pattern"},
+    "adaptation": {"mode": None, "target_success": 0.2, "factor": 1.5, "min_diversity": 0.25},
+    "stopping": {"target": -1.0316, "stagnation": None, "max_evaluations": None, "max_seconds": None, "combine": "any"}
   }
 }
 
@@ -0,0 +1,173 @@
+"""
+Experimentos por lotes: ejecuta una grilla de problemas, poblaciones, probabilidades y semillas
+en un pool de procesos y escribe cada corrida terminada en un dataset Parquet.
+
+Uso:
+  python experiments.py --problems 1 2 --populations 200 1000 --cxpb 0.7 0.9 --mutpb 0.01 --seeds 30 --output resultados/
+
+Genera en --output: runs.parquet (una fila por corrida), logbook.parquet (una fila por generación)
+y summary.parquet (mediana del mejor valor y tasa de éxito por configuración).
+"""
+import argparse
+import itertools
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import config.config as config
+import modules.context as context
+import modules.ga as ga
+import modules.functions as functions
+import modules.metrics as metrics
+import modules.evolution as evolution
+import modules.archive as archive
+
+RUN_SCHEMA = pa.schema([
+  ("run_id", pa.int64()),
+  ("problem_id", pa.int64()),
+  ("problem", pa.string()),
+  ("population", pa.int64()),
+  ("cxpb", pa.float64()),
+  ("mutpb", pa.float64()),
+  ("seed", pa.int64()),
+  ("task_seed", pa.uint64()),
+  ("best_value", pa.float64()),
+  ("best_vars", pa.list_(pa.float64())),
+  ("generations", pa.int64()),
+  ("evaluations", pa.int64()),
+  ("stop_reason", pa.string()),
+  ("elapsed_s", pa.float64()),
+])
+
+LOGBOOK_SCHEMA = pa.schema([
+  ("run_id", pa.int64()),
+  ("gen", pa.int64()),
+  ("nevals", pa.int64()),
+  ("max", pa.float64()),
+  ("avg", pa.float64()),
+  ("min", pa.float64()),
+  ("std", pa.float64()),
+  ("diversity", pa.float64()),
+])
+
+def task_seed(seed, problem_id, pop_size, cxpb, mutpb):
+  """Semilla propia de cada tarea, derivada de su configuración y no del orden de ejecución."""
+  entropy = [seed, problem_id, pop_size, round(cxpb * 1e6), round(mutpb * 1e6)]
+  return int(np.random.SeedSequence(entropy).generate_state(1, dtype=np.uint64)[0])
+
+def build_tasks(args):
+  grid = itertools.product(args.problems, args.populations, args.cxpb, args.mutpb, range(args.seeds))
+  tasks = []
+  for run_id, (problem_id, pop_size, cxpb, mutpb, seed) in enumerate(grid):
+    seed += args.first_seed
+    tasks.append({
+      "run_id": run_id, "problem_id": problem_id, "population": pop_size, "cxpb": cxpb, "mutpb": mutpb,
+      "seed": seed, "task_seed": task_seed(seed, problem_id, pop_size, cxpb, mutpb), "generations": args.generations,
+    })
+  return tasks
+
+def run_task(task):
+  overrides = {"generations": task["generations"]} if task["generations"] else {}
+  run_config = context.from_config(
+    task["problem_id"], seed=task["task_seed"], population_size=task["population"],
+    cxpb=task["cxpb"], mutpb=task["mutpb"], indpb=task["mutpb"], eval_mode="batch", **overrides
+  )
+  params = run_config.params
+
+  toolbox = ga.setup_ga(run=run_config)
+  population = toolbox.population(n=task["population"])
+  hof = archive.EliteArchive(1, params)
+  stats = metrics.FitnessStatistics(seed=task["task_seed"])
+
+  start = time.perf_counter()
+  population, logbook = evolution.run(
+    population, toolbox, cxpb=run_config.cxpb, mutpb=run_config.mutpb,
+    ngen=params["generations"], stats=stats, halloffame=hof, run=run_config
+  )
+  elapsed = time.perf_counter() - start
+
+  best = hof[0]
+  run = dict(
+    task,
+    problem=params["name"],
+    best_value=params["offset_roulette"] - best.fitness.values[0],
+    best_vars=functions.decode_individual(best, params),
+    generations=logbook[-1]["gen"],
+    evaluations=sum(logbook.select("nevals")),
+    stop_reason=logbook.stop_reason,
+    elapsed_s=elapsed,
+  )
+  columns = LOGBOOK_SCHEMA.names[1:]
+  records = [dict({name: record.get(name) for name in columns}, run_id=task["run_id"]) for record in logbook]
+  return run, records
+
+def summarize(runs, tolerance):
+  """Mediana del mejor valor, tasa de éxito y evaluaciones medianas por configuración."""
+  groups = {}
+  for run in runs:
+    key = (run["problem_id"], run["problem"], run["population"], run["cxpb"], run["mutpb"])
+    groups.setdefault(key, []).append(run)
+
+  summary = []
+  for (problem_id, problem, pop_size, cxpb, mutpb), items in sorted(groups.items()):
+    optimum = config.PROBLEMS[problem_id]["optimum"]
+    successes = [r for r in items if r["best_value"] <= optimum + tolerance]
+    summary.append({
+      "problem": problem, "population": pop_size, "cxpb": cxpb, "mutpb": mutpb, "runs": len(items),
+      "median_best": statistics.median(r["best_value"] for r in items),
+      "success_rate": len(successes) / len(items),
+      "median_evaluations": statistics.median(r["evaluations"] for r in items),
+    })
+  return summary
+
+def main():
+  parser = argparse.ArgumentParser(description="Grilla de experimentos multi-semilla en paralelo")
+  parser.add_argument("--problems", type=int, nargs="+", default=list(config.PROBLEMS))
+  parser.add_argument("--populations", type=int, nargs="+", default=[200])
+  parser.add_argument("--cxpb", type=float, nargs="+", default=[config.CROSSOVER_PROB])
+  parser.add_argument("--mutpb", type=float, nargs="+", default=[config.MUTATION_PROB])
+  parser.add_argument("--seeds", type=int, default=30, help="Número de semillas por configuración")
+  parser.add_argument("--first-seed", type=int, default=0)
+  parser.add_argument("--generations", type=int, default=None, help="Por defecto, las de config.PROBLEMS")
+  parser.add_argument("--workers", type=int, default=None)
+  parser.add_argument("--tolerance", type=float, default=1e-3, help="Éxito: mejor valor <= óptimo + tolerancia")
+  parser.add_argument("--output", default="experimentos")
+  args = parser.parse_args()
+
+  tasks = build_tasks(args)
+  os.makedirs(args.output, exist_ok=True)
+  print(f"[INFO] {len(tasks)} corridas | Salida: '{args.output}'")
+
+  runs = []
+  run_writer = pq.ParquetWriter(os.path.join(args.output, "runs.parquet"), RUN_SCHEMA)
+  log_writer = pq.ParquetWriter(os.path.join(args.output, "logbook.parquet"), LOGBOOK_SCHEMA)
+  try:
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+      futures = [executor.submit(run_task, task) for task in tasks]
+      for done, future in enumerate(as_completed(futures), start=1):
+        run, records = future.result()
+        runs.append(run)
+        run_writer.write_table(pa.Table.from_pylist([{f.name: run[f.name] for f in RUN_SCHEMA}], schema=RUN_SCHEMA))
+        log_writer.write_table(pa.Table.from_pylist(records, schema=LOGBOOK_SCHEMA))
+        print(f"[INFO] [{done}/{len(tasks)}] {run['problem']} pop={run['population']} cx={run['cxpb']} "
+              f"mut={run['mutpb']} semilla={run['seed']} -> {run['best_value']:.5f}")
+  finally:
+    run_writer.close()
+    log_writer.close()
+
+  summary = summarize(runs, args.tolerance)
+  pq.write_table(pa.Table.from_pylist(summary), os.path.join(args.output, "summary.parquet"))
+
+  print("\n" + "="*40)
+  print("[INFO] RESUMEN")
+  print("="*40)
+  for row in summary:
+    print(f"{row['problem']:<20} pop={row['population']:<6} cx={row['cxpb']:<5} mut={row['mutpb']:<6} "
+          f"mediana={row['median_best']:.5f} éxito={row['success_rate']:.0%} evals={row['median_evaluations']:.0f}")
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
@@ -1,5 +1,7 @@
 import tkinter as tk
 import random
+import queue
+import time
 from tkinter import ttk, messagebox
 import threading
 import numpy as np
@@ -9,13 +11,22 @@ from mpl_toolkits.mplot3d import Axes3D
 from matplotlib import cm
 
 import config.config as config
+import modules.context as context
 import modules.ga as ga
 import modules.functions as functions
-from deap import tools, algorithms
+import modules.metrics as metrics
+import modules.evolution as evolution
+import modules.profiling as profiling
+import modules.surfaces as surfaces
+import modules.archive as archive
 
 class GeneticApp:
     random.seed(42)
 
+    # Frecuencia máxima de refresco: curva de convergencia y marcador de la escena 3-D.
+    REFRESH_MS = 100
+    MARKER_REFRESH_S = 0.5
+
     def __init__(self, root):
         self.root = root
         self.root.title("Laboratorio de IA - Algoritmos Genéticos")
@@ -26,6 +37,8 @@ class GeneticApp:
         self.gen_var = tk.IntVar(value=100)
         self.cx_prob_var = tk.DoubleVar(value=0.8)
         self.mut_prob_var = tk.DoubleVar(value=0.01)
+        self.instrument_var = tk.BooleanVar(value=False)
+        self.adaptive_var = tk.BooleanVar(value=False)
         
         self.res_min = tk.StringVar(value="---")
         self.res_gen = tk.StringVar(value="---")
@@ -72,8 +85,16 @@ class GeneticApp:
             ttk.Label(left_panel, text=lbl).pack(anchor=tk.W, pady=(10, 0))
             ttk.Entry(left_panel, textvariable=var).pack(fill=tk.X)
 
+        ttk.Checkbutton(left_panel, text="Medir tiempo por fase", variable=self.instrument_var).pack(anchor=tk.W, pady=(10, 0))
+        # Con tasas autoadaptativas las probabilidades ingresadas son sólo las iniciales de cada individuo.
+        ttk.Checkbutton(left_panel, text="Tasas autoadaptativas", variable=self.adaptive_var).pack(anchor=tk.W)
+
         self.btn_run = ttk.Button(left_panel, text="🚀 EJECUTAR ALGORITMO", command=self.start_thread)
-        self.btn_run.pack(fill=tk.X, pady=20)
+        self.btn_run.pack(fill=tk.X, pady=(20, 5))
+
+        self.btn_stop = ttk.Button(left_panel, text="⏹ DETENER", command=self.stop_run, state=tk.DISABLED)
+        self.btn_stop.pack(fill=tk.X, pady=(0, 20))
+        self.cancel_token = evolution.CancelToken()
 
         ttk.Label(left_panel, textvariable=self.status_msg, foreground="blue", wraplength=200).pack(fill=tk.X)
 
@@ -99,6 +120,14 @@ class GeneticApp:
         self.canvas_conv = FigureCanvasTkAgg(self.fig_conv, master=self.tab_conv)
         self.canvas_conv.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
+        # Los ejes se configuran una vez; durante la corrida sólo se actualizan los datos de la línea.
+        self.conv_line, = self.ax_conv.plot([], [], color="#1f77b4", linewidth=2, label="Mejor Fitness")
+        self.ax_conv.set_title("Evolución del Fitness por Generación")
+        self.ax_conv.set_xlabel("Generaciones")
+        self.ax_conv.set_ylabel("Valor de la Función (Minimizar)")
+        self.ax_conv.grid(True, linestyle='--', alpha=0.6)
+        self.ax_conv.legend()
+
         self.tab_3d = ttk.Frame(self.notebook)
         self.notebook.add(self.tab_3d, text="🏔️ Topología 3D del Terreno")
         
@@ -106,6 +135,15 @@ class GeneticApp:
         self.ax_3d = self.fig_3d.add_subplot(111, projection='3d')
         self.canvas_3d = FigureCanvasTkAgg(self.fig_3d, master=self.tab_3d)
         self.canvas_3d.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.surface_problem = None
+        self.best_marker, = self.ax_3d.plot([], [], [], linestyle="", color="red", marker="*", markersize=14)
+
+        self.tab_phases = ttk.Frame(self.notebook)
+        self.notebook.add(self.tab_phases, text="⏱️ Tiempo por Fase")
+
+        self.fig_phases, self.ax_phases = plt.subplots(figsize=(5, 4), dpi=100)
+        self.canvas_phases = FigureCanvasTkAgg(self.fig_phases, master=self.tab_phases)
+        self.canvas_phases.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
     def update_defaults(self, event=None):
         selection = self.problem_var.get()
@@ -119,39 +157,139 @@ class GeneticApp:
             self.mut_prob_var.set(0.01)
 
     def start_thread(self):
+        # Los valores de Tk se leen aquí, en el hilo principal; el hilo de trabajo sólo recibe datos.
+        selection = self.problem_var.get()
+        prob_id = 1 if "Schwefel" in selection else 2
+        pop_size = self.pop_var.get()
+        gens = self.gen_var.get()
+        cx_pb = self.cx_prob_var.get()
+        mut_pb = self.mut_prob_var.get()
+        instrument = self.instrument_var.get()
+        adaptation = dict(config.PROBLEMS[prob_id]["adaptation"], mode="self" if self.adaptive_var.get() else None)
+
+        run = context.from_config(
+            prob_id, population_size=pop_size, generations=gens, cxpb=cx_pb, mutpb=mut_pb, indpb=mut_pb,
+            adaptation=adaptation
+        )
+        self.params = run.params
+
         self.btn_run.config(state=tk.DISABLED)
         self.status_msg.set("Procesando... Esto puede tardar unos segundos.")
-        thread = threading.Thread(target=self.run_algorithm)
+        self.btn_stop.config(state=tk.NORMAL)
+        self.cancel_token = evolution.CancelToken()
+        self.updates = queue.Queue()
+        self.reset_plots(prob_id)
+
+        thread = threading.Thread(target=self.run_algorithm, args=(run, instrument, self.updates, self.cancel_token))
         thread.daemon = True
         thread.start()
+        self.root.after(self.REFRESH_MS, self.poll_updates)
+
+    def stop_run(self):
+        self.cancel_token.cancel()
+        self.btn_stop.config(state=tk.DISABLED)
+        self.status_msg.set("Deteniendo al final de la generación en curso...")
+
+    def show_progress(self, snapshot, params):
+        best_val = params["offset_roulette"] - snapshot.best_fitness
+        self.status_msg.set(f"Generación {snapshot.gen}/{snapshot.ngen} | Mejor: {best_val:.5f} | {snapshot.elapsed:.1f} s")
+
+    def reset_plots(self, prob_id):
+        """Deja la curva vacía y dibuja la superficie sólo si cambió el problema."""
+        self.conv_x, self.conv_y = [], []
+        self.conv_line.set_data([], [])
+        self.canvas_conv.draw_idle()
+        self.last_marker_update = 0.0
+
+        if self.surface_problem != prob_id:
+            self.draw_surface(prob_id)
+        self.best_marker.set_visible(False)
+        self.canvas_3d.draw_idle()
+
+    def draw_surface(self, prob_id):
+        # La superficie es estática: se dibuja una vez por problema y sólo se mueve el marcador.
+        surface = surfaces.get_surface(prob_id, "coarse")
+        X, Y = np.meshgrid(surface.x, surface.y)
 
-    def run_algorithm(self):
+        self.ax_3d.clear()
+        if prob_id == 2:
+            self.ax_3d.plot_surface(X, Y, surface.z, cmap=cm.viridis, alpha=0.8, linewidth=0)
+            self.ax_3d.set_title("Topología: Six-Hump Camel Back")
+        elif prob_id == 1:
+            self.ax_3d.plot_surface(X, Y, surface.z, cmap=cm.jet, alpha=0.7)
+            self.ax_3d.set_title("Schwefel (Representación 2D)")
+
+        self.best_marker, = self.ax_3d.plot([], [], [], linestyle="", color="red", marker="*", markersize=14, label="Mínimo Encontrado")
+        if prob_id == 2:
+            self.ax_3d.legend()
+        self.surface_problem = prob_id
+
+    def move_marker(self, prob_id, best_vars):
+        # Schwefel tiene 30 variables: la superficie es sólo una referencia y no lleva marcador.
+        if prob_id != 2:
+            return
+        bz = surfaces.point_value(prob_id, best_vars)
+        self.best_marker.set_data_3d([best_vars[0]], [best_vars[1]], [bz])
+        self.best_marker.set_visible(True)
+        self.canvas_3d.draw_idle()
+
+    def poll_updates(self):
+        """Consume el progreso del hilo de trabajo a lo sumo cada REFRESH_MS y redibuja una sola vez."""
+        latest = None
+        finished = None
         try:
-            selection = self.problem_var.get()
-            prob_id = 1 if "Schwefel" in selection else 2
-            
-            pop_size = self.pop_var.get()
-            gens = self.gen_var.get()
-            cx_pb = self.cx_prob_var.get()
-            mut_pb = self.mut_prob_var.get()
-
-            config.PROBLEM_ID = prob_id
-            config.PROBLEMS[prob_id]["population_size"] = pop_size
-            config.PROBLEMS[prob_id]["generations"] = gens
-            config.CROSSOVER_PROB = cx_pb
-            config.MUTATION_PROB = mut_pb
-
-            params = config.get_problem_config(prob_id)
-            toolbox = ga.setup_ga()
-            pop = toolbox.population(n=pop_size)
-            hof = tools.HallOfFame(1)
-            stats = tools.Statistics(lambda ind: ind.fitness.values)
-            stats.register("max", np.max)
-
-            pop, logbook = algorithms.eaSimple(
-                pop, toolbox, 
-                cxpb=cx_pb, mutpb=mut_pb, 
-                ngen=gens, stats=stats, halloffame=hof, verbose=False
+            while finished is None:
+                kind, payload = self.updates.get_nowait()
+                if kind == "progress":
+                    latest = payload
+                    self.conv_x.append(payload.gen)
+                    self.conv_y.append(self.params["offset_roulette"] - payload.best_fitness)
+                else:
+                    finished = (kind, payload)
+        except queue.Empty:
+            pass
+
+        if latest is not None:
+            self.show_progress(latest, self.params)
+            self.conv_line.set_data(self.conv_x, self.conv_y)
+            self.ax_conv.relim()
+            self.ax_conv.autoscale_view()
+            self.canvas_conv.draw_idle()
+
+            # La escena 3-D es cara de redibujar: el marcador se mueve con menos frecuencia y sólo si se ve.
+            now = time.perf_counter()
+            visible = self.notebook.select() == str(self.tab_3d)
+            if visible and now - self.last_marker_update >= self.MARKER_REFRESH_S:
+                self.move_marker(self.surface_problem, latest.best_vars)
+                self.last_marker_update = now
+
+        if finished is None:
+            self.root.after(self.REFRESH_MS, self.poll_updates)
+        elif finished[0] == "done":
+            self.update_gui_results(*finished[1])
+        else:
+            messagebox.showerror("Error de Ejecución", finished[1])
+            self.btn_run.config(state=tk.NORMAL)
+            self.btn_stop.config(state=tk.DISABLED)
+            self.status_msg.set("Error. Verifique parámetros.")
+
+    def run_algorithm(self, run, instrument, updates, cancel_token):
+        # Hilo de trabajo: no toca widgets; todo lo que la interfaz necesita pasa por `updates`.
+        try:
+            params = run.params
+            toolbox = ga.setup_ga(run=run)
+            pop = toolbox.population(n=params["population_size"])
+            hof = archive.from_config(params)
+            stats = metrics.FitnessStatistics()
+            ga.register_cache_stats(toolbox, stats)
+
+            pop, logbook = evolution.run(
+                pop, toolbox,
+                cxpb=run.cxpb, mutpb=run.mutpb,
+                ngen=params["generations"], stats=stats, halloffame=hof,
+                cancel=cancel_token, run=run,
+                on_generation=lambda snap: updates.put(("progress", snap)),
+                instrument=instrument
             )
 
             best_ind = hof[0]
@@ -164,64 +302,53 @@ class GeneticApp:
                     found_gen = record['gen']
                     break
             
-            decoded_vars = functions.decode_chromosome(
-                best_ind, params["var_range"][0], params["var_range"][1], params["n_vars"]
-            )
+            decoded_vars = functions.decode_individual(best_ind, params)
 
             gen_log = logbook.select("gen")
             fit_max = logbook.select("max")
             real_values_log = [params["offset_roulette"] - f for f in fit_max]
 
-            self.root.after(0, self.update_gui_results, real_val, found_gen, gen_log, real_values_log, prob_id, decoded_vars)
+            phase_data = {phase: logbook.select(phase) for phase in profiling.PHASES} if instrument else None
+
+            updates.put(("done", (real_val, found_gen, gen_log, real_values_log, run.problem_id, decoded_vars, logbook.stop_reason, phase_data)))
 
         except Exception as e:
-            error_msg = str(e)
-            self.root.after(0, lambda: messagebox.showerror("Error de Ejecución", error_msg))
-            self.root.after(0, lambda: self.btn_run.config(state=tk.NORMAL))
-            self.root.after(0, lambda: self.status_msg.set("Error. Verifique parámetros."))
+            updates.put(("error", str(e)))
 
-    def update_gui_results(self, val, gen, x_data, y_data, prob_id, best_vars):
+    def update_gui_results(self, val, gen, x_data, y_data, prob_id, best_vars, stop_reason="generations", phase_data=None):
         self.res_min.set(f"{val:.5f}")
         self.res_gen.set(str(gen))
         self.status_msg.set("✅ Optimización completada exitosamente.")
         self.btn_run.config(state=tk.NORMAL)
+        self.btn_stop.config(state=tk.DISABLED)
 
-        self.ax_conv.clear()
-        self.ax_conv.plot(x_data, y_data, color="#1f77b4", linewidth=2, label="Mejor Fitness")
-        self.ax_conv.set_title("Evolución del Fitness por Generación")
-        self.ax_conv.set_xlabel("Generaciones")
-        self.ax_conv.set_ylabel("Valor de la Función (Minimizar)")
-        self.ax_conv.grid(True, linestyle='--', alpha=0.6)
-        self.ax_conv.legend()
-        self.canvas_conv.draw()
-
-        self.ax_3d.clear()
-        
-        if prob_id == 2:
-            x = np.linspace(-2, 2, 60)
-            y = np.linspace(-1, 1, 60)
-            X, Y = np.meshgrid(x, y)
-            Z = (4*X**2 - 2.1*X**4 + (1/3)*X**6) + (X*Y) + (-4*Y**2 + 4*Y**4)
-            
-            self.ax_3d.plot_surface(X, Y, Z, cmap=cm.viridis, alpha=0.8, linewidth=0)
-            
-            bx, by = best_vars[0], best_vars[1]
-            bz = (4*bx**2 - 2.1*bx**4 + (1/3)*bx**6) + (bx*by) + (-4*by**2 + 4*by**4)
-            self.ax_3d.scatter(bx, by, bz, c='red', s=150, marker='*', label='Mínimo Encontrado', depthshade=False)
-            self.ax_3d.set_title("Topología: Six-Hump Camel Back")
-            self.ax_3d.legend()
+        self.conv_x, self.conv_y = list(x_data), list(y_data)
+        self.conv_line.set_data(self.conv_x, self.conv_y)
+        self.ax_conv.relim()
+        self.ax_conv.autoscale_view()
+        self.canvas_conv.draw_idle()
 
-        elif prob_id == 1:
-            x = np.linspace(-500, 500, 50)
-            y = np.linspace(-500, 500, 50)
-            X, Y = np.meshgrid(x, y)
-            Z = (-X * np.sin(np.sqrt(np.abs(X)))) + (-Y * np.sin(np.sqrt(np.abs(Y))))
-            
-            self.ax_3d.plot_surface(X, Y, Z, cmap=cm.jet, alpha=0.7)
-            self.ax_3d.set_title("Schwefel (Representación 2D)")
+        self.move_marker(prob_id, best_vars)
+        if prob_id == 1:
             self.status_msg.set("Nota: Schwefel se muestra en 2D solo como referencia topológica.")
 
-        self.canvas_3d.draw()
+        if self.cancel_token.cancelled:
+            self.status_msg.set(f"⏹ Ejecución detenida en la generación {x_data[-1]}.")
+        elif stop_reason != "generations":
+            self.status_msg.set(f"✅ Detenida en la generación {x_data[-1]} (criterio: {stop_reason}).")
+
+        self.canvas_3d.draw_idle()
+
+        if phase_data:
+            self.ax_phases.clear()
+            labels = [phase.replace("t_", "") for phase in phase_data]
+            self.ax_phases.stackplot(x_data, [[t * 1000 for t in series] for series in phase_data.values()], labels=labels)
+            self.ax_phases.set_title("Tiempo por Fase y Generación")
+            self.ax_phases.set_xlabel("Generaciones")
+            self.ax_phases.set_ylabel("Tiempo (ms)")
+            self.ax_phases.grid(True, linestyle='--', alpha=0.6)
+            self.ax_phases.legend(loc="upper right")
+            self.canvas_phases.draw()
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -1,47 +1,109 @@
+import argparse
 import random
-import numpy as np
-from deap import tools, algorithms
 
 import config.config as config
+import modules.context as context
 import modules.ga as ga
-import modules.graphics as graphics
 import modules.functions as functions
+import modules.metrics as metrics
+import modules.islands as islands
+import modules.evolution as evolution
+import modules.checkpoint as checkpoint
+import modules.profiling as profiling
+import modules.archive as archive
+
+def parse_args():
+  parser = argparse.ArgumentParser(description="Algoritmo genético simple (Schwefel / Six-Hump Camel Back)")
+  parser.add_argument("--checkpoint", help="Archivo .npz donde guardar checkpoints periódicos")
+  parser.add_argument("--checkpoint-every", type=int, default=None, help="Guardar cada N generaciones")
+  parser.add_argument("--checkpoint-seconds", type=float, default=None, help="Guardar cada T segundos")
+  parser.add_argument("--resume", help="Reanudar la corrida desde un checkpoint .npz")
+  parser.add_argument("--instrument", action="store_true", help="Registrar el tiempo por fase en el logbook")
+  parser.add_argument("--profile-gens", type=int, nargs="+", default=None, help="Generaciones a perfilar")
+  parser.add_argument("--profiler", choices=["cprofile", "sampling"], default="cprofile")
+  parser.add_argument("--trace", help="Archivo Arrow IPC donde guardar la traza (ver config.TRACE_*)")
+  args = parser.parse_args()
+  if config.N_ISLANDS > 1:
+    # El modelo de islas corre en procesos propios, fuera de evolution.evolve: no guarda checkpoints ni traza.
+    flags = {"--checkpoint": args.checkpoint, "--resume": args.resume, "--trace": args.trace,
+             "--instrument": args.instrument, "--profile-gens": args.profile_gens}
+    unsupported = [flag for flag, value in flags.items() if value]
+    if unsupported:
+      parser.error(f"{', '.join(unsupported)} no se admite con el modelo de islas (config.N_ISLANDS = {config.N_ISLANDS})")
+  return args
 
 def main():
+  args = parse_args()
   random.seed(42)
 
-  params = config.get_problem_config()
+  resume = None
+  if args.resume:
+    resume = checkpoint.load(args.resume)
+    run = context.from_config(
+      resume["problem_id"], cxpb=resume["cxpb"], mutpb=resume["mutpb"], indpb=resume["mutpb"], **resume["params"]
+    )
+    print(f"[INFO] Reanudando desde '{args.resume}' (generación {resume['gen']})")
+  else:
+    run = context.from_config()
+
+  params = run.params
 
   print(f"[INFO] Iniciando optimización para el problema: {params['name']}")
   print(f"[INFO] Población: {params['population_size']} | Generaciones: {params['generations']}")
 
-  toolbox = ga.setup_ga()
-  poblation = toolbox.population(n=params["population_size"])
-  hof = tools.HallOfFame(1)
+  toolbox = ga.setup_ga(run=run)
+  if resume is not None:
+    poblation, hof = checkpoint.restore_population(resume)
+  else:
+    poblation = toolbox.population(n=params["population_size"])
+    hof = archive.from_config(params)
+
+  checkpointer = None
+  if args.checkpoint:
+    every = args.checkpoint_every or (None if args.checkpoint_seconds else 10)
+    checkpointer = checkpoint.Checkpointer(args.checkpoint, every, args.checkpoint_seconds)
+
+  stats = metrics.FitnessStatistics()
+  ga.register_cache_stats(toolbox, stats)
 
-  stats = tools.Statistics(lambda ind: ind.fitness.values)
-  stats.register("max", np.max)
-  stats.register("avg", np.mean)
+  profiler = None
+  if args.profile_gens:
+    hook = profiling.CProfileHook if args.profiler == "cprofile" else profiling.SamplingProfilerHook
+    profiler = hook(args.profile_gens)
 
-  poblation, logbook = algorithms.eaSimple(
-    poblation, toolbox,
-    cxpb=config.CROSSOVER_PROB,
-    mutpb=config.MUTATION_PROB,
-    ngen=params["generations"],
-    stats=stats,
-    halloffame=hof,
-    verbose=True
-  )
+  if config.N_ISLANDS > 1:
+    print(f"[INFO] Modelo de islas: {config.N_ISLANDS} islas | Topología: {config.TOPOLOGY}")
+    logbook, hof = islands.run_islands(config.N_ISLANDS, seed=42, run=run)
+  else:
+    tracer = None
+    if args.trace:
+      # pyarrow sólo se importa cuando se pide la traza.
+      import modules.trace as trace
+      tracer = trace.Tracer(args.trace, params)
+    poblation, logbook = evolution.run(
+      poblation, toolbox,
+      cxpb=run.cxpb,
+      mutpb=run.mutpb,
+      ngen=resume["ngen"] if resume else params["generations"],
+      stats=stats,
+      halloffame=hof,
+      verbose=True,
+      checkpointer=checkpointer,
+      resume=resume,
+      instrument=args.instrument,
+      profiler=profiler,
+      run=run,
+      tracer=tracer
+    )
+    if tracer is not None:
+      tracer.close()
+      print(f"[INFO] Traza: {tracer.generations} generaciones en '{args.trace}'")
+  print(f"[INFO] Criterio de parada: {logbook.stop_reason}")
 
   best_individual = hof[0]
   fitness_final = best_individual.fitness.values[0]
   real_value = params["offset_roulette"] - fitness_final
-  decoded_vars = functions.decode_chromosome(
-    individual=best_individual,
-    r_min=params["var_range"][0],
-    r_max=params["var_range"][1],
-    n_vars=params["n_vars"]
-  )
+  decoded_vars = functions.decode_individual(best_individual, params)
 
   print("\n" + "="*40)
   print(f"[INFO] RESULTADO FINAL ({params['name']})")
@@ -49,7 +111,9 @@ def main():
   print(f"[INFO] Mínimo Encontrado: {real_value:.5f}")
   print(f"[INFO] Variables: {decoded_vars[:5]}")
 
-  graphics.plot_convergence(logbook)
+  # matplotlib y plotly se cargan recién aquí, después del cómputo.
+  import modules.graphics as graphics
+  graphics.plot_convergence(logbook, params=params)
 
 if __name__ == "__main__":
   main()
\ No newline at end of file
@@ -0,0 +1,142 @@
+import random
+import numpy as np
+import modules.functions as functions
+import modules.ga as ga
+
+RATES = ("cxpb", "mutpb", "indpb")
+MODES = ("feedback", "self")
+
+def diversity(population, params, rng, sample=128):
+  """
+  Diversidad genética en [0, 1] estimada sobre una muestra de la población: 1 para individuos
+  uniformes al azar y 0 para una población convergida. En binario es la media por bit de
+  4 * p * (1 - p) (p = frecuencia de unos); en real, la desviación estándar de cada gen
+  relativa al ancho de var_range, escalada por sqrt(12).
+  """
+  n = len(population)
+  rows = rng.choice(n, sample, replace=False) if n > sample else np.arange(n)
+  if functions.is_real_coded(params):
+    low, up = params["var_range"]
+    genomes = np.array([population[i] for i in rows.tolist()], dtype=np.float64)
+    return float(min(1.0, genomes.std(axis=0).mean() / (up - low) * np.sqrt(12.0)))
+  data = b"".join(bytes(population[i]) for i in rows.tolist())
+  p = np.frombuffer(data, dtype=np.uint8).reshape(len(rows), -1).mean(axis=0)
+  return float((4.0 * p * (1.0 - p)).mean())
+
+class RateControl:
+  """
+  Control adaptativo de las tasas de cruce (cxpb), de mutación por individuo (mutpb) y por gen
+  (indpb) durante la corrida, en lugar de los valores fijos de config.
+
+  mode "feedback": tras evaluar cada generación compara a cada hijo con el individuo
+  seleccionado del que se clonó. indpb sigue la regla de 1/5 de Rechenberg (crece si la tasa de
+  éxito de los mutados supera `target_success` y decrece si no); mutpb crece mientras la
+  diversidad esté por debajo de `min_diversity` y vuelve a bajar cuando se recupera; cxpb se
+  mueve hacia la parte de los éxitos que aporta el cruce frente a la mutación.
+
+  mode "self": cada individuo lleva sus tasas en `ind.rates` (cxpb, mutpb, indpb). Antes de
+  variar, las tasas de cada hijo mutan con la regla log-normal de Bäck y Schütz para
+  probabilidades y se usan para producirlo (una pareja se cruza con la media de sus cxpb), así
+  que la selección favorece a las tasas que dejan mejores hijos.
+
+  Las tasas quedan dentro de los rangos `*_range`; las del logbook son las usadas (en "self",
+  la media de la población).
+  """
+
+  def __init__(self, params, cxpb, mutpb, indpb, mode="feedback", target_success=0.2, factor=1.5,
+               min_diversity=0.25, learning_rate=0.1, tau=0.22, cxpb_range=(0.5, 1.0), mutpb_range=(0.01, 1.0),
+               indpb_range=(None, None)):
+    if mode not in MODES:
+      raise ValueError(f"Modo de control de tasas desconocido: {mode}")
+    self.params = params
+    self.mode = mode
+    self.target_success = target_success
+    self.factor = factor
+    self.min_diversity = min_diversity
+    self.learning_rate = learning_rate
+    self.tau = tau
+    # Sin límites explícitos, indpb puede bajar hasta cambiar en promedio un cuarto de gen por mutación
+    # y subir hasta 0.1 o un gen por mutación, lo que sea mayor: en real el indpb por defecto es 1/n_vars
+    # (0.5 en Camel) y un tope fijo de 0.1 lo recortaría.
+    n_genes = params["n_vars"] * (1 if functions.is_real_coded(params) else params["bits_per_var"])
+    low, up = indpb_range
+    self.bounds = {
+      "cxpb": tuple(cxpb_range), "mutpb": tuple(mutpb_range),
+      "indpb": (0.25 / n_genes if low is None else low, max(0.1, 1.0 / n_genes) if up is None else up),
+    }
+    self.rates = {name: self._clip(name, value) for name, value in zip(RATES, (cxpb, mutpb, indpb))}
+    self.used = dict(self.rates)
+    self.diversity = None
+
+  def _clip(self, name, value):
+    low, up = self.bounds[name]
+    return float(np.clip(value, low, up))
+
+  def resume(self, rates):
+    """Retoma las tasas vigentes guardadas en un checkpoint (las de `rates` al guardarlo)."""
+    self.rates.update((name, rates[name]) for name in RATES if name in rates)
+
+  def vary(self, offspring, toolbox, lineage=None):
+    """
+    Reemplazo de ga.var_and con las tasas actuales. Guarda el fitness de los individuos
+    seleccionados y los operadores aplicados a cada hijo para update(), y las tasas usadas en `used`.
+    """
+    self._rng = np.random.default_rng(getattr(toolbox, "rng", random).getrandbits(64))
+    self._parent_fitness = np.fromiter((ind.fitness.wvalues[0] for ind in offspring), dtype=np.float64, count=len(offspring))
+    if lineage is None:
+      lineage = (np.full(len(offspring), -1, dtype=np.int32), np.zeros(len(offspring), dtype=np.int8))
+    self._ops = lineage[1]
+
+    if self.mode == "feedback":
+      self.used = dict(self.rates)
+      return ga.var_and(offspring, toolbox, self.rates["cxpb"], self.rates["mutpb"], lineage, indpb=self.rates["indpb"])
+
+    rates = np.array([getattr(ind, "rates", None) or self._initial() for ind in offspring], dtype=np.float64)
+    rates = self._perturb(rates)
+    children = ga.var_and(offspring, toolbox, rates[:, 0], rates[:, 1], lineage, indpb=rates[:, 2])
+    for child, row in zip(children, map(tuple, rates.tolist())):
+      child.rates = row
+    self.used = dict(zip(RATES, rates.mean(axis=0).tolist()))
+    return children
+
+  def _initial(self):
+    return tuple(self.rates[name] for name in RATES)
+
+  def _perturb(self, rates):
+    # p' = 1 / (1 + (1 - p) / p * exp(-tau * N(0, 1))): la probabilidad se mueve en escala logit y queda en (0, 1).
+    odds = (1.0 - rates) / rates * np.exp(-self.tau * self._rng.standard_normal(rates.shape))
+    rates = 1.0 / (1.0 + odds)
+    for j, name in enumerate(RATES):
+      rates[:, j] = np.clip(rates[:, j], *self.bounds[name])
+    return rates
+
+  def update(self, population):
+    """Ajusta las tasas de la generación siguiente a partir de los hijos ya evaluados ("feedback")."""
+    if self.mode != "feedback":
+      return
+    fitness = np.fromiter((ind.fitness.wvalues[0] for ind in population), dtype=np.float64, count=len(population))
+    improved = fitness > self._parent_fitness
+    mutated = (self._ops & ga.OP_MUTATION) != 0
+    crossed = self._ops == ga.OP_CROSSOVER
+    self.diversity = diversity(population, self.params, self._rng)
+
+    if mutated.any():
+      success = improved[mutated].mean()
+      step = (success - self.target_success) / (1.0 - self.target_success)
+      self.rates["indpb"] = self._clip("indpb", self.rates["indpb"] * self.factor ** step)
+    if self.diversity < self.min_diversity:
+      self.rates["mutpb"] = self._clip("mutpb", self.rates["mutpb"] * self.factor)
+    else:
+      self.rates["mutpb"] = self._clip("mutpb", self.rates["mutpb"] / self.factor)
+    if crossed.any() and mutated.any():
+      cx_success, mut_success = improved[crossed].mean(), improved[mutated].mean()
+      if cx_success + mut_success > 0:
+        share = cx_success / (cx_success + mut_success)
+        self.rates["cxpb"] = self._clip("cxpb", (1.0 - self.learning_rate) * self.rates["cxpb"] + self.learning_rate * share)
+
+def from_config(params, cxpb, mutpb, indpb):
+  """Construye el control a partir de params["adaptation"]; None si no hay modo configurado."""
+  spec = params.get("adaptation")
+  if not spec or not spec.get("mode"):
+    return None
+  return RateControl(params, cxpb, mutpb, indpb, **spec)
\ No newline at end of file
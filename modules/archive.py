@@ -0,0 +1,173 @@
+import hashlib
+import numpy as np
+from deap import creator
+import config.config as config
+import modules.functions as functions
+
+class EliteArchive:
+  """
+  Archivo de los `maxsize` mejores individuos distintos, compatible con tools.HallOfFame
+  (update, len, archive[0], iteración, maxsize) pero sin copias profundas: el fitness y los
+  genomas viven en arreglos de tamaño fijo ordenados de mejor a peor.
+
+  Cada update toma del vector de fitness de la población sólo los candidatos que pueden entrar
+  (np.argpartition + orden de esos k) y descarta los genomas repetidos por su hash. Con
+  min_distance > 0 tampoco admite dos miembros más cercanos que esa distancia: "hamming" cuenta
+  genes distintos y "decoded" es la distancia euclídea entre las variables decodificadas. Un
+  candidato cercano a un miembro sólo entra si es mejor que todos los miembros cercanos, y los reemplaza.
+  """
+
+  def __init__(self, maxsize, params, min_distance=0, distance="hamming"):
+    if distance not in ("hamming", "decoded"):
+      raise ValueError(f"Distancia desconocida: {distance}")
+    self.maxsize = maxsize
+    self.params = params
+    self.min_distance = min_distance
+    self.distance = distance
+    self.fitness = np.empty(maxsize, dtype=np.float64)
+    self.genomes = None
+    self.variables = None
+    self.keys = []
+    self.size = 0
+    self.duplicates = 0
+    self.too_close = 0
+    self._seen = set()
+
+  @staticmethod
+  def key(genome):
+    return hashlib.blake2b(genome.tobytes(), digest_size=16).digest()
+
+  def _decode(self, genome):
+    if functions.is_real_coded(self.params):
+      return genome.astype(np.float64)
+    r_min, r_max = self.params["var_range"]
+    return functions.decode_population(genome[None, :], r_min, r_max, self.params["n_vars"])[0]
+
+  def _distances(self, genome, variables):
+    if self.distance == "hamming":
+      return np.count_nonzero(self.genomes[:self.size] != genome, axis=1)
+    return np.sqrt(((self.variables[:self.size] - variables) ** 2).sum(axis=1))
+
+  def update(self, population):
+    """Agrega los individuos de la población que mejoran el archivo."""
+    if not len(population):
+      return
+    if self.genomes is None:
+      self.genomes = np.empty((self.maxsize, len(population[0])), dtype=functions.genome_dtype(self.params))
+      if self.distance == "decoded":
+        self.variables = np.empty((self.maxsize, self.params["n_vars"]), dtype=np.float64)
+
+    # wvalues evita la propiedad values, que arma una tupla por individuo; con FitnessMax (peso 1.0) coinciden.
+    fitness = np.fromiter((ind.fitness.wvalues[0] for ind in population), dtype=np.float64, count=len(population))
+    k = min(self.maxsize, len(fitness))
+    if k == len(fitness):
+      self._merge(population, fitness, np.argsort(-fitness, kind="stable"))
+      return
+    top = np.argpartition(-fitness, k - 1)[:k]
+    if self._merge(population, fitness, top[np.argsort(-fitness[top], kind="stable")]):
+      return
+    # Los k mejores traían duplicados: se sigue con el resto de la población que aún puede entrar.
+    rest = np.setdiff1d(np.arange(len(fitness)), top)
+    if self.size == self.maxsize:
+      rest = rest[fitness[rest] > self.fitness[self.size - 1]]
+    self._merge(population, fitness, rest[np.argsort(-fitness[rest], kind="stable")])
+
+  def _merge(self, population, fitness, order):
+    # Candidatos en orden decreciente: al primero que no supera al peor de un archivo lleno se termina.
+    for i in order:
+      if self.size == self.maxsize and fitness[i] <= self.fitness[self.size - 1]:
+        return True
+      self._insert(np.asarray(population[i], dtype=self.genomes.dtype), float(fitness[i]))
+    return False
+
+  def _insert(self, genome, value):
+    key = self.key(genome)
+    if key in self._seen:
+      self.duplicates += 1
+      return False
+
+    variables = self._decode(genome) if self.variables is not None else None
+    if self.min_distance and self.size:
+      close = np.flatnonzero(self._distances(genome, variables) < self.min_distance)
+      if len(close):
+        if self.fitness[close].max() >= value:
+          self.too_close += 1
+          return False
+        self._remove(close)
+
+    if self.size == self.maxsize:
+      self._seen.discard(self.keys.pop())
+      self.size -= 1
+    pos = int(np.searchsorted(-self.fitness[:self.size], -value, side="right"))
+    end = self.size
+    # NumPy resuelve el solapamiento de los cortes al desplazar una posición.
+    self.fitness[pos + 1:end + 1] = self.fitness[pos:end]
+    self.genomes[pos + 1:end + 1] = self.genomes[pos:end]
+    self.fitness[pos] = value
+    self.genomes[pos] = genome
+    if self.variables is not None:
+      self.variables[pos + 1:end + 1] = self.variables[pos:end]
+      self.variables[pos] = variables
+    self.keys.insert(pos, key)
+    self._seen.add(key)
+    self.size += 1
+    return True
+
+  def _remove(self, positions):
+    keep = np.ones(self.size, dtype=bool)
+    keep[positions] = False
+    n = int(keep.sum())
+    self.fitness[:n] = self.fitness[:self.size][keep]
+    self.genomes[:n] = self.genomes[:self.size][keep]
+    if self.variables is not None:
+      self.variables[:n] = self.variables[:self.size][keep]
+    for pos in positions:
+      self._seen.discard(self.keys[pos])
+    self.keys = [key for key, kept in zip(self.keys, keep) if kept]
+    self.size = n
+
+  def _individual(self, pos):
+    ind = creator.Individual(self.genomes[pos].tolist())
+    ind.fitness.values = (float(self.fitness[pos]),)
+    return ind
+
+  def __len__(self):
+    return self.size
+
+  def __getitem__(self, i):
+    if isinstance(i, slice):
+      return [self._individual(pos) for pos in range(*i.indices(self.size))]
+    if i < 0:
+      i += self.size
+    if not 0 <= i < self.size:
+      raise IndexError("índice fuera del archivo de élite")
+    return self._individual(i)
+
+  def __iter__(self):
+    return (self._individual(pos) for pos in range(self.size))
+
+  def values(self):
+    """Valor de la función objetivo (a minimizar) de cada miembro, del mejor al peor."""
+    return self.params["offset_roulette"] - self.fitness[:self.size]
+
+  def decoded(self):
+    """Matriz (miembros x n_vars) con las variables reales de cada miembro."""
+    if not self.size:
+      return np.zeros((0, self.params["n_vars"]))
+    if self.variables is not None:
+      return self.variables[:self.size].copy()
+    return np.array([self._decode(genome) for genome in self.genomes[:self.size]]).reshape(self.size, self.params["n_vars"])
+
+  def summary(self):
+    """Lista serializable (valor y variables de cada miembro) para resultados y análisis posterior."""
+    return [{"value": float(value), "vars": row} for value, row in zip(self.values(), self.decoded().tolist())]
+
+  def clear(self):
+    self.size = 0
+    self.keys = []
+    self._seen = set()
+
+def from_config(params, maxsize=None):
+  """Archivo con los parámetros ARCHIVE_* de config (maxsize reemplaza a config.ARCHIVE_SIZE)."""
+  maxsize = config.ARCHIVE_SIZE if maxsize is None else maxsize
+  return EliteArchive(maxsize, params, config.ARCHIVE_MIN_DISTANCE, config.ARCHIVE_DISTANCE)
\ No newline at end of file
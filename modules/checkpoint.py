@@ -0,0 +1,152 @@
+import json
+import pickle
+import random
+import time
+import numpy as np
+from deap import creator, tools
+import modules.functions as functions
+import modules.archive as archive
+import modules.storage as storage
+
+FORMAT_VERSION = 1
+
+def _pack(individuals, real_coded=False):
+  # Los genomas binarios se guardan empaquetados en bits; los reales, como float64.
+  if real_coded:
+    return np.array(individuals, dtype=np.float64).reshape(len(individuals), -1)
+  # bytes(ind) convierte cada lista de bits en C; np.array sobre listas de listas es el cuello de botella.
+  data = b"".join(map(bytes, individuals))
+  return np.packbits(np.frombuffer(data, dtype=np.uint8).reshape(len(individuals), -1), axis=1)
+
+def _unpack(data, n_genes, real_coded):
+  return data.copy() if real_coded else np.unpackbits(data, axis=1, count=n_genes)
+
+def _fitness(individuals):
+  # wvalues evita la tupla que arma la propiedad values; con FitnessMax (peso 1.0) coinciden.
+  return np.array([ind.fitness.wvalues[0] if ind.fitness.valid else np.nan for ind in individuals], dtype=np.float64)
+
+def save(path, gen, population, halloffame, logbook, problem_id, params, cxpb, mutpb, ngen,
+         evaluations=0, elapsed=0.0, stop=None, rng=random, rates=None):
+  """
+  Guarda el estado completo de la corrida al final de la generación `gen` en un único .npz:
+  población y hall of fame empaquetados en bits, fitness, tasas por individuo (adaptive, modo "self"),
+  logbook, estado de `rng` (por defecto `random`), criterio de parada, tasas vigentes del control
+  adaptativo (`rates`) y configuración del problema. La escritura es atómica (archivo temporal + os.replace).
+  """
+  version, internal, gauss_next = rng.getstate()
+  meta = {
+    "format": FORMAT_VERSION,
+    "gen": gen,
+    "ngen": ngen,
+    "problem_id": problem_id,
+    "params": params,
+    "cxpb": cxpb,
+    "mutpb": mutpb,
+    "n_bits": len(population[0]),
+    "hof_maxsize": halloffame.maxsize if halloffame is not None else 0,
+    "hof_archive": ({"min_distance": halloffame.min_distance, "distance": halloffame.distance}
+                    if isinstance(halloffame, archive.EliteArchive) else None),
+    "evaluations": evaluations,
+    "elapsed": elapsed,
+    "rng_version": version,
+    "rng_gauss_next": gauss_next,
+    "logbook_header": logbook.header,
+    "adaptation_rates": rates,
+  }
+  hof_items = list(halloffame) if halloffame is not None else []
+  real_coded = functions.is_real_coded(params)
+
+  arrays = {
+    "meta": np.frombuffer(storage.to_json(meta).encode("utf-8"), dtype=np.uint8),
+    "logbook": np.frombuffer(storage.to_json(list(logbook)).encode("utf-8"), dtype=np.uint8),
+    "population": _pack(population, real_coded),
+    "fitness": _fitness(population),
+    "hof": _pack(hof_items, real_coded) if hof_items else np.zeros((0, 0), dtype=np.uint8),
+    "hof_fitness": _fitness(hof_items),
+    "rng_state": np.array(internal, dtype=np.uint32),
+    "stop": np.frombuffer(pickle.dumps(stop), dtype=np.uint8),
+  }
+  if getattr(population[0], "rates", None) is not None:
+    arrays["rates"] = np.array([ind.rates for ind in population], dtype=np.float64)
+
+  with storage.atomic_write(path, "wb", prefix=".checkpoint-") as fh:
+    np.savez(fh, **arrays)
+
+def load(path):
+  """Lee un checkpoint y devuelve un diccionario con la configuración y el estado guardados."""
+  with np.load(path) as data:
+    meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+    records = json.loads(data["logbook"].tobytes().decode("utf-8"))
+    state = dict(meta)
+    real_coded = functions.is_real_coded(meta["params"])
+    state["population_bits"] = _unpack(data["population"], meta["n_bits"], real_coded)
+    state["fitness"] = data["fitness"].copy()
+    state["hof_bits"] = _unpack(data["hof"], meta["n_bits"], real_coded) if data["hof"].size else None
+    state["hof_fitness"] = data["hof_fitness"].copy()
+    state["rng_state"] = (meta["rng_version"], tuple(int(v) for v in data["rng_state"]), meta["rng_gauss_next"])
+    state["stop"] = pickle.loads(data["stop"].tobytes())
+    state["rates"] = data["rates"].copy() if "rates" in data.files else None
+
+  logbook = tools.Logbook()
+  logbook.header = meta["logbook_header"]
+  for record in records:
+    logbook.record(**record)
+  state["logbook"] = logbook
+  return state
+
+def _individuals(bits, fitness):
+  individuals = []
+  for row, value in zip(bits.tolist(), fitness.tolist()):
+    ind = creator.Individual(row)
+    if not np.isnan(value):
+      ind.fitness.values = (value,)
+    individuals.append(ind)
+  return individuals
+
+def restore_population(state):
+  """Reconstruye (population, halloffame) como objetos DEAP; requiere haber llamado a ga.setup_ga."""
+  population = _individuals(state["population_bits"], state["fitness"])
+  if state.get("rates") is not None:
+    for ind, rates in zip(population, state["rates"].tolist()):
+      ind.rates = tuple(rates)
+  hof = None
+  if state.get("hof_archive") is not None:
+    hof = archive.EliteArchive(state["hof_maxsize"], state["params"], **state["hof_archive"])
+  elif state["hof_maxsize"]:
+    hof = tools.HallOfFame(state["hof_maxsize"])
+  if hof is not None and state["hof_bits"] is not None:
+    hof.update(_individuals(state["hof_bits"], state["hof_fitness"]))
+  return population, hof
+
+class Checkpointer:
+  """
+  Decide cuándo guardar: cada `every_generations` generaciones y/o cada `every_seconds` segundos.
+  Un guardado programado se posterga mientras el anterior haya costado más que `max_overhead`
+  (por defecto 0.5 %, la mitad del 1 % admitido) del tiempo transcurrido desde entonces: con
+  generaciones muy cortas los checkpoints se espacian en lugar de pesar sobre la corrida.
+  None desactiva el límite.
+  """
+
+  def __init__(self, path, every_generations=None, every_seconds=None, max_overhead=0.005):
+    self.path = path
+    self.every_generations = every_generations
+    self.every_seconds = every_seconds
+    self.max_overhead = max_overhead
+    self.last_save = time.perf_counter()
+    self.last_cost = 0.0
+    self.pending = False
+
+  def due(self, gen):
+    since = time.perf_counter() - self.last_save
+    if self.every_generations and gen % self.every_generations == 0:
+      self.pending = True
+    if self.every_seconds and since >= self.every_seconds:
+      self.pending = True
+    return self.pending and (not self.max_overhead or self.last_cost <= self.max_overhead * since)
+
+  def save(self, **state):
+    start = time.perf_counter()
+    save(self.path, **state)
+    self.last_save = time.perf_counter()
+    self.last_cost = self.last_save - start
+    self.pending = False
\ No newline at end of file
@@ -0,0 +1,64 @@
+from collections import namedtuple
+import config.config as config
+
+class FrozenParams(dict):
+  """Diccionario de sólo lectura para los parámetros de un problema (se puede copiar y serializar)."""
+
+  def _readonly(self, *args, **kwargs):
+    raise TypeError("Los parámetros de una corrida son inmutables; use dict(params) para obtener una copia")
+
+  __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+
+  def __reduce__(self):
+    return FrozenParams, (dict(self),)
+
+def freeze(value):
+  if isinstance(value, dict):
+    return FrozenParams({key: freeze(item) for key, item in value.items()})
+  if isinstance(value, list):
+    return tuple(freeze(item) for item in value)
+  return value
+
+# Configuración inmutable de una corrida. Se pasa explícitamente a ga.setup_ga y evolution.evolve,
+# de modo que varias corridas pueden convivir en hilos o procesos sin tocar el módulo config.
+RunConfig = namedtuple("RunConfig", [
+  "problem_id", "params", "cxpb", "mutpb", "indpb", "eval_mode", "n_workers", "chunk_size",
+  "cache_size", "incremental", "roulette_method", "seed",
+])
+
+def from_config(problem_id=None, seed=None, **overrides):
+  """
+  Toma una instantánea de config (problema y opciones globales) y la devuelve como RunConfig.
+  `overrides` acepta campos de RunConfig (cxpb, mutpb, ...) o claves de config.PROBLEMS
+  (population_size, generations, ...). Con `seed`, la corrida usa su propio random.Random.
+  """
+  problem_id = config.PROBLEM_ID if problem_id is None else problem_id
+  params = dict(config.get_problem_config(problem_id))
+  fields = {}
+  for key, value in overrides.items():
+    if key in RunConfig._fields:
+      fields[key] = value
+    else:
+      params[key] = value
+
+  # MUTATION_PROB es una tasa de bits: en codificación real (indpb = 1/n_vars) casi no habría mutaciones
+  # y la corrida se estanca, así que ahí mutpb sale del bloque "real_coded" del problema.
+  mutpb = config.MUTATION_PROB
+  if params.get("encoding", "binary") == "real":
+    mutpb = params["real_coded"].get("mutpb") or mutpb
+
+  run = RunConfig(
+    problem_id=problem_id,
+    params=freeze(params),
+    cxpb=config.CROSSOVER_PROB,
+    mutpb=mutpb,
+    indpb=config.MUTATION_PROB,
+    eval_mode=config.EVALUATION_MODE,
+    n_workers=config.N_WORKERS,
+    chunk_size=config.CHUNK_SIZE,
+    cache_size=config.FITNESS_CACHE_SIZE,
+    incremental=config.INCREMENTAL_EVALUATION,
+    roulette_method=config.ROULETTE_METHOD,
+    seed=seed,
+  )
+  return run._replace(**fields)
\ No newline at end of file
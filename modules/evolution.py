@@ -0,0 +1,225 @@
+import random
+import threading
+import time
+from collections import namedtuple
+import numpy as np
+from deap import tools
+import config.config as config
+import modules.functions as functions
+import modules.ga as ga
+import modules.stopping as stopping
+import modules.memetic as memetic
+import modules.adaptive as adaptive
+import modules.profiling as profiling
+import modules.metrics as metrics
+
+# Resumen liviano de una generación, pensado para actualizar interfaces en vivo.
+Snapshot = namedtuple("Snapshot", ["gen", "ngen", "nevals", "best_fitness", "avg_fitness", "best_vars", "gen_time", "elapsed"])
+
+class CancelToken:
+  """Señal de cancelación compartida entre el hilo de la interfaz y el ciclo evolutivo."""
+
+  def __init__(self):
+    self._event = threading.Event()
+
+  def cancel(self):
+    self._event.set()
+
+  @property
+  def cancelled(self):
+    return self._event.is_set()
+
+def evolve(population, toolbox, cxpb, mutpb, ngen, stats=None, halloffame=None, cancel=None, params=None,
+           stop=None, verbose=False, checkpointer=None, resume=None, instrument=False, profiler=None, run=None,
+           local_search=None, tracer=None, adaptation=None):
+  """
+  Versión generadora de algorithms.eaSimple: mismo orden de operaciones (y, con la misma
+  semilla, mismos resultados), pero produce un Snapshot al terminar cada generación.
+  La población se actualiza en el lugar; al agotarse, el generador devuelve (population, logbook).
+
+  `stop` es un criterio de modules.stopping; por defecto se construye desde params["stopping"]
+  y con stop=False sólo se detiene al completar ngen.
+  El motivo de parada queda en logbook.stop_reason y en la columna stop_reason del último registro.
+
+  Con un checkpoint.Checkpointer se guarda el estado periódicamente; `resume` es el diccionario de
+  checkpoint.load() y continúa la corrida desde la generación siguiente con el mismo estado de toolbox.rng.
+
+  `run` (context.RunConfig) fija problema y parámetros; por defecto se usa toolbox.run si existe
+  y, si no, la configuración global.
+
+  Con instrument=True cada registro incluye el tiempo de cada fase (profiling.PHASES), t_total,
+  las evaluaciones acumuladas y el pico de memoria. `profiler` es un gancho de modules.profiling
+  (CProfileHook, SamplingProfilerHook) que se activa en las generaciones que él elija.
+
+  `local_search` es una etapa de modules.memetic que refina a los mejores individuos tras evaluar;
+  por defecto se construye desde params["local_search"] y con local_search=False se omite. Sus
+  evaluaciones se suman a nevals (y al presupuesto de los criterios de parada) y quedan en ls_evals.
+
+  Con un trace.Tracer, cada generación muestreada (tracer.due) se envía a la traza junto con las
+  posiciones de los padres de cada hijo en la generación anterior.
+
+  `adaptation` es un adaptive.RateControl que elige cxpb, mutpb e indpb en cada generación (los
+  argumentos cxpb y mutpb son entonces las tasas iniciales); por defecto se construye desde
+  params["adaptation"] y con adaptation=False se usan tasas fijas. Las tasas usadas quedan en las
+  columnas cxpb, mutpb e indpb del logbook.
+  """
+  run = getattr(toolbox, "run", None) if run is None else run
+  if params is None:
+    params = run.params if run is not None else config.get_problem_config()
+  problem_id = run.problem_id if run is not None else config.PROBLEM_ID
+  rng = getattr(toolbox, "rng", random)
+  if stop is None:
+    stop = stopping.from_config(params.get("stopping"))
+  elif stop is False:
+    stop = None
+  if local_search is None:
+    local_search = memetic.from_config(problem_id, params)
+  elif local_search is False:
+    local_search = None
+  if adaptation is None:
+    indpb = getattr(toolbox.mutate, "keywords", {}).get("indpb", run.indpb if run is not None else config.MUTATION_PROB)
+    adaptation = adaptive.from_config(params, cxpb, mutpb, indpb)
+  elif adaptation is False:
+    adaptation = None
+  logbook = tools.Logbook()
+  logbook.header = ["gen", "nevals"] + (["ls_evals"] if local_search else []) + (list(adaptive.RATES) if adaptation else [])
+  logbook.header += stats.fields if stats else []
+  if instrument:
+    logbook.header += profiling.PHASES + ["t_total", "evals", "mem_peak_mb"]
+  start = time.perf_counter()
+  evaluations = 0
+  reason = "generations"
+  first_gen = 0
+
+  if resume is not None:
+    logbook = resume["logbook"]
+    evaluations = resume["evaluations"]
+    start -= resume["elapsed"]
+    first_gen = resume["gen"] + 1
+    if resume["stop"] is not None:
+      stop = resume["stop"]
+    rng.setstate(resume["rng_state"])
+    if adaptation is not None and resume.get("adaptation_rates"):
+      adaptation.resume(resume["adaptation_rates"])
+
+  for gen in range(first_gen, ngen + 1):
+    # La generación 0 siempre se completa para que el hall of fame tenga un individuo.
+    if gen > 0 and cancel is not None and cancel.cancelled:
+      reason = "cancelled"
+      break
+    if profiler is not None:
+      profiler.before_generation(gen)
+    gen_start = time.perf_counter()
+
+    traced = tracer is not None and tracer.due(gen)
+    parents = lineage = None
+    if gen > 0:
+      if traced and tracer.wants_lineage:
+        positions = {id(ind): i for i, ind in enumerate(population)}
+        offspring = toolbox.select(population, len(population))
+        parents = np.fromiter((positions[id(ind)] for ind in offspring), dtype=np.int32, count=len(offspring))
+        lineage = (np.full(len(offspring), -1, dtype=np.int32), np.zeros(len(offspring), dtype=np.int8))
+      else:
+        offspring = toolbox.select(population, len(population))
+      t_select = time.perf_counter()
+      if adaptation is not None:
+        population[:] = adaptation.vary(offspring, toolbox, lineage)
+      else:
+        population[:] = ga.var_and(offspring, toolbox, cxpb, mutpb, lineage)
+    else:
+      t_select = gen_start
+    t_vary = time.perf_counter()
+
+    invalid_ind = [ind for ind in population if not ind.fitness.valid]
+    fitnesses = toolbox.map(toolbox.evaluate, invalid_ind)
+    for ind, fit in zip(invalid_ind, fitnesses):
+      ind.fitness.values = fit
+    nevals = len(invalid_ind)
+    if adaptation is not None and gen > 0:
+      adaptation.update(population)
+    if local_search is not None and local_search.due(gen):
+      ls_evals = local_search.refine(population)
+      nevals += ls_evals
+    else:
+      ls_evals = 0
+    t_evaluate = time.perf_counter()
+
+    if halloffame is not None:
+      halloffame.update(population)
+    t_hof = time.perf_counter()
+
+    # FitnessStatistics recibe la generación para que la diversidad no dependa de su propio contador al reanudar.
+    if isinstance(stats, metrics.FitnessStatistics):
+      record = stats.compile(population, gen=gen)
+    else:
+      record = stats.compile(population) if stats else {}
+    t_stats = time.perf_counter()
+    evaluations += nevals
+
+    if instrument:
+      record.update(
+        t_select=t_select - gen_start, t_vary=t_vary - t_select, t_evaluate=t_evaluate - t_vary,
+        t_hof=t_hof - t_evaluate, t_stats=t_stats - t_hof, t_total=t_stats - gen_start,
+        evals=evaluations, mem_peak_mb=profiling.peak_memory_mb()
+      )
+    if local_search is not None:
+      record["ls_evals"] = ls_evals
+    if adaptation is not None:
+      record.update(adaptation.used)
+    logbook.record(gen=gen, nevals=nevals, **record)
+    if verbose:
+      print(logbook.stream)
+    if profiler is not None:
+      profiler.after_generation(gen)
+    if traced:
+      tracer.record(gen, population, parents, *(lineage or (None, None)))
+
+    best = max(population, key=lambda ind: ind.fitness.values[0])
+    fitness_values = [ind.fitness.values[0] for ind in population]
+    now = time.perf_counter()
+    stop_reason = None
+    if stop is not None:
+      progress = stopping.Progress(gen, params["offset_roulette"] - best.fitness.values[0], evaluations, now - start)
+      stop_reason = stop.check(progress)
+
+    if checkpointer is not None and (checkpointer.due(gen) or stop_reason or gen == ngen):
+      checkpointer.save(
+        gen=gen, population=population, halloffame=halloffame, logbook=logbook,
+        problem_id=problem_id, params=params, cxpb=cxpb, mutpb=mutpb, ngen=ngen,
+        evaluations=evaluations, elapsed=time.perf_counter() - start, stop=stop, rng=rng,
+        rates=adaptation.rates if adaptation is not None else None
+      )
+
+    yield Snapshot(
+      gen=gen,
+      ngen=ngen,
+      nevals=nevals,
+      best_fitness=best.fitness.values[0],
+      avg_fitness=sum(fitness_values) / len(fitness_values),
+      best_vars=functions.decode_individual(best, params),
+      gen_time=now - gen_start,
+      elapsed=now - start
+    )
+
+    if stop_reason:
+      reason = stop_reason
+      break
+
+  logbook.stop_reason = reason
+  if len(logbook):
+    logbook[-1]["stop_reason"] = reason
+  return population, logbook
+
+def run(population, toolbox, cxpb, mutpb, ngen, stats=None, halloffame=None, cancel=None, params=None,
+        on_generation=None, stop=None, verbose=False, checkpointer=None, resume=None, instrument=False, profiler=None,
+        run=None, local_search=None, tracer=None, adaptation=None):
+  """Consume evolve() llamando a on_generation(snapshot) en cada generación; devuelve (population, logbook)."""
+  generator = evolve(population, toolbox, cxpb, mutpb, ngen, stats, halloffame, cancel, params, stop, verbose,
+                     checkpointer, resume, instrument, profiler, run, local_search, tracer, adaptation)
+  while True:
+    try:
+      snapshot = next(generator)
+    except StopIteration as finished:
+      return finished.value
+    if on_generation is not None:
+      on_generation(snapshot)
\ No newline at end of file
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 import config.config as config
 
 def decode_chromosome(individual, r_min, r_max, n_vars):
@@ -8,21 +9,42 @@ def decode_chromosome(individual, r_min, r_max, n_vars):
 
   for i in range(n_vars):
     chunk = individual[i*bits_per_chunk : (i+1)*bits_per_chunk]
-    int_value = int("".join(map(str, chunk)), 2)
-    real_value = r_min + (int_value / max_value) * (r_max - r_min)
-    variables.append(real_value)
+    variables.append(decode_variable(chunk, r_min, r_max, max_value))
   return variables
 
-def evaluate_fitness(individual):
-  PARAMS = config.get_problem_config()
+def decode_variable(chunk, r_min, r_max, max_value):
+  int_value = int("".join(map(str, chunk)), 2)
+  return r_min + (int_value / max_value) * (r_max - r_min)
 
-  x = decode_chromosome(individual=individual, r_min=PARAMS["var_range"][0], r_max=PARAMS["var_range"][1], n_vars=PARAMS["n_vars"])
+def schwefel_term(xi):
+  return -xi * math.sin(math.sqrt(abs(xi)))
+
+# Problemas separables (ver "separable" en config.PROBLEMS): contribución de cada variable
+VARIABLE_TERMS = {
+  1: schwefel_term,
+}
+
+def is_real_coded(params):
+  return params.get("encoding", "binary") == "real"
+
+def decode_individual(individual, params):
+  """Variables reales de un individuo: los genes mismos en codificación real o el cromosoma decodificado."""
+  if is_real_coded(params):
+    return list(individual)
+  return decode_chromosome(individual, params["var_range"][0], params["var_range"][1], params["n_vars"])
+
+def evaluate_fitness(individual, problem_id=None, params=None):
+  # Sin problem_id/params lee la configuración global; setup_ga los fija con los de la corrida.
+  problem_id = config.PROBLEM_ID if problem_id is None else problem_id
+  PARAMS = config.get_problem_config(problem_id) if params is None else params
+
+  x = decode_individual(individual, PARAMS)
   val_function = 0.0
 
-  if config.PROBLEM_ID == 1: # Schewefel
-    val_function = sum([-xi * math.sin(math.sqrt(abs(xi))) for xi in x])
+  if problem_id == 1: # Schewefel
+    val_function = sum([schwefel_term(xi) for xi in x])
 
-  elif config.PROBLEM_ID == 2: # Six-Hump Camel Back
+  elif problem_id == 2: # Six-Hump Camel Back
     x1, x2 = x[0], x[1]
     term1 = 4 * x1**2 - 2.1 * x1**4 + (1/3) * x1**6
     term2 = x1 * x2
@@ -32,3 +54,77 @@ def evaluate_fitness(individual):
   fitness_roulette = PARAMS["offset_roulette"] - val_function
   return fitness_roulette,
 
+def decode_population(bits, r_min, r_max, n_vars):
+  """
+  Decodifica una matriz de bits (individuos x bits) a una matriz de variables reales.
+  Cada fragmento se convierte a entero con un único producto matriz-vector contra las
+  potencias de dos, equivalente a decode_chromosome para cada fila.
+  """
+  bits = np.asarray(bits)
+  bits_per_chunk = bits.shape[1] // n_vars
+  max_value = 2**bits_per_chunk - 1
+  weights = 2 ** np.arange(bits_per_chunk - 1, -1, -1, dtype=np.int64)
+
+  chunks = bits[:, :n_vars * bits_per_chunk].reshape(bits.shape[0], n_vars, bits_per_chunk)
+  int_values = chunks.astype(np.int64) @ weights
+  return r_min + (int_values / max_value) * (r_max - r_min)
+
+def chromosome_codes(bits, n_vars):
+  """Entero (0 .. 2**bits_per_var - 1) que codifica cada variable de cada fila de una matriz de bits."""
+  bits = np.asarray(bits)
+  bits_per_chunk = bits.shape[1] // n_vars
+  weights = 2 ** np.arange(bits_per_chunk - 1, -1, -1, dtype=np.int64)
+  chunks = bits[:, :n_vars * bits_per_chunk].reshape(bits.shape[0], n_vars, bits_per_chunk)
+  return chunks.astype(np.int64) @ weights
+
+def encode_codes(codes, bits_per_var):
+  """Inversa de chromosome_codes: matriz de bits (uint8) con bits_per_var bits por variable, el más significativo primero."""
+  codes = np.asarray(codes, dtype=np.int64)
+  shifts = np.arange(bits_per_var - 1, -1, -1, dtype=np.int64)
+  bits = (codes[:, :, None] >> shifts) & 1
+  return bits.reshape(codes.shape[0], -1).astype(np.uint8)
+
+def _libm_power(x, exponent):
+  # np.power usa una implementación SIMD que difiere de la libm en el último ulp;
+  # se delega en pow() de Python para obtener exactamente los mismos valores.
+  return np.array([xi**exponent for xi in x.tolist()], dtype=np.float64)
+
+def genome_dtype(params):
+  return np.float64 if is_real_coded(params) else np.uint8
+
+def evaluate_population(bits, problem_id=None, params=None):
+  """
+  Evalúa toda la población de una vez a partir de una matriz de bits 2-D (o, en codificación
+  real, de la matriz de variables, sin decodificar).
+  Devuelve un arreglo con el fitness de ruleta de cada fila, idéntico al de evaluate_fitness.
+  """
+  if problem_id is None:
+    problem_id = config.PROBLEM_ID
+  if params is None:
+    params = config.get_problem_config(problem_id)
+
+  if is_real_coded(params):
+    x = np.asarray(bits, dtype=np.float64)
+  else:
+    x = decode_population(bits, r_min=params["var_range"][0], r_max=params["var_range"][1], n_vars=params["n_vars"])
+
+  return params["offset_roulette"] - objective_values(x, problem_id)
+
+def objective_values(x, problem_id):
+  """Valor de la función objetivo (a minimizar) para cada fila de una matriz de variables reales."""
+  x = np.asarray(x, dtype=np.float64)
+  val_function = np.zeros(x.shape[0])
+
+  if problem_id == 1: # Schewefel
+    terms = -x * np.sin(np.sqrt(np.abs(x)))
+    # sum() por fila conserva el mismo orden de acumulación que la versión escalar.
+    val_function = np.array([sum(row) for row in terms.tolist()], dtype=np.float64)
+
+  elif problem_id == 2: # Six-Hump Camel Back
+    x1, x2 = x[:, 0], x[:, 1]
+    term1 = 4 * _libm_power(x1, 2) - 2.1 * _libm_power(x1, 4) + (1/3) * _libm_power(x1, 6)
+    term2 = x1 * x2
+    term3 = -4 * _libm_power(x2, 2) + 4 * _libm_power(x2, 4)
+    val_function = term1 + term2 + term3
+
+  return val_function
\ No newline at end of file
@@ -1,28 +1,553 @@
+import functools
+import hashlib
 import random
+import time
+from collections import OrderedDict
+import numpy as np
 from deap import base, creator, tools
 import config.config as config
 import modules.functions as functions
+import modules.parallel as parallel
+import modules.metrics as metrics
+import modules.context as context
 
-def setup_ga():
-  params = config.get_problem_config()
+def roulette_indices(fitness, k, rng):
+  """Índices de k giros de ruleta proporcionales al fitness, vía suma acumulada y búsqueda binaria."""
+  cumulative = np.cumsum(fitness)
+  spins = rng.random(k) * cumulative[-1]
+  return np.minimum(np.searchsorted(cumulative, spins, side="right"), len(cumulative) - 1)
 
-  if hasattr(creator, "FitnessMax"): del creator.FitnessMax
-  if hasattr(creator, "Individual"): del creator.Individual
+def sel_roulette(individuals, k, fit_attr="fitness", rng=None, source=random):
+  """
+  Reemplazo directo de tools.selRoulette: misma distribución de selección, pero construye la
+  suma acumulada una vez y resuelve los k giros con una sola búsqueda binaria vectorizada.
+  Sin `rng`, el generador se siembra desde `source` (por defecto `random`, así que random.seed()
+  sigue fijando la corrida; setup_ga pasa el random.Random propio de la corrida si lo tiene).
+  """
+  if rng is None:
+    rng = np.random.default_rng(source.getrandbits(64))
+  fitness = np.fromiter((getattr(ind, fit_attr).values[0] for ind in individuals), dtype=np.float64, count=len(individuals))
+  return [individuals[i] for i in roulette_indices(fitness, k, rng)]
 
-  creator.create("FitnessMax", base.Fitness, weights=(1.0,))
-  creator.create("Individual", list, fitness=creator.FitnessMax)
+class BatchEvaluator:
+  """
+  Evaluador de poblaciones completas. Se registra como toolbox.evaluate y, junto con
+  evaluation_map, permite que eaSimple evalúe toda la descendencia en una sola llamada.
+  """
+
+  def __init__(self, problem_id=None, params=None):
+    self.problem_id = config.PROBLEM_ID if problem_id is None else problem_id
+    self.params = dict(config.get_problem_config(self.problem_id) if params is None else params)
+
+  def __call__(self, individual):
+    return self.batch([individual])[0]
+
+  def batch(self, individuals):
+    if not individuals:
+      return []
+    bits = np.array(individuals, dtype=functions.genome_dtype(self.params))
+    fitness = functions.evaluate_population(bits, problem_id=self.problem_id, params=self.params)
+    return [(value,) for value in fitness.tolist()]
+
+def evaluation_map(func, iterable):
+  """map compatible con DEAP que usa la evaluación por lotes (o el pool de procesos) cuando la función la ofrece."""
+  batch = getattr(getattr(func, "func", func), "batch", None)
+  if batch is None:
+    return list(map(func, iterable))
+  return batch(list(iterable))
+
+class FitnessCache:
+  """
+  Memoización del fitness por genoma con desalojo LRU. Envuelve a toolbox.evaluate
+  (función por individuo o evaluador por lotes) y cuenta aciertos, fallos y desalojos.
+  """
+
+  def __init__(self, evaluate, maxsize):
+    self.evaluate = evaluate
+    self.maxsize = maxsize
+    self.entries = OrderedDict()
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+    self._reported = {}
+
+  @staticmethod
+  def key(individual):
+    return hashlib.blake2b(np.asarray(individual).tobytes(), digest_size=16).digest()
+
+  def __call__(self, individual):
+    return self.batch([individual])[0]
+
+  def batch(self, individuals):
+    results = [None] * len(individuals)
+    pending = {}
+
+    for i, ind in enumerate(individuals):
+      key = self.key(ind)
+      if key in self.entries:
+        self.entries.move_to_end(key)
+        results[i] = self.entries[key]
+        self.hits += 1
+      elif key in pending:
+        pending[key][1].append(i)
+        self.hits += 1
+      else:
+        pending[key] = (ind, [i])
+        self.misses += 1
+
+    if pending:
+      misses = [ind for ind, _ in pending.values()]
+      inner_batch = getattr(self.evaluate, "batch", None)
+      values = inner_batch(misses) if inner_batch else [self.evaluate(ind) for ind in misses]
+      for (key, (_, positions)), value in zip(pending.items(), values):
+        self._store(key, value)
+        for i in positions:
+          results[i] = value
+
+    return results
+
+  def _store(self, key, value):
+    self.entries[key] = value
+    if len(self.entries) > self.maxsize:
+      self.entries.popitem(last=False)
+      self.evictions += 1
+
+  def counter(self, name):
+    """Función para tools.Statistics que devuelve el incremento del contador desde la generación anterior."""
+    def delta(_):
+      current = getattr(self, name)
+      previous = self._reported.get(name, 0)
+      self._reported[name] = current
+      return current - previous
+    return delta
+
+class DeltaEvaluator:
+  """
+  Evaluación incremental para problemas separables. Cada individuo guarda en `terms` la
+  contribución de cada variable y en `dirty` las variables cuyos bits cambiaron; sólo éstas
+  se decodifican y recalculan. La suma se rehace completa, así que el resultado es idéntico
+  al de una evaluación completa.
+  """
+
+  def __init__(self, problem_id=None, params=None):
+    self.problem_id = config.PROBLEM_ID if problem_id is None else problem_id
+    self.params = dict(config.get_problem_config(self.problem_id) if params is None else params)
+    self.term = functions.VARIABLE_TERMS[self.problem_id]
+    self.bits_per_var = self.params["bits_per_var"]
+    self.max_value = 2**self.bits_per_var - 1
+
+  def __call__(self, individual):
+    terms = getattr(individual, "terms", None)
+    if terms is None:
+      terms = [0.0] * self.params["n_vars"]
+      dirty = range(self.params["n_vars"])
+    else:
+      dirty = individual.dirty
+
+    r_min, r_max = self.params["var_range"]
+    bpv = self.bits_per_var
+    for i in dirty:
+      xi = functions.decode_variable(individual[i*bpv : (i+1)*bpv], r_min, r_max, self.max_value)
+      terms[i] = self.term(xi)
+
+    individual.terms = terms
+    individual.dirty = set()
+    return self.params["offset_roulette"] - sum(terms),
+
+  def batch(self, individuals):
+    return [self(ind) for ind in individuals]
+
+def cx_one_point(ind1, ind2, rng=random):
+  """tools.cxOnePoint con la fuente de azar explícita (con `random` da exactamente el mismo resultado)."""
+  size = min(len(ind1), len(ind2))
+  cxpoint = rng.randint(1, size - 1)
+  ind1[cxpoint:], ind2[cxpoint:] = ind2[cxpoint:], ind1[cxpoint:]
+  return ind1, ind2
+
+def mut_flip_bit(individual, indpb, rng=random):
+  """tools.mutFlipBit con la fuente de azar explícita."""
+  for i in range(len(individual)):
+    if rng.random() < indpb:
+      individual[i] = type(individual[i])(not individual[i])
+  return individual,
+
+# Bits de lineage[1] en var_and: operadores que produjeron a cada hijo.
+OP_CROSSOVER = 1
+OP_MUTATION = 2
+
+def var_and(population, toolbox, cxpb, mutpb, lineage=None, indpb=None):
+  """
+  algorithms.varAnd usando toolbox.rng, para que cada corrida consuma sólo su propio generador.
+  Con lineage=(mates, ops) (arreglos de len(population)) anota, para cada hijo, la posición de su
+  pareja de cruce (-1 si no se cruzó) y sus operadores (OP_CROSSOVER, OP_MUTATION).
+  cxpb, mutpb e `indpb` (que reemplaza al indpb de toolbox.mutate) pueden ser secuencias con una
+  tasa por individuo; una pareja se cruza con la media de las dos tasas.
+  """
+  rng = getattr(toolbox, "rng", random)
+  offspring = [toolbox.clone(ind) for ind in population]
+  per_cx = np.ndim(cxpb) > 0
+  per_mut = np.ndim(mutpb) > 0
+  per_ind = np.ndim(indpb) > 0
+
+  for i in range(1, len(offspring), 2):
+    if rng.random() < ((cxpb[i - 1] + cxpb[i]) / 2 if per_cx else cxpb):
+      offspring[i - 1], offspring[i] = toolbox.mate(offspring[i - 1], offspring[i])
+      del offspring[i - 1].fitness.values, offspring[i].fitness.values
+      if lineage is not None:
+        lineage[0][i - 1], lineage[0][i] = i, i - 1
+        lineage[1][i - 1] |= OP_CROSSOVER
+        lineage[1][i] |= OP_CROSSOVER
+
+  for i in range(len(offspring)):
+    if rng.random() < (mutpb[i] if per_mut else mutpb):
+      if indpb is None:
+        offspring[i], = toolbox.mutate(offspring[i])
+      else:
+        offspring[i], = toolbox.mutate(offspring[i], indpb=indpb[i] if per_ind else indpb)
+      del offspring[i].fitness.values
+      if lineage is not None:
+        lineage[1][i] |= OP_MUTATION
+
+  return offspring
+
+def cx_one_point_delta(ind1, ind2, bits_per_var, rng=random):
+  """tools.cxOnePoint que además intercambia las contribuciones por variable ya calculadas."""
+  size = min(len(ind1), len(ind2))
+  cxpoint = rng.randint(1, size - 1)
+  ind1[cxpoint:], ind2[cxpoint:] = ind2[cxpoint:], ind1[cxpoint:]
+
+  terms1, terms2 = getattr(ind1, "terms", None), getattr(ind2, "terms", None)
+  if terms1 is None or terms2 is None:
+    ind1.terms = ind2.terms = None
+    return ind1, ind2
+
+  cut_var = cxpoint // bits_per_var
+  first = cut_var if cxpoint % bits_per_var == 0 else cut_var + 1
+  terms1[first:], terms2[first:] = terms2[first:], terms1[first:]
+
+  dirty1 = {i for i in ind1.dirty if i < first} | {i for i in ind2.dirty if i >= first}
+  dirty2 = {i for i in ind2.dirty if i < first} | {i for i in ind1.dirty if i >= first}
+  if first != cut_var:
+    dirty1.add(cut_var)
+    dirty2.add(cut_var)
+  ind1.dirty, ind2.dirty = dirty1, dirty2
+  return ind1, ind2
+
+def mut_flip_bit_delta(individual, indpb, bits_per_var, rng=random):
+  """tools.mutFlipBit que marca como pendientes las variables de los bits invertidos."""
+  dirty = getattr(individual, "dirty", None)
+  for i in range(len(individual)):
+    if rng.random() < indpb:
+      individual[i] = type(individual[i])(not individual[i])
+      if dirty is not None:
+        dirty.add(i // bits_per_var)
+  return individual,
+
+def _numpy_rng(rng):
+  # Generador numpy de un solo uso sembrado desde la fuente de azar de la corrida.
+  return np.random.default_rng(rng.getrandbits(64))
+
+def cx_sbx(ind1, ind2, eta, low, up, rng=random):
+  """
+  Cruce binario simulado (SBX) acotado, vectorizado sobre los genes: cada gen se cruza con
+  probabilidad 0.5 y los hijos se recortan a [low, up].
+  """
+  gen = _numpy_rng(rng)
+  x1, x2 = np.array(ind1, dtype=np.float64), np.array(ind2, dtype=np.float64)
+  y1, y2 = np.minimum(x1, x2), np.maximum(x1, x2)
+  spread = y2 - y1
+  active = (gen.random(len(x1)) < 0.5) & (spread > 1e-14)
+  spread = np.where(active, spread, 1.0)
+  u = gen.random(len(x1))
+
+  def betaq(beta):
+    alpha = 2.0 - beta ** -(eta + 1)
+    return np.where(u <= 1.0 / alpha, (u * alpha) ** (1.0 / (eta + 1)), (1.0 / (2.0 - u * alpha)) ** (1.0 / (eta + 1)))
+
+  c1 = 0.5 * (y1 + y2 - betaq(1.0 + 2.0 * (y1 - low) / spread) * spread)
+  c2 = 0.5 * (y1 + y2 + betaq(1.0 + 2.0 * (up - y2) / spread) * spread)
+  c1, c2 = np.clip(c1, low, up), np.clip(c2, low, up)
+  swap = gen.random(len(x1)) < 0.5
+  c1, c2 = np.where(swap, c2, c1), np.where(swap, c1, c2)
+
+  ind1[:] = np.where(active, c1, x1).tolist()
+  ind2[:] = np.where(active, c2, x2).tolist()
+  return ind1, ind2
+
+def cx_blend(ind1, ind2, alpha, low, up, rng=random):
+  """Cruce BLX-alpha vectorizado: cada gen del hijo cae en el intervalo de los padres extendido en alpha."""
+  gen = _numpy_rng(rng)
+  x1, x2 = np.array(ind1, dtype=np.float64), np.array(ind2, dtype=np.float64)
+  gamma = (1.0 + 2.0 * alpha) * gen.random(len(x1)) - alpha
+  ind1[:] = np.clip((1.0 - gamma) * x1 + gamma * x2, low, up).tolist()
+  ind2[:] = np.clip(gamma * x1 + (1.0 - gamma) * x2, low, up).tolist()
+  return ind1, ind2
+
+def mut_polynomial(individual, eta, low, up, indpb, rng=random):
+  """Mutación polinomial acotada (Deb), vectorizada: cada gen muta con probabilidad indpb."""
+  gen = _numpy_rng(rng)
+  x = np.array(individual, dtype=np.float64)
+  mutate = gen.random(len(x)) < indpb
+  if not mutate.any():
+    return individual,
+
+  delta1, delta2 = (x - low) / (up - low), (up - x) / (up - low)
+  u = gen.random(len(x))
+  power = 1.0 / (eta + 1.0)
+  left = (2.0 * u + (1.0 - 2.0 * u) * (1.0 - delta1) ** (eta + 1.0)) ** power - 1.0
+  right = 1.0 - (2.0 * (1.0 - u) + 2.0 * (u - 0.5) * (1.0 - delta2) ** (eta + 1.0)) ** power
+  deltaq = np.where(u < 0.5, left, right)
+
+  individual[:] = np.where(mutate, np.clip(x + deltaq * (up - low), low, up), x).tolist()
+  return individual,
+
+def mut_gaussian(individual, sigma, low, up, indpb, rng=random):
+  """Mutación gaussiana acotada; `sigma` es una fracción del ancho de var_range."""
+  gen = _numpy_rng(rng)
+  x = np.array(individual, dtype=np.float64)
+  mutate = gen.random(len(x)) < indpb
+  noise = gen.normal(0.0, sigma * (up - low), len(x))
+  individual[:] = np.where(mutate, np.clip(x + noise, low, up), x).tolist()
+  return individual,
+
+def _register_real_coded(toolbox, run):
+  """Genoma de float64 en var_range con cruce SBX/BLX y mutación polinomial/gaussiana (params["real_coded"])."""
+  params = run.params
+  options = params["real_coded"]
+  low, up = params["var_range"]
+  indpb = options["indpb"] or 1.0 / params["n_vars"]
+
+  toolbox.register("attr_float", toolbox.rng.uniform, low, up)
+  toolbox.register("individual", tools.initRepeat, creator.Individual, toolbox.attr_float, params["n_vars"])
+  toolbox.register("population", tools.initRepeat, list, toolbox.individual)
+
+  if options["crossover"] == "sbx":
+    toolbox.register("mate", cx_sbx, eta=options["eta_c"], low=low, up=up, rng=toolbox.rng)
+  elif options["crossover"] == "blend":
+    toolbox.register("mate", cx_blend, alpha=options["alpha"], low=low, up=up, rng=toolbox.rng)
+  else:
+    raise ValueError(f"Cruce real desconocido: {options['crossover']}")
+
+  if options["mutation"] == "polynomial":
+    toolbox.register("mutate", mut_polynomial, eta=options["eta_m"], low=low, up=up, indpb=indpb, rng=toolbox.rng)
+  elif options["mutation"] == "gaussian":
+    toolbox.register("mutate", mut_gaussian, sigma=options["sigma"], low=low, up=up, indpb=indpb, rng=toolbox.rng)
+  else:
+    raise ValueError(f"Mutación real desconocida: {options['mutation']}")
+
+def register_cache_stats(toolbox, stats):
+  """Agrega al logbook los aciertos, fallos y desalojos de la caché de fitness por generación."""
+  cache = getattr(toolbox, "fitness_cache", None)
+  if cache is None:
+    return
+  stats.register("cache_hits", cache.counter("hits"))
+  stats.register("cache_misses", cache.counter("misses"))
+  stats.register("cache_evictions", cache.counter("evictions"))
+
+def _ensure_creator():
+  # Las clases se crean una sola vez por proceso y no se vuelven a borrar: otras corridas
+  # (hilos de Streamlit, procesos del pool) pueden estar usándolas al mismo tiempo.
+  if not hasattr(creator, "FitnessMax"):
+    creator.create("FitnessMax", base.Fitness, weights=(1.0,))
+  if not hasattr(creator, "Individual"):
+    creator.create("Individual", list, fitness=creator.FitnessMax)
+
+def setup_ga(eval_mode=None, n_workers=None, chunk_size=None, cache_size=None, incremental=None, run=None):
+  """
+  Construye el toolbox de una corrida a partir de `run` (context.RunConfig). Sin `run`, toma una
+  instantánea de config. Los demás argumentos, si se indican, reemplazan los campos de `run`.
+  Si run.seed no es None, la corrida usa su propio random.Random (toolbox.rng) en lugar de `random`.
+  """
+  run = context.from_config() if run is None else run
+  overrides = dict(eval_mode=eval_mode, n_workers=n_workers, chunk_size=chunk_size, cache_size=cache_size, incremental=incremental)
+  run = run._replace(**{key: value for key, value in overrides.items() if value is not None})
+  params = run.params
+
+  _ensure_creator()
 
   toolbox = base.Toolbox()
+  toolbox.run = run
+  toolbox.rng = random if run.seed is None else random.Random(run.seed)
 
-  toolbox.register("attr_bool", random.randint, 0, 1)
+  toolbox.register("attr_bool", toolbox.rng.randint, 0, 1)
   total_bits = params["n_vars"] * params["bits_per_var"]
 
   toolbox.register("individual", tools.initRepeat, creator.Individual, toolbox.attr_bool, total_bits)
   toolbox.register("population", tools.initRepeat, list, toolbox.individual)
+  real_coded = functions.is_real_coded(params)
+
+  if run.eval_mode == "batch":
+    evaluate = BatchEvaluator(run.problem_id, params)
+    toolbox.register("map", evaluation_map)
+  elif run.eval_mode == "parallel":
+    evaluate = parallel.ParallelEvaluator(run.problem_id, params, run.n_workers, run.chunk_size)
+    toolbox.register("map", evaluation_map)
+  elif run.eval_mode == "individual":
+    evaluate = functools.partial(functions.evaluate_fitness, problem_id=run.problem_id, params=params)
+  else:
+    raise ValueError(f"Modo de evaluación desconocido: {run.eval_mode}")
+
+  # tools.selRoulette usa siempre el `random` global; sólo sel_roulette respeta toolbox.rng.
+  if run.roulette_method == "bisect":
+    toolbox.register("select", sel_roulette, source=toolbox.rng)
+  else:
+    toolbox.register("select", tools.selRoulette)
+  toolbox.register("mate", cx_one_point, rng=toolbox.rng)
+  toolbox.register("mutate", mut_flip_bit, indpb=run.indpb, rng=toolbox.rng)
+
+  # Codificación real: otro genoma y otros operadores; la evaluación no decodifica.
+  if real_coded:
+    _register_real_coded(toolbox, run)
+
+  # La evaluación incremental reemplaza al modo de evaluación elegido para problemas separables.
+  if run.incremental and params.get("separable") and not real_coded:
+    evaluate = DeltaEvaluator(run.problem_id, params)
+    toolbox.register("mate", cx_one_point_delta, bits_per_var=params["bits_per_var"], rng=toolbox.rng)
+    toolbox.register("mutate", mut_flip_bit_delta, indpb=run.indpb, bits_per_var=params["bits_per_var"], rng=toolbox.rng)
+
+  if run.cache_size:
+    toolbox.fitness_cache = evaluate = FitnessCache(evaluate, run.cache_size)
+    toolbox.register("map", evaluation_map)
+  toolbox.register("evaluate", evaluate)
+
+  return toolbox
+
+
+class _LazyBits:
+  """Vista de sólo lectura que desempaqueta filas de BitMatrixGA bajo demanda."""
+
+  def __init__(self, engine):
+    self.engine = engine
+
+  def __len__(self):
+    return len(self.engine.population)
+
+  def __getitem__(self, i):
+    return self.engine.bits(self.engine.population[i:i + 1])[0]
+
+class BitMatrixGA:
+  """
+  Motor alternativo al de DEAP: la población completa vive en una matriz contigua de uint8
+  (un byte por bit o, con packed=True, ocho bits por byte) y la selección por ruleta, el cruce
+  de un punto y la mutación bit-flip se aplican como operaciones de arreglo sobre toda la población.
+  Replica la semántica de eaSimple (varAnd), sin objetos por individuo ni deepcopy.
+  """
+
+  MUTATION_BLOCK = 4096
+
+  def __init__(self, pop_size, problem_id=None, cxpb=None, mutpb=None, indpb=None, packed=False, seed=None, stats=None):
+    self.problem_id = config.PROBLEM_ID if problem_id is None else problem_id
+    self.params = dict(config.get_problem_config(self.problem_id))
+    if functions.is_real_coded(self.params):
+      raise ValueError("BitMatrixGA sólo admite la codificación binaria")
+    self.cxpb = config.CROSSOVER_PROB if cxpb is None else cxpb
+    self.mutpb = config.MUTATION_PROB if mutpb is None else mutpb
+    self.indpb = config.MUTATION_PROB if indpb is None else indpb
+    self.packed = packed
+    self.n_bits = self.params["n_vars"] * self.params["bits_per_var"]
+    self.rng = np.random.default_rng(seed)
+
+    self.population = self._pack(self.rng.integers(0, 2, size=(pop_size, self.n_bits), dtype=np.uint8))
+    self.fitness = self.evaluate(self.population)
+    self.best_genome = None
+    self.best_fitness = -np.inf
+    self._update_best()
+
+    self.stats = metrics.FitnessStatistics() if stats is None else stats
+    self.logbook = tools.Logbook()
+    self.logbook.header = ["gen", "nevals"] + self.stats.fields
+    self.generations_run = 0
+    self.elapsed = 0.0
+    self._record(0, pop_size)
+
+  def _pack(self, bits):
+    return np.packbits(bits, axis=1) if self.packed else bits
+
+  def bits(self, population=None):
+    """Matriz de bits (individuos x bits) sin empaquetar."""
+    population = self.population if population is None else population
+    if self.packed:
+      return np.unpackbits(population, axis=1, count=self.n_bits)
+    return population
+
+  def evaluate(self, population):
+    return functions.evaluate_population(self.bits(population), problem_id=self.problem_id, params=self.params)
+
+  def select(self):
+    return roulette_indices(self.fitness, len(self.fitness), self.rng)
+
+  def crossover(self, offspring, changed):
+    n_pairs = len(offspring) // 2
+    mates = np.flatnonzero(self.rng.random(n_pairs) < self.cxpb)
+    if len(mates) == 0:
+      return
+
+    cuts = self.rng.integers(1, self.n_bits, size=len(mates))
+    mask = self._pack((np.arange(self.n_bits) >= cuts[:, None]).astype(np.uint8))
+    first, second = 2 * mates, 2 * mates + 1
+
+    diff = (offspring[first] ^ offspring[second]) & mask
+    offspring[first] ^= diff
+    offspring[second] ^= diff
+    changed[first] = True
+    changed[second] = True
+
+  def mutate(self, offspring, changed):
+    mutants = np.flatnonzero(self.rng.random(len(offspring)) < self.mutpb)
+
+    for start in range(0, len(mutants), self.MUTATION_BLOCK):
+      rows = mutants[start:start + self.MUTATION_BLOCK]
+      flips = (self.rng.random((len(rows), self.n_bits)) < self.indpb).astype(np.uint8)
+      offspring[rows] ^= self._pack(flips)
+    changed[mutants] = True
+
+  def step(self):
+    """Ejecuta una generación completa y devuelve el número de evaluaciones realizadas."""
+    parents = self.select()
+    offspring = self.population[parents]
+    fitness = self.fitness[parents]
+    changed = np.zeros(len(offspring), dtype=bool)
+
+    self.crossover(offspring, changed)
+    self.mutate(offspring, changed)
+
+    invalid = np.flatnonzero(changed)
+    if len(invalid):
+      fitness[invalid] = self.evaluate(offspring[invalid])
+
+    self.population = offspring
+    self.fitness = fitness
+    self._update_best()
+    return len(invalid)
+
+  def run(self, ngen, verbose=False):
+    for _ in range(ngen):
+      start = time.perf_counter()
+      nevals = self.step()
+      self.elapsed += time.perf_counter() - start
+      self.generations_run += 1
+      self._record(self.generations_run, nevals)
+      if verbose:
+        print(self.logbook.stream)
+    return self.logbook
+
+  def report(self):
+    """Rendimiento del motor: generaciones por segundo y memoria ocupada por la población."""
+    return {
+      "generations": self.generations_run,
+      "generations_per_sec": self.generations_run / self.elapsed if self.elapsed else 0.0,
+      "population_bytes": self.population.nbytes,
+      "fitness_bytes": self.fitness.nbytes,
+      "bytes_per_individual": self.population.nbytes / len(self.population),
+    }
 
-  toolbox.register("evaluate", functions.evaluate_fitness)
-  toolbox.register("select", tools.selRoulette)
-  toolbox.register("mate", tools.cxOnePoint)
-  toolbox.register("mutate", tools.mutFlipBit, indpb=config.MUTATION_PROB)
+  def _update_best(self):
+    best = int(np.argmax(self.fitness))
+    if self.fitness[best] > self.best_fitness:
+      self.best_fitness = float(self.fitness[best])
+      self.best_genome = self.bits(self.population[best:best + 1])[0].copy()
 
-  return toolbox
\ No newline at end of file
+  def _record(self, gen, nevals):
+    # La población empaquetada sólo se desempaqueta si toca calcular la diversidad.
+    genomes = _LazyBits(self) if self.packed else self.population
+    self.logbook.record(gen=gen, nevals=nevals, **self.stats.compile_arrays(self.fitness, genomes, gen))
\ No newline at end of file
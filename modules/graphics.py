@@ -2,9 +2,10 @@ import matplotlib.pyplot as plt
 import config.config as config
 import numpy as np
 import plotly.graph_objects as go
+import modules.surfaces as surfaces
 
-def plot_convergence(logbook, filename=None):
-    params = config.get_problem_config()
+def plot_convergence(logbook, filename=None, params=None):
+    params = config.get_problem_config() if params is None else params
 
     gen = logbook.select("gen")
     fit_max = logbook.select("max")
@@ -30,22 +31,19 @@ def plot_convergence(logbook, filename=None):
 
     return fig
 
-def plot_3d_surface(best_ind_decoded=None):
+def plot_3d_surface(best_ind_decoded=None, problem_id=None):
     """Genera un gráfico 3D interactivo para la función Camel Back."""
-    if config.PROBLEM_ID != 2:
+    problem_id = config.PROBLEM_ID if problem_id is None else problem_id
+    if problem_id != 2:
         return None 
     
-    x = np.linspace(-2, 2, 100)
-    y = np.linspace(-1, 1, 100)
-    X, Y = np.meshgrid(x, y)
-    
-    Z = (4*X**2 - 2.1*X**4 + (1/3)*X**6) + (X*Y) + (-4*Y**2 + 4*Y**4)
+    surface = surfaces.get_surface(problem_id, "fine")
 
-    fig = go.Figure(data=[go.Surface(z=Z, x=X, y=Y, colorscale='Viridis', opacity=0.8)])
+    fig = go.Figure(data=[go.Surface(z=np.asarray(surface.z), x=surface.x, y=surface.y, colorscale='Viridis', opacity=0.8)])
 
     if best_ind_decoded:
         bx, by = best_ind_decoded[0], best_ind_decoded[1]
-        bz = (4*bx**2 - 2.1*bx**4 + (1/3)*bx**6) + (bx*by) + (-4*by**2 + 4*by**4)
+        bz = surfaces.point_value(problem_id, best_ind_decoded)
         
         fig.add_trace(go.Scatter3d(
             x=[bx], y=[by], z=[bz],
@@ -63,15 +61,10 @@ def plot_schwefel_surface_2d():
     Genera una representación 3D de la función Schwefel en 2 dimensiones.
     Útil para visualizar la complejidad del terreno (muchos mínimos locales).
     """
-    x = np.linspace(-500, 500, 100)
-    y = np.linspace(-500, 500, 100)
-    X, Y = np.meshgrid(x, y)
-    
-    # Fórmula Schwefel para 2 variables:
-    # f(x,y) = (-x * sin(sqrt(|x|))) + (-y * sin(sqrt(|y|)))
-    Z = (-X * np.sin(np.sqrt(np.abs(X)))) + (-Y * np.sin(np.sqrt(np.abs(Y))))
+    # Schwefel para 2 variables: f(x,y) = (-x * sin(sqrt(|x|))) + (-y * sin(sqrt(|y|)))
+    surface = surfaces.get_surface(1, "fine")
 
-    fig = go.Figure(data=[go.Surface(z=Z, x=X, y=Y, colorscale='Jet', opacity=0.9)])
+    fig = go.Figure(data=[go.Surface(z=np.asarray(surface.z), x=surface.x, y=surface.y, colorscale='Jet', opacity=0.9)])
 
     fig.update_layout(
         title='Topología Referencial: Schwefel (Corte 2D)',
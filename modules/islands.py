@@ -0,0 +1,205 @@
+import multiprocessing
+import queue
+import time
+import numpy as np
+from deap import creator, tools
+import config.config as config
+import modules.context as context
+import modules.ga as ga
+import modules.metrics as metrics
+import modules.stopping as stopping
+
+def _neighbours(index, n_islands, topology):
+  if topology == "ring":
+    return [(index + 1) % n_islands]
+  if topology == "full":
+    return [j for j in range(n_islands) if j != index]
+  raise ValueError(f"Topología desconocida: {topology}")
+
+def _incoming(n_islands, topology):
+  return 1 if topology == "ring" else n_islands - 1
+
+def _to_individual(bits, values):
+  ind = creator.Individual(bits)
+  ind.fitness.values = values
+  return ind
+
+def _replace(population, immigrants, policy, rng):
+  if policy == "worst":
+    positions = np.argsort([ind.fitness.values[0] for ind in population])[:len(immigrants)]
+  elif policy == "random":
+    positions = rng.sample(range(len(population)), len(immigrants))
+  else:
+    raise ValueError(f"Política de reemplazo desconocida: {policy}")
+  for pos, ind in zip(positions, immigrants):
+    population[pos] = ind
+
+def _epoch_ends(gen, settings):
+  return gen > 0 and (gen % settings["migration_interval"] == 0 or gen == settings["ngen"])
+
+def _island_worker(index, settings, inboxes, results, controls):
+  # Cada isla ya ocupa un núcleo: el modo "parallel" se reduce a "batch" dentro de ella.
+  run = settings["run"]
+  eval_mode = "batch" if run.eval_mode == "parallel" else run.eval_mode
+  toolbox = ga.setup_ga(run=run._replace(eval_mode=eval_mode, seed=settings["seed"] + index))
+  population = toolbox.population(n=settings["island_sizes"][index])
+  hof = tools.HallOfFame(settings["hof_size"])
+  stats = metrics.FitnessStatistics()
+
+  logbook = tools.Logbook()
+  targets = _neighbours(index, settings["n_islands"], settings["topology"])
+  expected = _incoming(settings["n_islands"], settings["topology"])
+  # (gen, mejor fitness de la isla, evaluaciones, segundos) de cada generación de la época en curso.
+  epoch = []
+  start = time.perf_counter()
+
+  for gen in range(settings["ngen"] + 1):
+    if gen > 0:
+      population = ga.var_and(toolbox.select(population, len(population)), toolbox, run.cxpb, run.mutpb)
+
+    invalid = [ind for ind in population if not ind.fitness.valid]
+    for ind, fit in zip(invalid, toolbox.map(toolbox.evaluate, invalid)):
+      ind.fitness.values = fit
+
+    hof.update(population)
+    logbook.record(gen=gen, nevals=len(invalid), **stats.compile(population, gen=gen))
+
+    if settings["stopping"]:
+      epoch.append((gen, hof[0].fitness.values[0], len(invalid), time.perf_counter() - start))
+      if _epoch_ends(gen, settings):
+        # Al cerrar cada época, el proceso principal decide con el mejor global si todas las islas paran.
+        results.put(("progress", index, epoch))
+        epoch = []
+        if controls[index].get():
+          break
+
+    if gen > 0 and gen < settings["ngen"] and gen % settings["migration_interval"] == 0:
+      emigrants = [(list(ind), ind.fitness.values) for ind in tools.selBest(population, settings["migrants"])]
+      for target in targets:
+        inboxes[target].put(emigrants)
+      immigrants = []
+      for _ in range(expected):
+        immigrants.extend(_to_individual(bits, values) for bits, values in inboxes[index].get())
+      _replace(population, immigrants, settings["replacement"], toolbox.rng)
+
+  results.put(("done", index, list(logbook), [(list(ind), ind.fitness.values) for ind in hof]))
+
+def merge_logbooks(island_logbooks, island_sizes):
+  """Combina los logbooks de las islas en uno global compatible con graphics.plot_convergence."""
+  logbook = tools.Logbook()
+  logbook.header = ["gen", "nevals", "max", "avg"]
+  total = sum(island_sizes)
+  for records in zip(*island_logbooks):
+    logbook.record(
+      gen=records[0]["gen"],
+      nevals=sum(r["nevals"] for r in records),
+      max=max(r["max"] for r in records),
+      avg=sum(r["avg"] * size for r, size in zip(records, island_sizes)) / total
+    )
+  return logbook
+
+class _StopCheck:
+  """Aplica el criterio de parada, generación por generación, al progreso global de las islas."""
+
+  def __init__(self, stop, offset):
+    self.stop = stop
+    self.offset = offset
+    self.evaluations = 0
+
+  def check(self, epochs):
+    reason = None
+    for rows in zip(*epochs):
+      self.evaluations += sum(row[2] for row in rows)
+      progress = stopping.Progress(rows[0][0], self.offset - max(row[1] for row in rows), self.evaluations,
+                                   max(row[3] for row in rows))
+      # Se evalúan todas las generaciones de la época para que criterios con estado (estancamiento) no pierdan pasos.
+      reason = self.stop.check(progress) or reason
+    return reason
+
+def run_islands(n_islands, pop_size=None, ngen=None, cxpb=None, mutpb=None, migration_interval=None,
+                migrants=None, topology=None, replacement=None, hof_size=1, seed=42, run=None, stop=None):
+  """
+  Modelo de islas: reparte la población en n_islands subpoblaciones, cada una en su propio
+  proceso con el toolbox de ga.setup_ga, y migra los mejores individuos cada
+  migration_interval generaciones. Devuelve (logbook global, hall of fame global).
+
+  `stop` funciona como en evolution.evolve (por defecto, params["stopping"]; False lo desactiva),
+  pero se comprueba con el mejor global al final de cada época de migración, así que la corrida
+  se detiene en esa generación. El motivo queda en logbook.stop_reason y en el último registro.
+  """
+  run = context.from_config() if run is None else run
+  run = run._replace(
+    cxpb=run.cxpb if cxpb is None else cxpb,
+    mutpb=run.mutpb if mutpb is None else mutpb,
+  )
+  params = run.params
+  if stop is None:
+    stop = stopping.from_config(params.get("stopping"))
+  elif stop is False:
+    stop = None
+  pop_size = params["population_size"] if pop_size is None else pop_size
+  island_sizes = [pop_size // n_islands + (1 if i < pop_size % n_islands else 0) for i in range(n_islands)]
+
+  settings = {
+    "run": run,
+    "n_islands": n_islands,
+    "island_sizes": island_sizes,
+    "ngen": params["generations"] if ngen is None else ngen,
+    "migration_interval": config.MIGRATION_INTERVAL if migration_interval is None else migration_interval,
+    "migrants": config.MIGRANTS if migrants is None else migrants,
+    "topology": config.TOPOLOGY if topology is None else topology,
+    "replacement": config.REPLACEMENT if replacement is None else replacement,
+    "hof_size": hof_size,
+    "seed": seed,
+    "stopping": stop is not None,
+  }
+  _neighbours(0, n_islands, settings["topology"])  # valida la topología antes de lanzar procesos
+
+  inboxes = [multiprocessing.Queue() for _ in range(n_islands)]
+  controls = [multiprocessing.Queue() for _ in range(n_islands)]
+  results = multiprocessing.Queue()
+  processes = [
+    multiprocessing.Process(target=_island_worker, args=(i, settings, inboxes, results, controls), daemon=True)
+    for i in range(n_islands)
+  ]
+  for process in processes:
+    process.start()
+
+  # Se vacía la cola de resultados antes de join() para no bloquear a los procesos.
+  collected = {}
+  epochs = {}
+  check = _StopCheck(stop, params["offset_roulette"]) if stop is not None else None
+  reason = "generations"
+  while len(collected) < n_islands:
+    try:
+      message = results.get(timeout=1.0)
+    except queue.Empty:
+      if any(p.exitcode not in (None, 0) for p in processes):
+        for process in processes:
+          process.terminate()
+        raise RuntimeError("Una de las islas terminó con error")
+      continue
+    if message[0] == "progress":
+      epochs[message[1]] = message[2]
+      if len(epochs) == n_islands:
+        stop_reason = check.check([epochs[i] for i in range(n_islands)])
+        epochs = {}
+        if stop_reason:
+          reason = stop_reason
+        for control in controls:
+          control.put(stop_reason)
+      continue
+    _, index, records, hof_items = message
+    collected[index] = (records, hof_items)
+  for process in processes:
+    process.join()
+
+  ga.setup_ga(eval_mode="individual", run=run)
+  hof = tools.HallOfFame(hof_size)
+  hof.update([_to_individual(bits, values) for i in range(n_islands) for bits, values in collected[i][1]])
+
+  logbook = merge_logbooks([collected[i][0] for i in range(n_islands)], island_sizes)
+  logbook.stop_reason = reason
+  if len(logbook):
+    logbook[-1]["stop_reason"] = reason
+  return logbook, hof
\ No newline at end of file
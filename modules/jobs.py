@@ -0,0 +1,221 @@
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from deap import tools
+import config.config as config
+import modules.ga as ga
+import modules.functions as functions
+import modules.metrics as metrics
+import modules.evolution as evolution
+import modules.archive as archive
+import modules.storage as storage
+
+# Se incrementa si cambia el formato del resultado o la semántica de una corrida: invalida la caché.
+RESULT_VERSION = 2
+
+# Estado de un trabajo: "queued" | "running" | "done" | "failed" | "unknown"
+JobStatus = namedtuple("JobStatus", ["state", "gen", "ngen", "best_value", "result", "error"])
+
+def job_key(run, instrument=False):
+  """Clave de contenido de un trabajo: todos los parámetros de la corrida, la semilla y la versión del formato."""
+  spec = {"version": RESULT_VERSION, "run": run._asdict(), "instrument": instrument}
+  return hashlib.blake2b(storage.to_json(spec, sort_keys=True).encode("utf-8"), digest_size=20).hexdigest()
+
+def restore_logbook(result):
+  """Reconstruye un tools.Logbook a partir del resultado serializado."""
+  logbook = tools.Logbook()
+  logbook.header = result["header"]
+  for record in result["records"]:
+    logbook.record(**record)
+  logbook.stop_reason = result["stop_reason"]
+  return logbook
+
+class ResultCache:
+  """
+  Caché en disco direccionada por contenido: un JSON por clave en `directory`. Cada lectura
+  renueva la fecha de modificación y, al superar `max_bytes`, se borran primero los menos usados.
+  """
+
+  def __init__(self, directory, max_bytes):
+    self.directory = directory
+    self.max_bytes = max_bytes
+    os.makedirs(directory, exist_ok=True)
+
+  def path(self, key):
+    return os.path.join(self.directory, f"{key}.json")
+
+  def get(self, key):
+    path = self.path(key)
+    try:
+      with open(path, encoding="utf-8") as fh:
+        result = json.load(fh)
+      os.utime(path)
+    except (OSError, ValueError):
+      return None
+    return result
+
+  def discard(self, key):
+    try:
+      os.remove(self.path(key))
+    except OSError:
+      pass
+
+  def put(self, key, result):
+    with storage.atomic_write(self.path(key), "w", prefix=".result-") as fh:
+      fh.write(storage.to_json(result, sort_keys=True))
+    self.evict(keep=key)
+
+  def evict(self, keep=None):
+    entries = []
+    for name in os.listdir(self.directory):
+      if not name.endswith(".json") or name == f"{keep}.json":
+        continue
+      stat = os.stat(os.path.join(self.directory, name))
+      entries.append((stat.st_mtime, stat.st_size, name))
+    total = sum(size for _, size, _ in entries)
+    if keep is not None and os.path.exists(self.path(keep)):
+      total += os.path.getsize(self.path(keep))
+
+    for _, size, name in sorted(entries):
+      if total <= self.max_bytes:
+        break
+      try:
+        os.remove(os.path.join(self.directory, name))
+      except OSError:
+        continue
+      total -= size
+
+def _run_job(key, run, instrument, progress):
+  # Se ejecuta en un proceso del pool; el estado de avance se publica en el diccionario compartido.
+  # Los procesos del pool no pueden abrir otro pool: el modo "parallel" se reduce a "batch".
+  if run.eval_mode == "parallel":
+    run = run._replace(eval_mode="batch")
+  params = run.params
+  progress[key] = (0, params["generations"], None)
+
+  def report(snapshot):
+    progress[key] = (snapshot.gen, snapshot.ngen, params["offset_roulette"] - snapshot.best_fitness)
+
+  toolbox = ga.setup_ga(run=run)
+  population = toolbox.population(n=params["population_size"])
+  hof = archive.from_config(params)
+  stats = metrics.FitnessStatistics()
+  ga.register_cache_stats(toolbox, stats)
+
+  population, logbook = evolution.run(
+    population, toolbox, cxpb=run.cxpb, mutpb=run.mutpb, ngen=params["generations"],
+    stats=stats, halloffame=hof, on_generation=report, instrument=instrument, run=run
+  )
+
+  best = hof[0]
+  return {
+    "problem_id": run.problem_id,
+    "params": params,
+    "header": logbook.header,
+    "records": list(logbook),
+    "stop_reason": logbook.stop_reason,
+    "best_genome": list(best),
+    "best_fitness": best.fitness.values[0],
+    "best_value": params["offset_roulette"] - best.fitness.values[0],
+    "best_vars": functions.decode_individual(best, params),
+    "archive": hof.summary(),
+  }
+
+class JobExecutor:
+  """
+  Ejecuta corridas del AG en un pool de procesos, fuera del hilo de la interfaz.
+  Las peticiones idénticas (misma clave) comparten un solo trabajo, la cola tiene un máximo de
+  `max_pending` trabajos y los resultados terminados se guardan en una ResultCache en disco,
+  de modo que repetir una petición (incluso tras reiniciar) devuelve el resultado al instante.
+  Las corridas sin semilla no son reproducibles: cada petición es un trabajo nuevo y su resultado
+  queda sólo en memoria (los últimos `max_pending`).
+  """
+
+  def __init__(self, max_workers=None, max_pending=None, cache_dir=None, cache_max_mb=None):
+    self.max_pending = config.JOB_QUEUE_SIZE if max_pending is None else max_pending
+    cache_max_mb = config.JOB_CACHE_MAX_MB if cache_max_mb is None else cache_max_mb
+    self.cache = ResultCache(config.JOB_CACHE_DIR if cache_dir is None else cache_dir, cache_max_mb * 1024 * 1024)
+    self.executor = ProcessPoolExecutor(max_workers=config.JOB_WORKERS if max_workers is None else max_workers)
+    self.manager = multiprocessing.Manager()
+    self.progress = self.manager.dict()
+    self.jobs = {}
+    self.errors = {}
+    self.results = {}
+    self.lock = threading.Lock()
+
+  def submit(self, run, instrument=False):
+    """Encola la corrida (si no está ya en caché o en curso) y devuelve su clave."""
+    key = job_key(run, instrument)
+    cached = run.seed is not None
+    if not cached:
+      key = f"{key}-{os.urandom(4).hex()}"
+    with self.lock:
+      if key in self.jobs:
+        return key
+      if cached and os.path.exists(self.cache.path(key)):
+        if self.cache.get(key) is not None:
+          return key
+        # Entrada ilegible (truncada o de otro formato): se borra y la corrida se vuelve a ejecutar.
+        self.cache.discard(key)
+      if len(self.jobs) >= self.max_pending:
+        raise RuntimeError(f"Cola de trabajos llena ({self.max_pending}); intente más tarde")
+      self.errors.pop(key, None)
+      future = self.executor.submit(_run_job, key, run, instrument, self.progress)
+      self.jobs[key] = future
+    future.add_done_callback(lambda done: self._finish(key, done, cached))
+    return key
+
+  def _finish(self, key, future, cached=True):
+    try:
+      if cached:
+        self.cache.put(key, future.result())
+      else:
+        result = future.result()
+        with self.lock:
+          self.results[key] = result
+          while len(self.results) > self.max_pending:
+            self.results.pop(next(iter(self.results)))
+    except Exception as e:
+      with self.lock:
+        self.errors[key] = f"{type(e).__name__}: {e}"
+    with self.lock:
+      self.jobs.pop(key, None)
+    self.progress.pop(key, None)
+
+  def status(self, key):
+    with self.lock:
+      future = self.jobs.get(key)
+      error = self.errors.get(key)
+      result = self.results.get(key)
+    if future is not None:
+      gen, ngen, best_value = self.progress.get(key, (0, None, None))
+      state = "running" if future.running() or key in self.progress else "queued"
+      return JobStatus(state, gen, ngen, best_value, None, None)
+    if error is not None:
+      return JobStatus("failed", None, None, None, None, error)
+
+    if result is None:
+      result = self.cache.get(key)
+    if result is None:
+      return JobStatus("unknown", None, None, None, None, None)
+    last = result["records"][-1]
+    return JobStatus("done", last["gen"], result["params"]["generations"], result["best_value"], result, None)
+
+  def wait(self, key, poll=0.25, on_progress=None):
+    """Espera a que el trabajo termine (llamando a on_progress(status) mientras tanto) y devuelve su estado final."""
+    while True:
+      status = self.status(key)
+      if status.state in ("done", "failed", "unknown"):
+        return status
+      if on_progress is not None:
+        on_progress(status)
+      time.sleep(poll)
+
+  def shutdown(self):
+    self.executor.shutdown(wait=False, cancel_futures=True)
+    self.manager.shutdown()
\ No newline at end of file
@@ -0,0 +1,153 @@
+import numpy as np
+import modules.functions as functions
+
+class LocalSearch:
+  """
+  Etapa memética: cada `interval` generaciones refina los `top_k` mejores individuos distintos
+  con búsqueda de patrón acotada, evaluando a todos los candidatos en una sola llamada a
+  functions.objective_values por ronda.
+
+  En codificación binaria la búsqueda se mueve sobre la malla de bits_per_var bits (el entero de
+  cada variable), así que el punto mejorado se re-codifica sin pérdida y su fitness es exactamente
+  el que daría toolbox.evaluate. En codificación real se mueve sobre los genes, dentro de var_range.
+
+  method "pattern": cada ronda prueba +-paso en todas las variables (un paso por candidato).
+  method "coordinate": cada paso prueba +-paso en una sola variable, en ciclo (un paso por variable).
+  Ambos gastan 2 * n_vars evaluaciones por candidato y ronda; el paso se reduce por `shrink`
+  cuando no mejora, y el candidato se da por convergido cuando el paso baja de la resolución.
+  """
+
+  def __init__(self, problem_id, params, interval, top_k=3, iterations=10, step=0.02, shrink=0.5, method="coordinate"):
+    if method not in ("pattern", "coordinate"):
+      raise ValueError(f"Método de búsqueda local desconocido: {method}")
+    self.problem_id = problem_id
+    self.params = params
+    self.interval = interval
+    self.top_k = top_k
+    self.iterations = iterations
+    self.step = step
+    self.shrink = shrink
+    self.method = method
+    self.n_vars = params["n_vars"]
+    self.r_min, self.r_max = params["var_range"]
+    self.real_coded = functions.is_real_coded(params)
+    if self.real_coded:
+      self.low, self.up = float(self.r_min), float(self.r_max)
+      self.min_step = (self.up - self.low) * 1e-12
+    else:
+      self.low, self.up = 0.0, float(2**params["bits_per_var"] - 1)
+      self.min_step = 1.0
+
+  def due(self, gen):
+    return gen > 0 and gen % self.interval == 0
+
+  def _values(self, points):
+    # Mismo cálculo que functions.decode_population para que el valor coincida con la evaluación normal.
+    x = points if self.real_coded else self.r_min + (points / self.up) * (self.r_max - self.r_min)
+    return functions.objective_values(x, self.problem_id)
+
+  def _initial_step(self):
+    if self.real_coded:
+      return max(self.min_step, self.step * (self.up - self.low))
+    return max(self.min_step, np.floor(self.step * self.up))
+
+  def _reduce(self, step):
+    step = step * self.shrink
+    return step if self.real_coded else np.floor(step)
+
+  def _elite(self, population):
+    fitness = np.array([ind.fitness.values[0] for ind in population])
+    chosen, seen = [], set()
+    for i in np.argsort(-fitness, kind="stable"):
+      key = tuple(population[i])
+      if key not in seen:
+        seen.add(key)
+        chosen.append(population[i])
+        if len(chosen) == self.top_k:
+          break
+    return chosen
+
+  def _pattern(self, points, values):
+    k, n = points.shape
+    step = np.full(k, self._initial_step())
+    directions = np.vstack([np.eye(n), -np.eye(n)])
+    evaluations = 0
+
+    for _ in range(self.iterations):
+      active = np.flatnonzero(step >= self.min_step)
+      if not len(active):
+        break
+      candidates = np.clip(points[active, None, :] + step[active, None, None] * directions, self.low, self.up)
+      candidate_values = self._values(candidates.reshape(-1, n)).reshape(len(active), 2 * n)
+      evaluations += candidate_values.size
+
+      best = candidate_values.argmin(axis=1)
+      best_values = candidate_values[np.arange(len(active)), best]
+      improved = best_values < values[active]
+      points[active[improved]] = candidates[improved, best[improved]]
+      values[active[improved]] = best_values[improved]
+      step[active[~improved]] = self._reduce(step[active[~improved]])
+    return evaluations
+
+  def _coordinate(self, points, values):
+    k, n = points.shape
+    step = np.full((k, n), self._initial_step())
+    evaluations = 0
+
+    for _ in range(self.iterations):
+      for d in range(n):
+        active = np.flatnonzero(step[:, d] >= self.min_step)
+        if not len(active):
+          continue
+        candidates = np.repeat(points[active, None, :], 2, axis=1)
+        candidates[:, 0, d] += step[active, d]
+        candidates[:, 1, d] -= step[active, d]
+        np.clip(candidates, self.low, self.up, out=candidates)
+        candidate_values = self._values(candidates.reshape(-1, n)).reshape(len(active), 2)
+        evaluations += candidate_values.size
+
+        best = candidate_values.argmin(axis=1)
+        best_values = candidate_values[np.arange(len(active)), best]
+        improved = best_values < values[active]
+        points[active[improved]] = candidates[improved, best[improved]]
+        values[active[improved]] = best_values[improved]
+        step[active[~improved], d] = self._reduce(step[active[~improved], d])
+    return evaluations
+
+  def refine(self, population):
+    """Mejora en el lugar a los mejores individuos (genoma y fitness); devuelve las evaluaciones gastadas."""
+    elite = self._elite(population)
+    if not elite:
+      return 0
+
+    if self.real_coded:
+      points = np.array(elite, dtype=np.float64)
+    else:
+      points = functions.chromosome_codes(np.array(elite, dtype=np.uint8), self.n_vars).astype(np.float64)
+    offset = self.params["offset_roulette"]
+    values = offset - np.array([ind.fitness.values[0] for ind in elite])
+    start = points.copy()
+
+    search = self._pattern if self.method == "pattern" else self._coordinate
+    evaluations = search(points, values)
+
+    changed = np.flatnonzero((points != start).any(axis=1))
+    if self.real_coded:
+      genomes = points.tolist()
+    else:
+      genomes = functions.encode_codes(points.astype(np.int64), self.params["bits_per_var"]).tolist()
+    for i in changed:
+      ind = elite[i]
+      ind[:] = genomes[i]
+      ind.fitness.values = (offset - float(values[i]),)
+      if hasattr(ind, "terms"):
+        # La evaluación incremental debe recalcular todas las variables de este individuo.
+        del ind.terms
+    return evaluations
+
+def from_config(problem_id, params):
+  """Construye la etapa a partir de params["local_search"]; None si no hay intervalo configurado."""
+  spec = params.get("local_search")
+  if not spec or not spec.get("interval"):
+    return None
+  return LocalSearch(problem_id, params, **spec)
\ No newline at end of file
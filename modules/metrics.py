@@ -0,0 +1,73 @@
+import numpy as np
+
+class FitnessStatistics:
+  """
+  Reemplazo de tools.Statistics(lambda ind: ind.fitness.values) para el logbook.
+  Lee el fitness en un arreglo contiguo y calcula max/avg/min/std de forma vectorizada; la
+  diversidad (distancia de Hamming media, estimada con `sample_pairs` parejas al azar) se calcula
+  sólo cada `diversity_every` generaciones y queda en NaN en las demás.
+  Si el llamador indica `gen`, la cadencia sigue al número de generación y la muestra se toma con un
+  generador sembrado desde (seed, gen), así que una corrida reanudada desde un checkpoint registra
+  la misma diversidad que la corrida completa. Sin `gen` se usa un contador de llamadas propio.
+  Acepta register(name, func) como tools.Statistics; func recibe el arreglo de fitness.
+  """
+
+  def __init__(self, diversity_every=10, sample_pairs=256, seed=0):
+    self.diversity_every = diversity_every
+    self.sample_pairs = sample_pairs
+    self.seed = seed
+    self.rng = np.random.default_rng(seed)
+    self.functions = {}
+    self.calls = 0
+
+  @property
+  def fields(self):
+    base = ["max", "avg", "min", "std"]
+    if self.diversity_every:
+      base.append("diversity")
+    return base + list(self.functions)
+
+  def register(self, name, function, *args, **kargs):
+    self.functions[name] = (function, args, kargs)
+
+  def compile(self, population, gen=None):
+    fitness = np.fromiter((ind.fitness.values[0] for ind in population), dtype=np.float64, count=len(population))
+    return self.compile_arrays(fitness, population, gen)
+
+  def compile_arrays(self, fitness, genomes=None, gen=None):
+    """Estadísticas a partir del arreglo de fitness y, opcionalmente, de los genomas (filas de bits)."""
+    record = {
+      "max": float(fitness.max()),
+      "avg": float(fitness.mean()),
+      "min": float(fitness.min()),
+      "std": float(fitness.std()),
+    }
+    if self.diversity_every:
+      step = self.calls if gen is None else gen
+      due = genomes is not None and step % self.diversity_every == 0
+      rng = self.rng if gen is None or self.seed is None else np.random.default_rng((self.seed, gen))
+      record["diversity"] = self.hamming_diversity(genomes, rng) if due else float("nan")
+    for name, (function, args, kargs) in self.functions.items():
+      record[name] = function(fitness, *args, **kargs)
+    self.calls += 1
+    return record
+
+  def hamming_diversity(self, genomes, rng=None):
+    """
+    Distancia de Hamming media entre individuos, como fracción de genes distintos (bits o,
+    en codificación real, variables), estimada por muestreo.
+    """
+    n = len(genomes)
+    if n < 2:
+      return 0.0
+    rng = self.rng if rng is None else rng
+    first = rng.integers(0, n, self.sample_pairs)
+    second = (first + rng.integers(1, n, self.sample_pairs)) % n
+    rows = np.unique(np.concatenate([first, second]))
+    if isinstance(genomes, np.ndarray):
+      sample = genomes[rows]
+    else:
+      sample = np.array([genomes[i] for i in rows.tolist()])
+    a = sample[np.searchsorted(rows, first)]
+    b = sample[np.searchsorted(rows, second)]
+    return float(np.mean(a != b))
\ No newline at end of file
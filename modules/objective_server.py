@@ -0,0 +1,161 @@
+"""
+Servidor local que simula una función objetivo costosa y remota (p. ej. una simulación).
+
+Protocolo: una línea JSON por petición, {"x": [x1, ..., xn]}, y una línea JSON por respuesta,
+{"f": valor}. Cada respuesta se demora un tiempo aleatorio con distribución log-normal de media
+`delay` segundos y dispersión `jitter`, para medir el modo asíncrono frente al generacional.
+
+Uso (desde la raíz del proyecto):
+  python -m modules.objective_server --problem 2 --port 8765 --delay 0.01 --jitter 0.5
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import threading
+import numpy as np
+import config.config as config
+import modules.functions as functions
+
+class ObjectiveServer:
+  def __init__(self, problem_id=None, delay=None, jitter=None, host="127.0.0.1", port=0, seed=None):
+    self.problem_id = config.PROBLEM_ID if problem_id is None else problem_id
+    self.delay = config.OBJECTIVE_SERVER_DELAY if delay is None else delay
+    self.jitter = config.OBJECTIVE_SERVER_JITTER if jitter is None else jitter
+    self.host = host
+    self.port = port
+    self.rng = random.Random(seed)
+    self.requests = 0
+    self._server = None
+
+  def sample_delay(self):
+    # Log-normal con media self.delay: la mayoría responde rápido y unas pocas tardan mucho más.
+    if self.delay <= 0:
+      return 0.0
+    return self.delay * math.exp(self.rng.gauss(0.0, self.jitter) - self.jitter ** 2 / 2)
+
+  async def _handle(self, reader, writer):
+    try:
+      while True:
+        line = await reader.readline()
+        if not line:
+          break
+        x = np.array([json.loads(line)["x"]], dtype=np.float64)
+        await asyncio.sleep(self.sample_delay())
+        value = float(functions.objective_values(x, self.problem_id)[0])
+        self.requests += 1
+        writer.write(json.dumps({"f": value}).encode("utf-8") + b"\n")
+        await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+      pass
+    except asyncio.CancelledError:
+      # Conexión aún abierta al apagar el servidor.
+      pass
+    finally:
+      writer.close()
+
+  async def start(self):
+    self._server = await asyncio.start_server(self._handle, self.host, self.port)
+    self.port = self._server.sockets[0].getsockname()[1]
+    return self
+
+  async def serve_forever(self):
+    if self._server is None:
+      await self.start()
+    print(f"[INFO] Servidor de la función objetivo en {self.host}:{self.port} "
+          f"(problema {self.problem_id}, retardo {self.delay} s, dispersión {self.jitter})")
+    async with self._server:
+      await self._server.serve_forever()
+
+def start_in_thread(**kwargs):
+  """Arranca un ObjectiveServer en un hilo con su propio ciclo de eventos; devuelve (server, stop)."""
+  server = ObjectiveServer(**kwargs)
+  loop = asyncio.new_event_loop()
+  ready = threading.Event()
+
+  def target():
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(server.start())
+    ready.set()
+    loop.run_forever()
+    server._server.close()
+    pending = asyncio.all_tasks(loop)
+    for task in pending:
+      task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+    loop.close()
+
+  thread = threading.Thread(target=target, daemon=True)
+  thread.start()
+  ready.wait()
+
+  def stop():
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+  return server, stop
+
+class RemoteObjective:
+  """
+  Función objetivo asíncrona que consulta un ObjectiveServer. Decodifica el individuo, envía sus
+  variables y devuelve el fitness (offset_roulette - f,). Reutiliza las conexiones abiertas.
+  """
+
+  def __init__(self, host, port, params):
+    self.host = host
+    self.port = port
+    self.params = params
+    self._idle = []
+    self._loop = None
+
+  async def _acquire(self):
+    loop = asyncio.get_running_loop()
+    if loop is not self._loop:
+      # Las conexiones pertenecen al ciclo de eventos que las abrió (p. ej. un asyncio.run anterior).
+      self._idle, self._loop = [], loop
+    if self._idle:
+      return self._idle.pop()
+    return await asyncio.open_connection(self.host, self.port)
+
+  async def __call__(self, individual):
+    x = functions.decode_individual(individual, self.params)
+    reader, writer = await self._acquire()
+    try:
+      writer.write(json.dumps({"x": x}).encode("utf-8") + b"\n")
+      await writer.drain()
+      value = json.loads(await reader.readline())["f"]
+    except BaseException:
+      writer.close()
+      raise
+    self._idle.append((reader, writer))
+    return (self.params["offset_roulette"] - value,)
+
+  async def aclose(self):
+    """Cierra las conexiones abiertas; se llama desde el mismo ciclo de eventos que las usó."""
+    idle, self._idle = self._idle, []
+    for _, writer in idle:
+      writer.close()
+    for _, writer in idle:
+      try:
+        await writer.wait_closed()
+      except ConnectionError:
+        pass
+
+def main():
+  parser = argparse.ArgumentParser(description="Servidor local de la función objetivo con retardo variable")
+  parser.add_argument("--problem", type=int, default=config.PROBLEM_ID, choices=sorted(config.PROBLEMS))
+  parser.add_argument("--host", default="127.0.0.1")
+  parser.add_argument("--port", type=int, default=8765)
+  parser.add_argument("--delay", type=float, default=config.OBJECTIVE_SERVER_DELAY, help="Retardo medio en segundos")
+  parser.add_argument("--jitter", type=float, default=config.OBJECTIVE_SERVER_JITTER, help="Dispersión log-normal del retardo")
+  parser.add_argument("--seed", type=int, default=None)
+  args = parser.parse_args()
+
+  server = ObjectiveServer(args.problem, args.delay, args.jitter, args.host, args.port, args.seed)
+  try:
+    asyncio.run(server.serve_forever())
+  except KeyboardInterrupt:
+    print(f"[INFO] Servidor detenido tras {server.requests} evaluaciones")
+
+if __name__ == "__main__":
+  main()
\ No newline at end of file
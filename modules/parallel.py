@@ -0,0 +1,113 @@
+import atexit
+import contextlib
+import math
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+import config.config as config
+import modules.functions as functions
+
+# Pools reutilizados entre generaciones y ejecuciones, uno por clave (procesos, problema, parámetros),
+# en orden de uso: clave -> [pool, evaluaciones en curso]. Varias corridas concurrentes comparten el pool
+# de su clave; sólo se cierran pools sin evaluaciones en curso, los menos usados primero, cuando hay
+# más de config.POOL_CACHE_SIZE abiertos.
+_POOLS = OrderedDict()
+_POOLS_LOCK = threading.Lock()
+_WORKER_PROBLEM = None
+
+# Únicos parámetros que usa la evaluación: el resto (generaciones, población...) no distingue pools.
+EVAL_KEYS = ("n_vars", "var_range", "bits_per_var", "offset_roulette", "encoding")
+
+def _init_worker(problem_id, params):
+  # Los procesos hijos reciben el problema una sola vez al arrancar; no leen config.
+  global _WORKER_PROBLEM
+  _WORKER_PROBLEM = (problem_id, params)
+
+def _evaluate_chunk(bits):
+  problem_id, params = _WORKER_PROBLEM
+  return functions.evaluate_population(bits, problem_id=problem_id, params=params)
+
+def _eval_params(params):
+  return {k: tuple(params[k]) if k == "var_range" else params.get(k) for k in EVAL_KEYS}
+
+def _pool_key(n_workers, problem_id, params):
+  return n_workers, problem_id, tuple(sorted(_eval_params(params).items()))
+
+def _close(pools):
+  for pool in pools:
+    pool.terminate()
+    pool.join()
+
+def _evict_idle():
+  # Llamar con _POOLS_LOCK tomado; devuelve los pools a cerrar fuera del lock.
+  evicted = []
+  for key in list(_POOLS):
+    if len(_POOLS) <= config.POOL_CACHE_SIZE:
+      break
+    pool, users = _POOLS[key]
+    if users == 0:
+      del _POOLS[key]
+      evicted.append(pool)
+  return evicted
+
+@contextlib.contextmanager
+def acquire_pool(n_workers, problem_id, params):
+  """
+  Pool de procesos inicializado con el problema, reutilizándolo si ya existe. Mientras dure el
+  bloque with el pool no se cierra; al salir se cierran los pools ociosos que sobren.
+  """
+  key = _pool_key(n_workers, problem_id, params)
+  with _POOLS_LOCK:
+    entry = _POOLS.get(key)
+    if entry is None:
+      pool = multiprocessing.Pool(processes=n_workers, initializer=_init_worker, initargs=(problem_id, _eval_params(params)))
+      entry = _POOLS[key] = [pool, 0]
+    _POOLS.move_to_end(key)
+    entry[1] += 1
+  try:
+    yield entry[0]
+  finally:
+    with _POOLS_LOCK:
+      entry[1] -= 1
+      evicted = _evict_idle()
+    _close(evicted)
+
+def shutdown_pool():
+  with _POOLS_LOCK:
+    pools = [pool for pool, _ in _POOLS.values()]
+    _POOLS.clear()
+  _close(pools)
+
+atexit.register(shutdown_pool)
+
+class ParallelEvaluator:
+  """
+  Evaluador que reparte la población en lotes de bits entre un pool de procesos.
+  Cada proceso evalúa su lote con functions.evaluate_population.
+  """
+
+  def __init__(self, problem_id=None, params=None, n_workers=None, chunk_size=None):
+    self.problem_id = config.PROBLEM_ID if problem_id is None else problem_id
+    self.params = dict(config.get_problem_config(self.problem_id) if params is None else params)
+    n_workers = config.N_WORKERS if n_workers is None else n_workers
+    self.n_workers = n_workers or os.cpu_count() or 1
+    self.chunk_size = config.CHUNK_SIZE if chunk_size is None else chunk_size
+
+  def __call__(self, individual):
+    bits = np.array([individual], dtype=functions.genome_dtype(self.params))
+    return (float(functions.evaluate_population(bits, problem_id=self.problem_id, params=self.params)[0]),)
+
+  def batch(self, individuals):
+    if not individuals:
+      return []
+
+    bits = np.array(individuals, dtype=functions.genome_dtype(self.params))
+    # Por defecto, unos cuatro lotes por proceso para equilibrar la carga.
+    chunk_size = self.chunk_size or max(1, math.ceil(len(bits) / (self.n_workers * 4)))
+    chunks = [bits[i:i + chunk_size] for i in range(0, len(bits), chunk_size)]
+
+    with acquire_pool(self.n_workers, self.problem_id, self.params) as pool:
+      fitness = np.concatenate(pool.map(_evaluate_chunk, chunks, chunksize=1))
+    return [(value,) for value in fitness.tolist()]
\ No newline at end of file
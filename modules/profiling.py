@@ -0,0 +1,97 @@
+import collections
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+
+try:
+  import resource
+except ImportError:  # Windows
+  resource = None
+
+# Columnas de tiempo por fase que evolution.evolve agrega al logbook con instrument=True.
+PHASES = ["t_select", "t_vary", "t_evaluate", "t_hof", "t_stats"]
+
+def peak_memory_mb():
+  """Pico de memoria residente del proceso en MB (None si la plataforma no lo permite)."""
+  if resource is not None:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+  if tracemalloc.is_tracing():
+    return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+  return None
+
+class _GenerationHook:
+  """Base de los ganchos de perfilado: se activan sólo en las generaciones elegidas."""
+
+  def __init__(self, generations, output_dir="."):
+    self.generations = set(generations)
+    self.output_dir = output_dir
+
+  def wants(self, gen):
+    return gen in self.generations
+
+  def before_generation(self, gen):
+    if self.wants(gen):
+      self.start(gen)
+
+  def after_generation(self, gen):
+    if self.wants(gen):
+      self.stop(gen)
+
+class CProfileHook(_GenerationHook):
+  """Perfila con cProfile las generaciones elegidas y guarda profile_gen_<n>.prof en output_dir."""
+
+  def start(self, gen):
+    self.profile = cProfile.Profile()
+    self.profile.enable()
+
+  def stop(self, gen):
+    self.profile.disable()
+    path = os.path.join(self.output_dir, f"profile_gen_{gen}.prof")
+    self.profile.dump_stats(path)
+    print(f"[INFO] Perfil de la generación {gen} guardado en '{path}'")
+
+  @staticmethod
+  def summary(path, limit=15):
+    pstats.Stats(path).sort_stats("cumulative").print_stats(limit)
+
+class SamplingProfilerHook(_GenerationHook):
+  """
+  Perfilador por muestreo: un hilo toma la pila del hilo del AG cada `interval` segundos y cuenta
+  en qué funciones está. Mucho menos intrusivo que cProfile; deja el resumen en `self.samples`.
+  """
+
+  def __init__(self, generations, output_dir=".", interval=0.005):
+    super().__init__(generations, output_dir)
+    self.interval = interval
+    self.samples = collections.Counter()
+
+  def start(self, gen):
+    self.target = threading.get_ident()
+    self.running = threading.Event()
+    self.running.set()
+    self.thread = threading.Thread(target=self._sample, daemon=True)
+    self.thread.start()
+
+  def _sample(self):
+    while self.running.is_set():
+      frame = sys._current_frames().get(self.target)
+      while frame is not None:
+        code = frame.f_code
+        self.samples[(os.path.basename(code.co_filename), code.co_name)] += 1
+        frame = frame.f_back
+      time.sleep(self.interval)
+
+  def stop(self, gen):
+    self.running.clear()
+    self.thread.join()
+    path = os.path.join(self.output_dir, f"samples_gen_{gen}.txt")
+    with open(path, "w", encoding="utf-8") as fh:
+      for (filename, name), count in self.samples.most_common():
+        fh.write(f"{count:>8} {filename}:{name}\n")
+    print(f"[INFO] Muestras de la generación {gen} guardadas en '{path}'")
+    self.samples = collections.Counter()
\ No newline at end of file
@@ -0,0 +1,189 @@
+import asyncio
+import inspect
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from deap import tools
+import config.config as config
+import modules.ga as ga
+import modules.stopping as stopping
+
+def is_async_objective(objective):
+  """True si la función objetivo es una corrutina (función async o instancia con __call__ async)."""
+  return inspect.iscoroutinefunction(objective) or inspect.iscoroutinefunction(getattr(objective, "__call__", None))
+
+def _make_executor(executor, in_flight):
+  # Devuelve (executor, propio): los executors creados aquí se cierran al terminar la corrida.
+  if executor is None or executor == "thread":
+    return ThreadPoolExecutor(max_workers=in_flight), True
+  if executor == "process":
+    return ProcessPoolExecutor(max_workers=in_flight), True
+  if isinstance(executor, Executor):
+    return executor, False
+  raise ValueError(f"Executor desconocido: {executor}")
+
+def _as_coroutine(objective, executor):
+  if is_async_objective(objective):
+    return objective
+  loop = asyncio.get_running_loop()
+
+  async def call(individual):
+    return await loop.run_in_executor(executor, objective, individual)
+  return call
+
+def _replace_worst(population, child):
+  # Reemplazo del peor: el hijo entra si no es peor que el peor individuo actual.
+  worst = min(range(len(population)), key=lambda i: population[i].fitness.values[0])
+  if child.fitness.values[0] >= population[worst].fitness.values[0]:
+    population[worst] = child
+    return True
+  return False
+
+async def evolve_async(population, toolbox, cxpb, mutpb, max_evaluations=None, objective=None, in_flight=None,
+                       executor=None, stats=None, halloffame=None, cancel=None, stop=None, verbose=False, run=None):
+  """
+  AG de estado estacionario asíncrono para funciones objetivo costosas. Mantiene hasta `in_flight`
+  evaluaciones en curso y, en cuanto llega cada resultado, inserta al hijo en la población
+  (reemplazando al peor) y genera otro con toolbox.select, mate y mutate (ga.var_and sobre dos padres).
+
+  `objective` es por defecto toolbox.evaluate. Si es async se espera directamente; si es una función
+  normal se ejecuta en `executor`: "thread" (por defecto), "process" o un concurrent.futures.Executor.
+  Con executor="thread" la función debe poder llamarse desde varios hilos a la vez.
+
+  El presupuesto es `max_evaluations` (por defecto population_size * (generations + 1), el mismo que
+  el modo generacional). Se registra una fila del logbook cada len(population) evaluaciones; "gen"
+  cuenta esas filas y los criterios de modules.stopping se revisan en cada una.
+  """
+  run = getattr(toolbox, "run", None) if run is None else run
+  params = run.params if run is not None else config.get_problem_config()
+  in_flight = config.STEADY_STATE_IN_FLIGHT if in_flight is None else in_flight
+  if max_evaluations is None:
+    max_evaluations = len(population) * (params["generations"] + 1)
+  if stop is None:
+    stop = stopping.from_config(params.get("stopping"))
+  elif stop is False:
+    stop = None
+  if cxpb <= 0 and mutpb <= 0:
+    raise ValueError("Con cxpb = mutpb = 0 no se genera descendencia nueva que evaluar")
+
+  objective = toolbox.evaluate if objective is None else objective
+  pool, owned = (None, False) if is_async_objective(objective) else _make_executor(executor, in_flight)
+  evaluate = _as_coroutine(objective, pool)
+
+  logbook = tools.Logbook()
+  logbook.header = ["gen", "nevals", "evals", "evals_per_s"] + (stats.fields if stats else [])
+  start = time.perf_counter()
+  evaluations = 0
+  last_record = 0
+  reason = "max_evaluations"
+  pending = {}
+  children = deque()
+
+  def launch(individual):
+    pending[asyncio.ensure_future(evaluate(individual))] = individual
+
+  async def collect():
+    nonlocal evaluations
+    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    finished = []
+    for task in done:
+      individual = pending.pop(task)
+      individual.fitness.values = task.result()
+      evaluations += 1
+      finished.append(individual)
+    return finished
+
+  def record(gen):
+    nonlocal last_record
+    elapsed = time.perf_counter() - start
+    values = stats.compile(population) if stats else {}
+    logbook.record(gen=gen, nevals=evaluations - last_record, evals=evaluations,
+                   evals_per_s=evaluations / elapsed if elapsed > 0 else 0.0, **values)
+    last_record = evaluations
+    if verbose:
+      print(logbook.stream)
+    if stop is None:
+      return None
+    best = max(ind.fitness.values[0] for ind in population)
+    return stop.check(stopping.Progress(gen, params["offset_roulette"] - best, evaluations, elapsed))
+
+  try:
+    # Población inicial: se necesita completa para seleccionar, así que aquí sí se espera a todas.
+    queue = deque(ind for ind in population if not ind.fitness.valid)
+    while queue or pending:
+      while queue and len(pending) < in_flight:
+        launch(queue.popleft())
+      await collect()
+    if halloffame is not None:
+      halloffame.update(population)
+    stop_reason = record(0)
+
+    gen = 0
+    while not stop_reason and evaluations < max_evaluations:
+      if cancel is not None and cancel.cancelled:
+        stop_reason = "cancelled"
+        break
+
+      while len(pending) < in_flight and evaluations + len(pending) < max_evaluations:
+        if not children:
+          parents = toolbox.select(population, 2)
+          children.extend(ind for ind in ga.var_and(parents, toolbox, cxpb, mutpb) if not ind.fitness.valid)
+          continue
+        launch(children.popleft())
+
+      for child in await collect():
+        _replace_worst(population, child)
+        if halloffame is not None:
+          halloffame.update([child])
+
+      if evaluations - last_record >= len(population) or evaluations >= max_evaluations:
+        gen += 1
+        stop_reason = record(gen)
+    reason = stop_reason or reason
+  finally:
+    for task in pending:
+      task.cancel()
+    if pending:
+      await asyncio.gather(*pending, return_exceptions=True)
+    if owned:
+      pool.shutdown(wait=False, cancel_futures=True)
+
+  logbook.stop_reason = reason
+  if len(logbook):
+    logbook[-1]["stop_reason"] = reason
+  return population, logbook
+
+def run(population, toolbox, cxpb, mutpb, max_evaluations=None, objective=None, in_flight=None, executor=None,
+        stats=None, halloffame=None, cancel=None, stop=None, verbose=False, run=None):
+  """Versión síncrona de evolve_async (crea su propio ciclo de eventos); devuelve (population, logbook)."""
+  return asyncio.run(evolve_async(population, toolbox, cxpb, mutpb, max_evaluations, objective, in_flight, executor,
+                                  stats, halloffame, cancel, stop, verbose, run))
+
+async def _gather_limited(func, items, in_flight):
+  semaphore = asyncio.Semaphore(in_flight)
+
+  async def one(item):
+    async with semaphore:
+      return await func(item)
+  return await asyncio.gather(*(one(item) for item in items))
+
+class ConcurrentMap:
+  """
+  map para toolbox.register("map", ...) que evalúa una función objetivo async con hasta `in_flight`
+  llamadas a la vez. Sirve para correr el modo generacional (modules.evolution) contra la misma
+  función asíncrona: cada generación espera a su evaluación más lenta. Usa un único ciclo de
+  eventos en todas las generaciones, de modo que la función puede conservar sus conexiones.
+  """
+
+  def __init__(self, in_flight=None):
+    self.in_flight = config.STEADY_STATE_IN_FLIGHT if in_flight is None else in_flight
+    self.loop = asyncio.new_event_loop()
+
+  def __call__(self, func, iterable):
+    return self.run(_gather_limited(func, list(iterable), self.in_flight))
+
+  def run(self, coroutine):
+    return self.loop.run_until_complete(coroutine)
+
+  def close(self):
+    self.loop.close()
\ No newline at end of file
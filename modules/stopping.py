@@ -0,0 +1,94 @@
+from collections import namedtuple
+
+# Estado de la corrida que reciben los criterios al final de cada generación.
+Progress = namedtuple("Progress", ["gen", "best_value", "evaluations", "elapsed"])
+
+class TargetValue:
+  """Se detiene cuando el mejor valor de la función (a minimizar) alcanza el objetivo."""
+
+  def __init__(self, target):
+    self.target = target
+
+  def check(self, progress):
+    return "target" if progress.best_value <= self.target else None
+
+class Stagnation:
+  """Se detiene tras `generations` generaciones sin mejorar el mejor valor."""
+
+  def __init__(self, generations, tolerance=0.0):
+    self.generations = generations
+    self.tolerance = tolerance
+    self.best = None
+    self.since_improvement = 0
+
+  def check(self, progress):
+    if self.best is None or progress.best_value < self.best - self.tolerance:
+      self.best = progress.best_value
+      self.since_improvement = 0
+    else:
+      self.since_improvement += 1
+    return "stagnation" if self.since_improvement >= self.generations else None
+
+class MaxEvaluations:
+  def __init__(self, evaluations):
+    self.evaluations = evaluations
+
+  def check(self, progress):
+    return "max_evaluations" if progress.evaluations >= self.evaluations else None
+
+class Deadline:
+  """Límite de tiempo de reloj, en segundos desde el inicio de la corrida."""
+
+  def __init__(self, seconds):
+    self.seconds = seconds
+
+  def check(self, progress):
+    return "deadline" if progress.elapsed >= self.seconds else None
+
+class AnyOf:
+  """OR: se detiene con el primer criterio que se cumpla. Evalúa todos para mantener su estado."""
+
+  def __init__(self, *criteria):
+    self.criteria = criteria
+
+  def check(self, progress):
+    reasons = [c.check(progress) for c in self.criteria]
+    return next((r for r in reasons if r), None)
+
+class AllOf:
+  """AND: se detiene sólo cuando todos los criterios se cumplen a la vez."""
+
+  def __init__(self, *criteria):
+    self.criteria = criteria
+
+  def check(self, progress):
+    reasons = [c.check(progress) for c in self.criteria]
+    return "+".join(reasons) if reasons and all(reasons) else None
+
+def from_config(spec):
+  """
+  Construye los criterios a partir del diccionario "stopping" de config.PROBLEMS:
+  target, stagnation, max_evaluations, max_seconds (None = sin límite) y combine ("any" | "all").
+  Devuelve None si no hay ningún criterio activo.
+  """
+  if not spec:
+    return None
+
+  criteria = []
+  if spec.get("target") is not None:
+    criteria.append(TargetValue(spec["target"]))
+  if spec.get("stagnation") is not None:
+    criteria.append(Stagnation(spec["stagnation"]))
+  if spec.get("max_evaluations") is not None:
+    criteria.append(MaxEvaluations(spec["max_evaluations"]))
+  if spec.get("max_seconds") is not None:
+    criteria.append(Deadline(spec["max_seconds"]))
+
+  if not criteria:
+    return None
+  combine = spec.get("combine", "any")
+  if combine == "any":
+    return AnyOf(*criteria)
+  if combine == "all":
+    return AllOf(*criteria)
+  raise ValueError(f"Combinación de criterios desconocida: {combine}")
\ No newline at end of file
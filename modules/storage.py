@@ -0,0 +1,38 @@
+import contextlib
+import json
+import math
+import os
+import tempfile
+
+def to_json(value, sort_keys=False):
+  """json.dumps que convierte escalares numpy con .item() y cualquier otro objeto con str()."""
+  return json.dumps(value, sort_keys=sort_keys, default=lambda v: v.item() if hasattr(v, "item") else str(v))
+
+def finite(value):
+  """Copia de `value` (dict, list, tuple, escalares) con los float no finitos (NaN, inf) reemplazados por None."""
+  if isinstance(value, dict):
+    return {key: finite(item) for key, item in value.items()}
+  if isinstance(value, (list, tuple)):
+    return [finite(item) for item in value]
+  if isinstance(value, float) and not math.isfinite(value):
+    return None
+  return value
+
+@contextlib.contextmanager
+def atomic_write(path, mode="wb", prefix=".tmp-"):
+  """
+  Abre un archivo temporal junto a `path` y, si el bloque with termina bien, lo renombra sobre
+  `path` con os.replace: los lectores ven el archivo anterior o el nuevo completo, nunca uno a medias.
+  Si el bloque falla, el temporal se borra.
+  """
+  directory = os.path.dirname(os.path.abspath(path))
+  suffix = os.path.splitext(path)[1]
+  fd, tmp_path = tempfile.mkstemp(prefix=prefix, suffix=suffix, dir=directory)
+  try:
+    with os.fdopen(fd, mode, **({} if "b" in mode else {"encoding": "utf-8"})) as fh:
+      yield fh
+    os.replace(tmp_path, path)
+  except BaseException:
+    if os.path.exists(tmp_path):
+      os.remove(tmp_path)
+    raise
\ No newline at end of file
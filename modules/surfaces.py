@@ -0,0 +1,85 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict, namedtuple
+import numpy as np
+import config.config as config
+import modules.functions as functions
+import modules.storage as storage
+
+# Se incrementa si cambia la forma de calcular las superficies: invalida los .npy guardados.
+SURFACE_VERSION = 1
+
+# x, y: ejes 1-D; z: matriz (len(y), len(x)) con z[i, j] = f(x[j], y[i]) (como np.meshgrid).
+Surface = namedtuple("Surface", ["problem_id", "x", "y", "z"])
+
+_CACHE = OrderedDict()
+_LOCK = threading.Lock()
+
+def _resolution(level):
+  return config.SURFACE_RESOLUTIONS[level] if isinstance(level, str) else int(level)
+
+def _axes(problem_id, resolution):
+  params = config.get_problem_config(problem_id)
+  (x_min, x_max), (y_min, y_max) = params.get("plot_range") or [params["var_range"]] * 2
+  return np.linspace(x_min, x_max, resolution), np.linspace(y_min, y_max, resolution)
+
+def _path(problem_id, x, y):
+  spec = {"version": SURFACE_VERSION, "problem": problem_id, "x": [x[0], x[-1], len(x)], "y": [y[0], y[-1], len(y)]}
+  digest = hashlib.blake2b(json.dumps(spec, sort_keys=True).encode("utf-8"), digest_size=8).hexdigest()
+  return os.path.join(config.SURFACE_CACHE_DIR, f"problem{problem_id}_{len(x)}_{digest}.npy")
+
+def compute_surface(problem_id, x, y):
+  """Evalúa la función objetivo en la malla (x, y) con las dos primeras variables del problema."""
+  X, Y = np.meshgrid(x, y)
+  points = np.column_stack([X.ravel(), Y.ravel()])
+  return functions.objective_values(points, problem_id).reshape(X.shape)
+
+def _load_or_compute(problem_id, resolution):
+  x, y = _axes(problem_id, resolution)
+  path = _path(problem_id, x, y)
+  try:
+    z = np.load(path, mmap_mode="r")
+    if z.shape == (len(y), len(x)):
+      return Surface(problem_id, x, y, z)
+  except (OSError, ValueError):
+    pass
+
+  z = compute_surface(problem_id, x, y)
+  try:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with storage.atomic_write(path, "wb", prefix=".surface-") as fh:
+      np.save(fh, z)
+    z = np.load(path, mmap_mode="r")
+  except OSError:
+    # Sin permiso de escritura la superficie sólo vive en memoria.
+    pass
+  return Surface(problem_id, x, y, z)
+
+def get_surface(problem_id=None, level="fine"):
+  """
+  Superficie de la función objetivo para graficar, con `level` "coarse", "fine" (ver
+  config.SURFACE_RESOLUTIONS) o un número de puntos por eje. Cada malla se calcula una sola vez:
+  queda en una caché LRU en memoria y en un .npy mapeado en memoria en config.SURFACE_CACHE_DIR.
+  """
+  problem_id = config.PROBLEM_ID if problem_id is None else problem_id
+  key = (problem_id, _resolution(level))
+  with _LOCK:
+    if key in _CACHE:
+      _CACHE.move_to_end(key)
+      return _CACHE[key]
+
+    surface = _load_or_compute(*key)
+    _CACHE[key] = surface
+    while len(_CACHE) > config.SURFACE_CACHE_SIZE:
+      _CACHE.popitem(last=False)
+    return surface
+
+def point_value(problem_id, point):
+  """Altura de la superficie en un punto (x1, x2), p. ej. para marcar la mejor solución."""
+  return float(functions.objective_values(np.array([point[:2]], dtype=np.float64), problem_id)[0])
+
+def clear_cache():
+  with _LOCK:
+    _CACHE.clear()
\ No newline at end of file
@@ -0,0 +1,184 @@
+import array
+import queue
+import threading
+import numpy as np
+import pyarrow as pa
+import config.config as config
+import modules.functions as functions
+import modules.ga as ga
+
+FIELDS = ("fitness", "genome", "parents")
+
+# Bits de la columna "ops": operadores que produjeron a cada individuo.
+OP_CROSSOVER = ga.OP_CROSSOVER
+OP_MUTATION = ga.OP_MUTATION
+
+def _schema(params, fields):
+  columns = [("gen", pa.int32()), ("index", pa.int32())]
+  if "fitness" in fields:
+    columns.append(("fitness", pa.float64()))
+  if "genome" in fields:
+    n_genes = params["n_vars"] * (1 if functions.is_real_coded(params) else params["bits_per_var"])
+    if functions.is_real_coded(params):
+      columns.append(("genome", pa.list_(pa.float64(), n_genes)))
+    else:
+      columns.append(("genome", pa.binary((n_genes + 7) // 8)))
+  if "parents" in fields:
+    columns += [("parent1", pa.int32()), ("parent2", pa.int32()), ("ops", pa.int8())]
+  return pa.schema(columns, metadata={"problem": params["name"], "encoding": params.get("encoding", "binary")})
+
+class Tracer:
+  """
+  Traza de la corrida para depurar convergencia prematura: en cada generación muestreada guarda,
+  por individuo, su fitness, su genoma (bits empaquetados o float64) y su genealogía (posiciones
+  de sus padres en la generación anterior y operadores aplicados).
+
+  El ciclo evolutivo sólo copia los datos a arreglos; un hilo escritor los agrega como un
+  RecordBatch por generación a un archivo Arrow IPC (formato stream, sólo agregar). La cola tiene
+  a lo sumo `queue_size` generaciones, así que la memoria queda acotada aunque el disco sea lento.
+  El archivo se lee con read_trace (mapeado en memoria), incluso si la corrida se interrumpió.
+  """
+
+  def __init__(self, path, params, every=None, fields=None, queue_size=None):
+    self.path = path
+    self.params = params
+    self.every = config.TRACE_EVERY if every is None else every
+    self.fields = tuple(config.TRACE_FIELDS if fields is None else fields)
+    unknown = set(self.fields) - set(FIELDS)
+    if unknown:
+      raise ValueError(f"Campos de traza desconocidos: {sorted(unknown)}")
+    self.real_coded = functions.is_real_coded(params)
+    self.schema = _schema(params, self.fields)
+    self.queue = queue.Queue(maxsize=config.TRACE_QUEUE_SIZE if queue_size is None else queue_size)
+    self.error = None
+    self.generations = 0
+    self._closed = False
+    self._sink = pa.OSFile(path, "wb")
+    self._writer = pa.ipc.new_stream(self._sink, self.schema)
+    self._thread = threading.Thread(target=self._write_loop, name="trace-writer", daemon=True)
+    self._thread.start()
+
+  def due(self, gen):
+    if self.every <= 0:
+      return False
+    if gen % self.every == 0:
+      return True
+    # Con genealogía también se guarda la generación previa a cada muestra, para que sus padres estén en la traza.
+    return self.wants_lineage and (gen + 1) % self.every == 0
+
+  @property
+  def wants_lineage(self):
+    return "parents" in self.fields
+
+  def _genomes(self, population):
+    # bytes(ind) y array("d", ind) convierten cada individuo en C; mucho más rápido que np.array sobre listas.
+    if self.real_coded:
+      data = b"".join(array.array("d", ind).tobytes() for ind in population)
+      return np.frombuffer(data, dtype=np.float64).reshape(len(population), -1)
+    data = b"".join(map(bytes, population))
+    return np.packbits(np.frombuffer(data, dtype=np.uint8).reshape(len(population), -1), axis=1)
+
+  def record(self, gen, population, parents=None, mates=None, ops=None):
+    """
+    Encola la generación `gen`. `parents` es la posición (en la generación anterior) del individuo
+    seleccionado del que se clonó cada hijo; `mates` y `ops` son los de ga.var_and(lineage=...).
+    """
+    if self.error is not None:
+      raise RuntimeError(f"Falló la escritura de la traza: {self.error}")
+    n = len(population)
+    columns = {"gen": np.full(n, gen, dtype=np.int32), "index": np.arange(n, dtype=np.int32)}
+    if "fitness" in self.fields:
+      columns["fitness"] = np.fromiter((ind.fitness.wvalues[0] if ind.fitness.valid else np.nan for ind in population),
+                                       dtype=np.float64, count=n)
+    if "genome" in self.fields:
+      columns["genome"] = self._genomes(population)
+    if self.wants_lineage:
+      if parents is None:
+        columns["parent1"] = columns["parent2"] = np.full(n, -1, dtype=np.int32)
+        columns["ops"] = np.zeros(n, dtype=np.int8)
+      else:
+        columns["parent1"] = np.asarray(parents, dtype=np.int32)
+        columns["parent2"] = np.where(mates >= 0, columns["parent1"][np.maximum(mates, 0)], -1).astype(np.int32)
+        columns["ops"] = ops
+    self.queue.put(columns)
+    self.generations += 1
+
+  def _batch(self, columns):
+    arrays = []
+    for field in self.schema:
+      values = columns[field.name]
+      if field.name == "genome":
+        if self.real_coded:
+          arrays.append(pa.FixedSizeListArray.from_arrays(pa.array(values.reshape(-1)), values.shape[1]))
+        else:
+          data = pa.py_buffer(np.ascontiguousarray(values))
+          arrays.append(pa.FixedSizeBinaryArray.from_buffers(field.type, len(values), [None, data]))
+      else:
+        arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+  def _write_loop(self):
+    while True:
+      columns = self.queue.get()
+      try:
+        if columns is None:
+          return
+        if self.error is None:
+          self._writer.write_batch(self._batch(columns))
+      except Exception as e:
+        self.error = f"{type(e).__name__}: {e}"
+      finally:
+        self.queue.task_done()
+
+  def close(self):
+    """Espera a que se escriban las generaciones pendientes y cierra el archivo (una sola vez)."""
+    if not self._closed:
+      self._closed = True
+      try:
+        if self._thread.is_alive():
+          self.queue.put(None)
+          self._thread.join()
+      finally:
+        # También si el hilo escritor ya había muerto: el escritor y el archivo no deben quedar abiertos.
+        try:
+          self._writer.close()
+        finally:
+          self._sink.close()
+    if self.error is not None:
+      raise RuntimeError(f"Falló la escritura de la traza: {self.error}")
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc):
+    self.close()
+    return False
+
+def _batches(reader):
+  while True:
+    try:
+      yield reader.read_next_batch()
+    except StopIteration:
+      return
+    except pa.ArrowInvalid:
+      # Archivo truncado (corrida interrumpida): se conservan las generaciones completas.
+      return
+
+def iter_batches(path):
+  """Recorre la traza generación por generación (un RecordBatch cada una) sin copiarla a memoria."""
+  yield from _batches(pa.ipc.open_stream(pa.memory_map(path, "r")))
+
+def read_trace(path):
+  """Tabla con todas las generaciones de la traza, respaldada por el archivo mapeado en memoria."""
+  reader = pa.ipc.open_stream(pa.memory_map(path, "r"))
+  return pa.Table.from_batches(list(_batches(reader)), schema=reader.schema)
+
+def genome_matrix(column, params):
+  """Matriz (individuos x genes) a partir de la columna "genome" (desempaqueta los bits en binario)."""
+  column = column.combine_chunks() if isinstance(column, pa.ChunkedArray) else column
+  if functions.is_real_coded(params):
+    return column.flatten().to_numpy().reshape(len(column), -1)
+  n_bits = params["n_vars"] * params["bits_per_var"]
+  packed = np.frombuffer(column.buffers()[1], dtype=np.uint8)[column.offset * column.type.byte_width:]
+  packed = packed[:len(column) * column.type.byte_width].reshape(len(column), -1)
+  return np.unpackbits(packed, axis=1, count=n_bits)
\ No newline at end of file